@@ -1,10 +1,6 @@
 #!/bin/bash
 set -e
 
-api_spec_dir="api-specs"
-
-# OpenAPI Specification documents may be JSON or YAML
-for spec in $(find $api_spec_dir -type f -name "*.json" -o -name "*.yaml" -o -name "*.yml"); do
-  echo "Validating $spec"
-  npx --yes mintlify openapi-check $spec
-done
+# OpenAPI Specification documents may be JSON or YAML. All of them are validated in one Python process,
+# skipping specs whose content hash matches a cached passing result.
+python3 "$(dirname "$0")/validate_openapi_specs.py" "$@"
@@ -10,6 +10,10 @@
 from pathlib import Path
 from typing import Set, List, Dict, Tuple
 
+# Shared helpers live in the top-level scripts directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'scripts'))
+from file_discovery import EXCLUDED_DIRS, discover_files
+
 def extract_pages_from_json(data: dict, base_path: str = "") -> Set[str]:
     """
     Recursively extract all page references from the docs.json structure.
@@ -62,23 +66,14 @@ def find_all_mdx_files(root_dir: Path) -> Set[str]:
     Find all .mdx files in the directory tree.
     Returns a set of relative paths without the .mdx extension.
     """
-    mdx_files = set()
-    
     # Directories to exclude from scanning
-    exclude_dirs = {'node_modules', '.git', '.github', 'api-specs', 'dictionaries', 
-                   'images', 'scripts', 'site-scripts', 'logo'}
+    exclude_dirs = EXCLUDED_DIRS | {'.github', 'api-specs', 'dictionaries',
+                                    'images', 'scripts', 'site-scripts', 'logo'}
     
-    for mdx_path in root_dir.rglob('*.mdx'):
-        # Skip files in excluded directories
-        if any(excluded in mdx_path.parts for excluded in exclude_dirs):
-            continue
-        
-        # Get relative path from root and remove .mdx extension
-        relative_path = mdx_path.relative_to(root_dir)
-        path_without_extension = str(relative_path.with_suffix(''))
-        mdx_files.add(path_without_extension)
+    discovered = discover_files(str(root_dir), excluded_dirs=exclude_dirs)
     
-    return mdx_files
+    # Remove .mdx extension
+    return {page[:-4] for page in discovered.pages_with_extension('.mdx')}
 
 def validate_docs(docs_json_path: Path) -> Tuple[bool, List[str], List[str]]:
     """
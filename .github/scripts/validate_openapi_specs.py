@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Script to validate every OpenAPI specification in api-specs/ in a single process.
+
+Specs are loaded and validated concurrently. Each spec is checked for the structure the OpenAPI 3.0/3.1 schema
+requires (document root, info, paths, operations, parameters, responses and component names) and for `$ref`
+targets that do not resolve. When openapi-spec-validator is installed, specs are also validated against the
+official JSON schema; --require-schema makes that check mandatory, as CI does.
+
+Results are cached in build/cache/openapi-validation.json by the content hash of each spec and of the files it
+`$ref`s, so unchanged specs are skipped.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote
+
+import yaml
+
+try:
+    from openapi_spec_validator import validate as validate_against_schema
+except ImportError:  # Optional; the built-in structural checks always run
+    validate_against_schema = None
+
+# Bump when the checks change, so cached results from older checks are not reused
+VALIDATOR_VERSION = 2
+
+SPEC_EXTENSIONS = ('.json', '.yaml', '.yml')
+DEFAULT_CACHE_FILE = 'build/cache/openapi-validation.json'
+
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+HTTP_METHODS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
+PARAMETER_LOCATIONS = ('query', 'header', 'path', 'cookie')
+VERSION_PATTERN = re.compile(r'^3\.[01]\.\d+(-.+)?$')
+RESPONSE_CODE_PATTERN = re.compile(r'^([1-5](\d\d|XX)|default)$')
+COMPONENT_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9._-]+$')
+PATH_TEMPLATE_PATTERN = re.compile(r'\{([^}]+)\}')
+EXTERNAL_REF_PATTERN = re.compile(r'''["']?\$ref["']?\s*:\s*["']?([^"'#\s,}]+)''')
+
+
+def load_spec(path: Path) -> object:
+    """Load a JSON or YAML document."""
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.suffix == '.json':
+            return json.load(f)
+        return yaml.load(f, Loader=YAML_LOADER)
+
+
+def escape_pointer(token: object) -> str:
+    return str(token).replace('~', '~0').replace('/', '~1')
+
+
+def resolve_pointer(document: object, pointer: str) -> Tuple[bool, object]:
+    """Resolve a JSON pointer (`/components/schemas/Foo`) inside a document. Returns (found, value)."""
+    current = document
+    if not pointer:
+        return True, current
+    for raw_token in pointer.lstrip('/').split('/'):
+        token = unquote(raw_token).replace('~1', '/').replace('~0', '~')
+        if isinstance(current, dict) and token in current:
+            current = current[token]
+        elif isinstance(current, list) and token.isdigit() and int(token) < len(current):
+            current = current[int(token)]
+        else:
+            return False, None
+    return True, current
+
+
+class SpecValidator:
+    """Collects the structural and `$ref` errors of one spec."""
+
+    def __init__(self, path: Path, spec: object):
+        self.path = path
+        self.spec = spec
+        self.errors: List[str] = []
+        self._external: Dict[Path, object] = {}
+
+    def error(self, location: str, message: str) -> None:
+        self.errors.append(f"{location or '/'}: {message}")
+
+    def deref(self, node: object) -> object:
+        """Follow a `$ref` (one level is enough for parameters and responses). Returns None for references that
+        cannot be followed; check_refs reports the unresolved ones."""
+        if isinstance(node, dict) and isinstance(node.get('$ref'), str):
+            if node['$ref'].startswith(('http://', 'https://')):
+                return None
+            document, pointer = self.ref_document(node['$ref'])
+            found, target = resolve_pointer(document, pointer) if document is not None else (False, None)
+            return target if found else None
+        return node
+
+    def ref_document(self, ref: str) -> Tuple[object, str]:
+        """(document, JSON pointer) a local or sibling-file `$ref` points into; the document is None if it cannot
+        be loaded."""
+        target_file, _, pointer = ref.partition('#')
+        if not target_file:
+            return self.spec, pointer
+        target_path = (self.path.parent / unquote(target_file)).resolve()
+        if target_path not in self._external:
+            try:
+                self._external[target_path] = load_spec(target_path)
+            except (OSError, ValueError, yaml.YAMLError):
+                self._external[target_path] = None
+        return self._external[target_path], pointer
+
+    def validate(self) -> List[str]:
+        spec = self.spec
+        if not isinstance(spec, dict):
+            self.error('', 'document root must be an object')
+            return self.errors
+
+        version = str(spec.get('openapi', ''))
+        if not VERSION_PATTERN.match(version):
+            self.error('/openapi', f"expected an OpenAPI 3.0.x or 3.1.x version, got {version!r}")
+
+        info = spec.get('info')
+        if not isinstance(info, dict):
+            self.error('/info', 'required object is missing')
+        else:
+            for key in ('title', 'version'):
+                if not isinstance(info.get(key), str):
+                    self.error(f'/info/{key}', 'required string is missing')
+
+        is_3_0 = version.startswith('3.0')
+        if is_3_0 and 'paths' not in spec:
+            self.error('/paths', 'required object is missing')
+        if not is_3_0 and not any(key in spec for key in ('paths', 'components', 'webhooks')):
+            self.error('', 'one of paths, components or webhooks is required')
+
+        self.check_paths(spec.get('paths') or {}, require_responses=is_3_0)
+        self.check_components(spec.get('components') or {})
+        self.check_refs(spec, '')
+        return self.errors
+
+    def check_paths(self, paths: object, require_responses: bool) -> None:
+        if not isinstance(paths, dict):
+            self.error('/paths', 'must be an object')
+            return
+
+        operation_ids: Dict[str, str] = {}
+        for path, item in paths.items():
+            location = f'/paths/{escape_pointer(path)}'
+            if not str(path).startswith('/'):
+                self.error(location, 'path must start with "/"')
+            if not isinstance(item, dict):
+                self.error(location, 'path item must be an object')
+                continue
+
+            shared_parameters = self.check_parameters(item.get('parameters', []), f'{location}/parameters')
+            for method in HTTP_METHODS:
+                operation = item.get(method)
+                if operation is None:
+                    continue
+                operation_location = f'{location}/{method}'
+                if not isinstance(operation, dict):
+                    self.error(operation_location, 'operation must be an object')
+                    continue
+
+                operation_id = operation.get('operationId')
+                if operation_id is not None:
+                    if operation_id in operation_ids:
+                        self.error(f'{operation_location}/operationId',
+                                   f"duplicate operationId {operation_id!r} (also at {operation_ids[operation_id]})")
+                    operation_ids[operation_id] = operation_location
+
+                parameters = self.check_parameters(operation.get('parameters', []),
+                                                   f'{operation_location}/parameters')
+                declared = {name for name, location_in in shared_parameters | parameters if location_in == 'path'}
+                for template in PATH_TEMPLATE_PATTERN.findall(str(path)):
+                    if template not in declared:
+                        self.error(operation_location, f"path parameter {{{template}}} is not declared")
+
+                if 'responses' in operation:
+                    self.check_responses(operation['responses'], f'{operation_location}/responses')
+                elif require_responses:
+                    self.error(f'{operation_location}/responses', 'required object is missing')
+
+    def check_parameters(self, parameters: object, location: str) -> set:
+        """Validate a parameter list and return its (name, in) pairs."""
+        if not isinstance(parameters, list):
+            self.error(location, 'parameters must be an array')
+            return set()
+
+        seen = set()
+        for i, parameter in enumerate(parameters):
+            parameter = self.deref(parameter)
+            parameter_location = f'{location}/{i}'
+            if parameter is None:
+                continue
+            if not isinstance(parameter, dict):
+                self.error(parameter_location, 'parameter must be an object')
+                continue
+            name = parameter.get('name')
+            location_in = parameter.get('in')
+            if not isinstance(name, str):
+                self.error(parameter_location, 'parameter name is missing')
+            if location_in not in PARAMETER_LOCATIONS:
+                self.error(parameter_location, f"parameter 'in' must be one of {', '.join(PARAMETER_LOCATIONS)}")
+            if location_in == 'path' and parameter.get('required') is not True:
+                self.error(parameter_location, f"path parameter {name!r} must be required")
+            if 'schema' not in parameter and 'content' not in parameter:
+                self.error(parameter_location, f"parameter {name!r} needs a schema or content")
+            if (name, location_in) in seen:
+                self.error(parameter_location, f"duplicate parameter {name!r} in {location_in}")
+            seen.add((name, location_in))
+        return seen
+
+    def check_responses(self, responses: object, location: str) -> None:
+        if not isinstance(responses, dict) or not responses:
+            self.error(location, 'responses must be a non-empty object')
+            return
+        for code, response in responses.items():
+            response_location = f'{location}/{escape_pointer(code)}'
+            if not RESPONSE_CODE_PATTERN.match(str(code)):
+                self.error(response_location, f"invalid response code {code!r}")
+            response = self.deref(response)
+            if response is None:
+                continue
+            if not isinstance(response, dict) or not isinstance(response.get('description'), str):
+                self.error(response_location, 'response description is missing')
+
+    def check_components(self, components: object) -> None:
+        if not isinstance(components, dict):
+            self.error('/components', 'must be an object')
+            return
+        for section, entries in components.items():
+            if not isinstance(entries, dict):
+                self.error(f'/components/{section}', 'must be an object')
+                continue
+            for name in entries:
+                if not COMPONENT_NAME_PATTERN.match(str(name)):
+                    self.error(f'/components/{section}/{escape_pointer(name)}', 'invalid component name')
+
+    def check_refs(self, node: object, location: str) -> None:
+        """Check that every `$ref` in the document resolves, locally or in a sibling file."""
+        stack = [(node, location)]
+        while stack:
+            current, current_location = stack.pop()
+            if isinstance(current, dict):
+                ref = current.get('$ref')
+                if isinstance(ref, str):
+                    self.check_ref(ref, f'{current_location}/$ref')
+                stack.extend((value, f'{current_location}/{escape_pointer(key)}')
+                             for key, value in current.items() if key != '$ref')
+            elif isinstance(current, list):
+                stack.extend((value, f'{current_location}/{i}') for i, value in enumerate(current))
+
+    def check_ref(self, ref: str, location: str) -> None:
+        if ref.startswith(('http://', 'https://')):
+            return
+        document, pointer = self.ref_document(ref)
+        if document is None:
+            self.error(location, f"cannot load referenced file {ref.partition('#')[0]!r}")
+            return
+        found, _ = resolve_pointer(document, pointer)
+        if not found:
+            self.error(location, f"unresolved reference {ref!r}")
+
+
+def string_keys(node: object) -> object:
+    """The document with every mapping key as a string: YAML reads unquoted response codes (200:) as integers."""
+    if isinstance(node, dict):
+        return {str(key): string_keys(value) for key, value in node.items()}
+    if isinstance(node, list):
+        return [string_keys(value) for value in node]
+    return node
+
+
+def validate_spec_file(path: str) -> List[str]:
+    """Load and validate one spec file. Returns its errors."""
+    spec_path = Path(path)
+    try:
+        spec = load_spec(spec_path)
+    except (ValueError, yaml.YAMLError) as e:
+        return [f"/: cannot parse document: {e}"]
+
+    errors = SpecValidator(spec_path, spec).validate()
+    if validate_against_schema is not None and not errors:
+        try:
+            validate_against_schema(string_keys(spec), base_uri=spec_path.resolve().as_uri())
+        except Exception as e:
+            errors.append(f"/: {str(e).splitlines()[0]}")
+    return errors
+
+
+def find_spec_files(spec_dir: Path) -> List[Path]:
+    return sorted(path for path in spec_dir.rglob('*') if path.is_file() and path.suffix in SPEC_EXTENSIONS)
+
+
+def spec_hash(path: Path) -> str:
+    """Hash of a spec and of every file it `$ref`s, transitively, so a change to a referenced file is noticed."""
+    digest = hashlib.sha256(f"{VALIDATOR_VERSION}:{validate_against_schema is not None}:".encode())
+    pending = [path.resolve()]
+    seen = set(pending)
+    while pending:
+        current = pending.pop(0)
+        try:
+            content = current.read_bytes()
+        except OSError:
+            digest.update(f"\0missing:{current}".encode())
+            continue
+        digest.update(f"\0{current.name}:".encode() + content)
+        for target in EXTERNAL_REF_PATTERN.findall(content.decode('utf-8', errors='replace')):
+            if target.startswith(('http://', 'https://')):
+                continue
+            target_path = (current.parent / unquote(target)).resolve()
+            if target_path not in seen:
+                seen.add(target_path)
+                pending.append(target_path)
+    return digest.hexdigest()
+
+
+def load_cache(cache_path: Path) -> Dict[str, dict]:
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache_path: Path, cache: Dict[str, dict]) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
+def main():
+    root_dir = Path(__file__).resolve().parent.parent.parent
+
+    parser = argparse.ArgumentParser(description='Validate the OpenAPI specifications in api-specs/')
+    parser.add_argument('specs', nargs='*', help='Spec files to validate (default: every spec in api-specs/)')
+    parser.add_argument('--cache-file', default=str(root_dir / DEFAULT_CACHE_FILE),
+                        help=f'Validation cache (default: {DEFAULT_CACHE_FILE})')
+    parser.add_argument('--no-cache', action='store_true', help='Validate every spec, ignoring cached results')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--require-schema', action='store_true',
+                        help='Fail if openapi-spec-validator is not installed, instead of skipping the schema check')
+    args = parser.parse_args()
+
+    if args.require_schema and validate_against_schema is None:
+        print("❌ openapi-spec-validator is not installed: python3 -m pip install -r .github/scripts/requirements.txt")
+        sys.exit(1)
+
+    spec_files = [Path(spec) for spec in args.specs] or find_spec_files(root_dir / 'api-specs')
+    if not spec_files:
+        print("No OpenAPI specifications found")
+        sys.exit(0)
+
+    start = time.perf_counter()
+    cache_path = Path(args.cache_file)
+    cache = load_cache(cache_path)
+
+    results: Dict[str, List[str]] = {}
+    hashes: Dict[str, str] = {}
+    pending: List[str] = []
+    for spec_file in spec_files:
+        key = str(spec_file.resolve().relative_to(root_dir)) if spec_file.resolve().is_relative_to(root_dir) \
+            else str(spec_file.resolve())
+        hashes[key] = spec_hash(spec_file)
+        cached: Optional[dict] = cache.get(key)
+        if cached and not args.no_cache and cached.get('hash') == hashes[key]:
+            results[key] = cached['errors']
+        else:
+            pending.append(key)
+
+    if pending:
+        paths = [str(root_dir / key) for key in pending]
+        if args.jobs <= 1 or len(pending) == 1:
+            validated = [validate_spec_file(path) for path in paths]
+        else:
+            with ProcessPoolExecutor(max_workers=min(args.jobs, len(pending))) as executor:
+                validated = list(executor.map(validate_spec_file, paths))
+        for key, errors in zip(pending, validated):
+            results[key] = errors
+            cache[key] = {'hash': hashes[key], 'errors': errors}
+        save_cache(cache_path, cache)
+
+    failed = 0
+    for key in sorted(results):
+        errors = results[key]
+        status = 'cached' if key not in pending else 'validated'
+        if errors:
+            failed += 1
+            print(f"❌ {key} ({status}): {len(errors)} error(s)")
+            for error in errors:
+                print(f"   {error}")
+        else:
+            print(f"✅ {key} ({status})")
+
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"\n📊 {len(results)} spec(s), {len(pending)} validated, {len(results) - len(pending)} cached, "
+          f"{elapsed:.0f} ms")
+    if validate_against_schema is None:
+        print("ℹ️  openapi-spec-validator is not installed; ran the built-in structural checks only")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Add intrinsic width/height and lazy loading to page images, so the browser reserves their space before they load.
+
+This script:
+1. Finds every `<img>` tag outside code blocks (and with --markdown, every markdown image `![alt](path)`)
+2. Reads the dimensions of local PNG, JPEG, GIF and WebP images from their file headers (see image_dimensions.py),
+   cached in build/cache/image-dimensions.json
+3. Adds `width`, `height` and `loading="lazy"` to `<img>` tags that lack them. A tag that already sets only one
+   dimension gets the other scaled to the image's aspect ratio.
+4. With --markdown, rewrites markdown images with known dimensions as `<img>` tags carrying the same src, alt and
+   title. Markdown syntax cannot carry a size, but the docs platform renders markdown images and `<img>` tags
+   differently (e.g. click-to-zoom and the default styling), so this is opt-in and the result should be reviewed.
+5. Writes each changed page once
+
+Images whose format or location is unknown (external URLs, SVG) keep their size attributes untouched.
+
+Usage:
+    python scripts/add-image-sizes.py [<page> ...] [--markdown] [--dry-run] [--check]
+
+Example:
+    python scripts/add-image-sizes.py container-engine/tutorials/quickstart.mdx --dry-run
+
+Arguments:
+    page: Pages to process, relative to the repository root (default: every page)
+"""
+
+import argparse
+import html
+import re
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from asset_index import resolve_asset_reference
+from file_discovery import discover_files
+from image_dimensions import DEFAULT_CACHE_FILE, DimensionCache, load_dimension_cache, save_dimension_cache
+from page_content import mask_code_blocks
+
+IMG_TAG_PATTERN = re.compile(r'<img\b((?:[^>"\'{]|"[^"]*"|\'[^\']*\'|\{[^}]*\})*?)(\s*/?>)')
+MARKDOWN_IMAGE_PATTERN = re.compile(r'!\[([^\]]*)\]\(\s*<?([^)\s>]+)>?(?:\s+"([^"]*)")?\s*\)')
+ATTRIBUTE_PATTERN = r'\b{}=(?:"([^"]*)"|\'([^\']*)\'|\{{\s*([^}}]*?)\s*\}})'
+
+
+def attribute_value(attributes: str, name: str) -> Optional[str]:
+    """Return the value of an attribute in a tag's attribute text, or None if it is not set."""
+    match = re.search(ATTRIBUTE_PATTERN.format(name), attributes)
+    if match is None:
+        return None
+    return next(value for value in match.groups() if value is not None)
+
+
+def scaled_size(size: Tuple[int, int], width: Optional[str], height: Optional[str]) -> Optional[Tuple[str, str]]:
+    """Return the (width, height) to set, keeping any dimension the tag already has. None if there is nothing to add."""
+    if width is not None and height is not None:
+        return None
+    natural_width, natural_height = size
+    if width is None and height is None:
+        return str(natural_width), str(natural_height)
+    given = width if width is not None else height
+    if not given.isdigit() or not natural_width or not natural_height:
+        return None
+    if width is not None:
+        return width, str(round(int(width) * natural_height / natural_width))
+    return str(round(int(height) * natural_width / natural_height)), height
+
+
+def image_size(root: Path, page: str, url: str, cache: DimensionCache) -> Optional[Tuple[int, int]]:
+    asset = resolve_asset_reference(page, url)
+    if asset is None or not (root / asset).is_file():
+        return None
+    return cache.size_of(root / asset)
+
+
+def size_img_tag(root: Path, page: str, match: re.Match, cache: DimensionCache) -> Optional[str]:
+    """Return the tag with the missing attributes added, or None if it needs no change."""
+    attributes, closing = match.group(1), match.group(2)
+    additions = []
+
+    src = attribute_value(attributes, 'src')
+    size = image_size(root, page, src, cache) if src else None
+    if size:
+        width, height = attribute_value(attributes, 'width'), attribute_value(attributes, 'height')
+        scaled = scaled_size(size, width, height)
+        if scaled:
+            if width is None:
+                additions.append(f'width="{scaled[0]}"')
+            if height is None:
+                additions.append(f'height="{scaled[1]}"')
+    if attribute_value(attributes, 'loading') is None:
+        additions.append('loading="lazy"')
+
+    if not additions:
+        return None
+    return f"<img{attributes.rstrip()} {' '.join(additions)}{' ' if '/' in closing else ''}{closing.strip()}"
+
+
+def size_markdown_image(root: Path, page: str, match: re.Match, cache: DimensionCache) -> Optional[str]:
+    """Return an `<img>` tag for a markdown image of known size, or None to leave it as it is."""
+    alt, url, title = match.groups()
+    size = image_size(root, page, url, cache)
+    if size is None:
+        return None
+    attributes = [f'src="{url}"', f'alt="{html.escape(alt)}"']
+    if title:
+        attributes.append(f'title="{html.escape(title)}"')
+    attributes += [f'width="{size[0]}"', f'height="{size[1]}"', 'loading="lazy"']
+    return f"<img {' '.join(attributes)} />"
+
+
+def add_image_sizes(root: Path, page: str, content: str, cache: DimensionCache,
+                    markdown: bool = False) -> Tuple[str, int]:
+    """Return the page content with image sizes added, and the number of images changed. Markdown images are only
+    rewritten as `<img>` tags when markdown is set."""
+    masked = mask_code_blocks(content)
+    replacements: List[Tuple[int, int, str]] = []
+    rewrites = [(IMG_TAG_PATTERN, size_img_tag)]
+    if markdown:
+        rewrites.append((MARKDOWN_IMAGE_PATTERN, size_markdown_image))
+    for pattern, rewrite in rewrites:
+        for match in pattern.finditer(masked):
+            # Match again on the real content so attribute values are not masked
+            original = pattern.fullmatch(content, match.start(), match.end())
+            if original is None:
+                continue
+            replacement = rewrite(root, page, original, cache)
+            if replacement is not None:
+                replacements.append((match.start(), match.end(), replacement))
+
+    parts = []
+    position = 0
+    for start, end, replacement in sorted(replacements):
+        parts.append(content[position:start])
+        parts.append(replacement)
+        position = end
+    parts.append(content[position:])
+    return ''.join(parts), len(replacements)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Add width, height and lazy loading to page images')
+    parser.add_argument('pages', nargs='*', help='Pages to process (default: every page)')
+    parser.add_argument('--root-dir', default=str(Path(__file__).parent.parent),
+                        help='Repository root (default: parent of the scripts directory)')
+    parser.add_argument('--markdown', action='store_true',
+                        help='Also rewrite markdown images as sized <img> tags (the docs platform renders these '
+                             'differently)')
+    parser.add_argument('--dry-run', action='store_true', help='Show what would change without writing files')
+    parser.add_argument('--check', action='store_true', help='Exit with an error if any page needs changes')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore cached image dimensions')
+
+    args = parser.parse_args()
+
+    root = Path(args.root_dir)
+    pages = [page.removeprefix('./') for page in args.pages] or discover_files(str(root)).pages
+    cache_path = root / DEFAULT_CACHE_FILE
+    cache = DimensionCache() if args.no_cache else load_dimension_cache(cache_path)
+
+    changed_pages = 0
+    changed_images = 0
+    for page in pages:
+        path = root / page
+        if not path.is_file():
+            print(f"⚠️  Page not found: {page}")
+            continue
+        content = path.read_text(encoding='utf-8')
+        updated, count = add_image_sizes(root, page, content, cache, args.markdown)
+        if not count:
+            continue
+        changed_pages += 1
+        changed_images += count
+        print(f"📝 {page}: {count} image(s)")
+        if not args.dry_run and not args.check:
+            path.write_text(updated, encoding='utf-8')
+
+    save_dimension_cache(cache, cache_path)
+
+    print("-" * 60)
+    print(f"📊 {changed_images} image(s) in {changed_pages} page(s) "
+          f"({cache.misses} image(s) read, {cache.hits} from cache)")
+    if args.check and changed_images:
+        print("❌ Some images are missing width, height or loading attributes")
+        sys.exit(1)
+    if args.dry_run:
+        print("🔍 Dry run - no files were changed")
+
+
+if __name__ == '__main__':
+    main()
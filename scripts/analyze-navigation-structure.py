@@ -5,10 +5,10 @@
 """
 
 import json
-import os
-from pathlib import Path
 from typing import Set, List, Dict, Any
 
+from file_discovery import EXCLUDED_DIRS, discover_files
+
 
 def extract_page_paths(docs_data: Any) -> Set[str]:
     """Recursively extract all page paths from navigation structure."""
@@ -35,24 +35,12 @@ def traverse(data):
 
 def find_actual_files() -> Set[str]:
     """Find all actual .mdx files in the workspace."""
-    mdx_files = set()
-    
-    # Walk through all directories
-    for root, dirs, files in os.walk('.'):
-        # Skip certain directories
-        skip_dirs = {'.git', 'node_modules', '__pycache__', 'scripts', 'site-scripts', 'api-specs', 'dictionaries', 'logo', 'shared'}
-        dirs[:] = [d for d in dirs if d not in skip_dirs]
-        
-        for file in files:
-            if file.endswith('.mdx'):
-                # Convert to relative path without .mdx extension
-                file_path = os.path.join(root, file)
-                relative_path = os.path.relpath(file_path, '.').replace('\\', '/')
-                # Remove .mdx extension
-                path_without_ext = relative_path[:-4]
-                mdx_files.add(path_without_ext)
-    
-    return mdx_files
+    # Skip certain directories
+    skip_dirs = EXCLUDED_DIRS | {'scripts', 'site-scripts', 'api-specs', 'dictionaries', 'logo', 'shared'}
+    discovered = discover_files('.', excluded_dirs=skip_dirs)
+
+    # Remove .mdx extension
+    return {page[:-4] for page in discovered.pages_with_extension('.mdx')}
 
 
 def main():
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Reverse index from assets to the pages that reference them.
+
+Only real media spans count as references: markdown images `![alt](path)` and the `src` of `<img>`, `<video>`,
+`<source>` and `<Image>` tags, outside code blocks. References are resolved to repository paths, so a page that
+uses `/container-engine/images/a.png` and one that uses `../images/a.png` both index under the same asset.
+"""
+
+import posixpath
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote
+
+from file_discovery import ASSET_EXTENSIONS, discover_files
+from page_content import is_external_link, mask_code_blocks
+
+MARKDOWN_IMAGE_PATTERN = re.compile(r'!\[[^\]]*\]\(\s*<?([^)\s>]+)')
+MEDIA_SRC_PATTERN = re.compile(r'<(?:img|video|source|Image)\b[^>]*?\bsrc=(["\'])([^"\']+)\1')
+
+
+@dataclass
+class ImageSpan:
+    """One media reference: the character range of its URL in the page content and the asset it resolves to."""
+    start: int
+    end: int
+    url: str
+    asset: str
+
+
+def split_suffix(url: str) -> Tuple[str, str]:
+    """Split a URL into its path and any `?query` or `#fragment` suffix."""
+    match = re.search(r'[?#]', url)
+    if match is None:
+        return url, ''
+    return url[:match.start()], url[match.start():]
+
+
+def resolve_asset_reference(page: str, url: str) -> Optional[str]:
+    """Resolve a media URL on a page to a repository-relative asset path, or None if it is not a local asset."""
+    if is_external_link(url):
+        return None
+    path, _ = split_suffix(url)
+    path = unquote(path)
+    if not path.lower().endswith(ASSET_EXTENSIONS):
+        return None
+    if path.startswith('/'):
+        return posixpath.normpath(path.lstrip('/'))
+    return posixpath.normpath(posixpath.join(posixpath.dirname(page), path))
+
+
+def find_image_spans(page: str, content: str) -> List[ImageSpan]:
+    """Return the media references of a page, ordered by position."""
+    masked = mask_code_blocks(content)
+    spans = []
+    for pattern, group in ((MARKDOWN_IMAGE_PATTERN, 1), (MEDIA_SRC_PATTERN, 2)):
+        for match in pattern.finditer(masked):
+            start, end = match.span(group)
+            url = content[start:end]
+            asset = resolve_asset_reference(page, url)
+            if asset is not None:
+                spans.append(ImageSpan(start, end, url, asset))
+    return sorted(spans, key=lambda span: span.start)
+
+
+def format_asset_reference(asset: str, page: str, original_url: str) -> str:
+    """Write a reference to asset from page in the same style (absolute or relative) as original_url."""
+    _, suffix = split_suffix(original_url)
+    if original_url.startswith('/'):
+        return '/' + asset + suffix
+    return posixpath.relpath(asset, posixpath.dirname(page) or '.') + suffix
+
+
+def rewrite_image_references(content: str, page: str, moves: Dict[str, str],
+                             new_page: Optional[str] = None) -> Tuple[str, List[Tuple[str, str]]]:
+    """
+    Rewrite the media references of a page for moved assets.
+
+    moves maps old asset paths to new ones. When the page itself moves to new_page, relative references are
+    recomputed from its new location even if their asset stays put. Only the URL of each media span is replaced.
+    Returns (new_content, [(old_url, new_url), ...]).
+    """
+    new_page = new_page or page
+    changes = []
+    parts = []
+    position = 0
+    for span in find_image_spans(page, content):
+        target = moves.get(span.asset, span.asset)
+        if target == span.asset and new_page == page:
+            continue
+        new_url = format_asset_reference(target, new_page, span.url)
+        if new_url == span.url:
+            continue
+        parts.append(content[position:span.start])
+        parts.append(new_url)
+        position = span.end
+        changes.append((span.url, new_url))
+    parts.append(content[position:])
+    return ''.join(parts), changes
+
+
+@dataclass
+class AssetIndex:
+    """asset → page → media spans, built from one read of every page."""
+    references: Dict[str, Dict[str, List[ImageSpan]]] = field(default_factory=dict)
+    contents: Dict[str, str] = field(default_factory=dict)
+
+    def add_page(self, page: str, content: str) -> None:
+        self.contents[page] = content
+        for span in find_image_spans(page, content):
+            self.references.setdefault(span.asset, {}).setdefault(page, []).append(span)
+
+    def pages_referencing(self, asset: str) -> List[str]:
+        return sorted(self.references.get(asset, {}))
+
+    def reference_count(self, asset: str) -> int:
+        return sum(len(spans) for spans in self.references.get(asset, {}).values())
+
+
+def build_asset_index(root_dir: str, pages: Optional[List[str]] = None) -> AssetIndex:
+    """Read every page once and index its media references."""
+    root = Path(root_dir)
+    if pages is None:
+        pages = discover_files(root_dir).pages
+    index = AssetIndex()
+    for page in pages:
+        index.add_page(page, (root / page).read_text(encoding='utf-8'))
+    return index
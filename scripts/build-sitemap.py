@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Build sitemap.xml for every page in the docs.json navigation, with lastmod dates from git.
+
+This script:
+1. Lists every page in the docs.json navigation, in sidebar order (pages with `noindex: true` are left out)
+2. Takes each page's lastmod from the date of the last commit that touched it, read from a single
+   `git log --name-only` stream that stops as soon as every page has been seen. Pages with uncommitted changes
+   use the file's modification time.
+3. Writes sitemap.xml, or numbered sitemaps and a sitemap index when there are more than 50,000 URLs.
+   Files are only rewritten when their content changes.
+4. Updates incrementally: the dates are kept in build/cache/sitemap.json with the commit they were read at, so
+   the next build only looks up pages that changed since that commit (or are new to the navigation)
+
+Usage:
+    python scripts/build-sitemap.py [--base-url URL] [--output-dir build/sitemap] [--full]
+
+Example:
+    python scripts/build-sitemap.py --base-url https://docs.salad.com
+"""
+
+import argparse
+import json
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+from xml.sax.saxutils import escape
+
+from page_content import page_url, parse_frontmatter
+from script_loader import load_script
+
+navigation_tree = load_script('navigation-tree.py')
+
+# Bump when the cache layout changes, so the next build starts over
+SITEMAP_VERSION = 1
+DEFAULT_CACHE_FILE = 'build/cache/sitemap.json'
+DEFAULT_BASE_URL = 'https://docs.salad.com'
+MAX_URLS_PER_SITEMAP = 50000
+SITEMAP_NAMESPACE = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+
+
+def run_git(args: List[str], root: Path) -> Optional[str]:
+    result = subprocess.run(['git'] + args, cwd=root, capture_output=True, text=True)
+    return result.stdout if result.returncode == 0 else None
+
+
+def last_commit_dates(root: Path, files: Set[str]) -> Dict[str, str]:
+    """
+    Date (YYYY-MM-DD) of the newest commit touching each file, from one `git log --name-only` stream.
+    The stream is read newest first and stopped once every file has been seen.
+    """
+    if not files:
+        return {}
+    # Long path lists would overflow the command line; filtering a full history stream costs little more
+    paths = sorted(files) if len(files) <= 1000 else ['*.mdx']
+    command = ['git', 'log', '--format=%x00%cs', '--name-only', '--no-renames', '--', *paths]
+
+    dates: Dict[str, str] = {}
+    process = subprocess.Popen(command, cwd=root, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    date = None
+    try:
+        for line in process.stdout:
+            line = line.rstrip('\n')
+            if line.startswith('\0'):
+                date = line[1:]
+            elif line and date and line in files and line not in dates:
+                dates[line] = date
+                if len(dates) == len(files):
+                    break
+    finally:
+        process.kill()
+        process.wait()
+    return dates
+
+
+def uncommitted_files(root: Path) -> Set[str]:
+    """Pages with changes that are not committed yet (staged, unstaged or untracked)."""
+    output = run_git(['status', '--porcelain', '-z', '--untracked-files=all', '--', '*.mdx'], root) or ''
+    entries = output.split('\0')
+    files = set()
+    i = 0
+    while i < len(entries):
+        entry = entries[i]
+        if len(entry) > 3:
+            files.add(entry[3:])
+            if entry[0] in 'RC':
+                i += 1  # The original path of a rename follows
+        i += 1
+    return files
+
+
+def modification_date(path: Path) -> str:
+    return datetime.fromtimestamp(path.stat().st_mtime, timezone.utc).strftime('%Y-%m-%d')
+
+
+def is_noindex(path: Path) -> bool:
+    content = path.read_text(encoding='utf-8')
+    if 'noindex' not in content:
+        return False
+    frontmatter, _, _ = parse_frontmatter(content)
+    return frontmatter.get('noindex') in (True, 'true')
+
+
+def urlset(entries: Iterable[tuple]) -> str:
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', f'<urlset xmlns="{SITEMAP_NAMESPACE}">']
+    for location, lastmod in entries:
+        lastmod_tag = f"<lastmod>{lastmod}</lastmod>" if lastmod else ''
+        lines.append(f"  <url><loc>{escape(location)}</loc>{lastmod_tag}</url>")
+    lines.append('</urlset>')
+    return '\n'.join(lines) + '\n'
+
+
+def sitemap_index(sitemaps: List[tuple]) -> str:
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>', f'<sitemapindex xmlns="{SITEMAP_NAMESPACE}">']
+    for location, lastmod in sitemaps:
+        lines.append(f"  <sitemap><loc>{escape(location)}</loc><lastmod>{lastmod}</lastmod></sitemap>")
+    lines.append('</sitemapindex>')
+    return '\n'.join(lines) + '\n'
+
+
+def sitemap_files(base_url: str, entries: List[tuple]) -> Dict[str, str]:
+    """File name → content: one sitemap.xml, or sitemap-N.xml files and a sitemap.xml index."""
+    if len(entries) <= MAX_URLS_PER_SITEMAP:
+        return {'sitemap.xml': urlset(entries)}
+    files = {}
+    sitemaps = []
+    for number, start in enumerate(range(0, len(entries), MAX_URLS_PER_SITEMAP), 1):
+        chunk = entries[start:start + MAX_URLS_PER_SITEMAP]
+        name = f"sitemap-{number}.xml"
+        files[name] = urlset(chunk)
+        sitemaps.append((f"{base_url}/{name}", max((lastmod for _, lastmod in chunk if lastmod), default='')))
+    files['sitemap.xml'] = sitemap_index(sitemaps)
+    return files
+
+
+def load_cache(cache_path: Path) -> dict:
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if data.get('version') == SITEMAP_VERSION else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build sitemap.xml from the docs.json navigation and git history')
+    parser.add_argument('--root-dir', default=str(Path(__file__).parent.parent),
+                        help='Repository root (default: parent of the scripts directory)')
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL, help=f'Site URL (default: {DEFAULT_BASE_URL})')
+    parser.add_argument('--output-dir', default='build/sitemap', help='Where to write the sitemap files')
+    parser.add_argument('--full', action='store_true', help='Ignore the cache and look up every page again')
+
+    args = parser.parse_args()
+
+    root = Path(args.root_dir)
+    base_url = args.base_url.rstrip('/')
+    with open(root / 'docs.json', 'r', encoding='utf-8') as f:
+        navigation = json.load(f).get('navigation', {})
+
+    pages = list(dict.fromkeys(f"{page.lstrip('/')}.mdx" for page in navigation_tree.collect_nav_pages(navigation)))
+    missing = [page for page in pages if not (root / page).is_file()]
+    for page in missing:
+        print(f"⚠️  {page} is in the navigation but does not exist; it is left out")
+    pages = [page for page in pages if page not in missing]
+
+    cache_path = root / DEFAULT_CACHE_FILE
+    cache = {} if args.full else load_cache(cache_path)
+    cached: Dict[str, dict] = cache.get('pages', {})
+    head = (run_git(['rev-parse', 'HEAD'], root) or '').strip()
+    previous_head = cache.get('head')
+
+    # Pages whose last commit may have changed since the cache was written
+    if previous_head and previous_head != head and \
+            run_git(['merge-base', '--is-ancestor', previous_head, head], root) is not None:
+        changed = set((run_git(['diff', '--name-only', '--no-renames', previous_head, head, '--', '*.mdx'], root)
+                       or '').split())
+    elif previous_head == head:
+        changed = set()
+    else:
+        cached = {}  # No usable cache, or history was rewritten
+        changed = set()
+    dirty = uncommitted_files(root)
+    lookup = {page for page in pages if page not in cached or page in changed} - dirty
+
+    dates = last_commit_dates(root, lookup)
+    entries: Dict[str, dict] = {}
+    for page in pages:
+        if page in dirty:
+            entries[page] = {'lastmod': modification_date(root / page), 'noindex': is_noindex(root / page)}
+        elif page in lookup:
+            entries[page] = {'lastmod': dates.get(page), 'noindex': is_noindex(root / page)}
+        else:
+            entries[page] = cached[page]
+
+    urls = [(base_url + page_url(page), entry['lastmod'] or '')
+            for page, entry in entries.items() if not entry['noindex']]
+    files = sitemap_files(base_url, urls)
+
+    output_dir = root / args.output_dir
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for name, content in files.items():
+        target = output_dir / name
+        if target.exists() and target.read_text(encoding='utf-8') == content:
+            print(f"⏭️  {name} unchanged")
+            continue
+        target.write_text(content, encoding='utf-8')
+        print(f"✅ Wrote {target.relative_to(root) if target.is_relative_to(root) else target}")
+    for stale in output_dir.glob('sitemap-*.xml'):
+        if stale.name not in files:
+            stale.unlink()
+            print(f"🗑️  Removed {stale.name}")
+
+    # Uncommitted pages are looked up again next time, once they are committed
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': SITEMAP_VERSION, 'head': head,
+                   'pages': {page: entry for page, entry in entries.items() if page not in dirty}},
+                  f, indent=2, sort_keys=True)
+
+    excluded = len(entries) - len(urls)
+    print(f"📊 {len(urls)} URL(s) in {len(files)} file(s); {len(lookup)} page(s) looked up in git, "
+          f"{len(dirty & set(pages))} uncommitted" + (f", {excluded} noindex" if excluded else ''))
+
+
+if __name__ == '__main__':
+    main()
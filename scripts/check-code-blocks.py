@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Syntax check for the fenced code blocks in the documentation pages.
+
+This script:
+1. Reads every page and extracts its fenced code blocks with the file and line they start on
+2. Validates each block by its language: Python with `ast.parse`, JSON with `json.loads`, YAML with a YAML parser,
+   TOML with `tomllib`, and bash/shell with `bash -n`. Blocks in other languages, or with no language, are skipped.
+3. Checks blocks across worker processes. Results are cached in build/cache/code-blocks.json by the hash of the
+   block, so after the first run only new or edited blocks are checked again.
+4. Reports every block that does not parse by file and line, and exits non-zero if any are found
+
+Illustrative excerpts are not expected to parse on their own:
+- A block with a line that is only an ellipsis (`...` or `…`, optionally after `#` or `//`) marks omitted code,
+  and is skipped
+- A JSON block holding object members without the enclosing braces (`"segments": [...]`) is checked as the body
+  of an object
+- Any other block can be skipped with an MDX comment on the line before its fence, in the style of the cSpell
+  directives:
+
+      {/* check-code-blocks: skip */}
+      ```python
+
+Usage:
+    python scripts/check-code-blocks.py [<page> ...] [--language LANG ...] [--jobs N] [--no-cache]
+
+Example:
+    python scripts/check-code-blocks.py --language python --language json
+
+Arguments:
+    page: Pages to check, relative to the repository root (default: every page)
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+import tomllib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import yaml
+
+from file_discovery import discover_files
+from page_content import iter_code_blocks, parse_frontmatter
+
+# Bump when a validator changes, so cached results are discarded
+CODE_BLOCKS_VERSION = 2
+DEFAULT_CACHE_FILE = 'build/cache/code-blocks.json'
+
+# `<hostname>`-style placeholders in shell commands, which would otherwise parse as redirections
+SHELL_PLACEHOLDER_PATTERN = re.compile(r'(?<![<\w])<([A-Za-z][\w-]*)>(?!>)')
+# A line standing for omitted code, which makes the block an excerpt
+ELLIPSIS_LINE_PATTERN = re.compile(r'^\s*(?:#|//)?\s*(?:\.\.\.|…)\s*$', re.MULTILINE)
+# Opt-out directive on the line before a fence
+SKIP_DIRECTIVE_PATTERN = re.compile(r'^\s*\{/\*\s*check-code-blocks:\s*skip\s*\*/\}\s*$')
+
+# Fence language (lowercased) → validator
+LANGUAGES = {
+    'python': 'python', 'py': 'python', 'python3': 'python',
+    'json': 'json',
+    'yaml': 'yaml', 'yml': 'yaml',
+    'toml': 'toml',
+    'bash': 'bash', 'sh': 'bash', 'shell': 'bash', 'zsh': 'bash',
+}
+
+
+@dataclass
+class Block:
+    """A code block to check, with where it came from."""
+    page: str
+    line: int
+    validator: str
+    code: str
+
+    @property
+    def key(self) -> str:
+        return hashlib.sha256(f"{self.validator}\0{self.code}".encode('utf-8')).hexdigest()
+
+
+def validate_python(code: str) -> Optional[str]:
+    try:
+        # Snippets often await at the top level, as in a notebook
+        compile(code, '<block>', 'exec', flags=ast.PyCF_ONLY_AST | ast.PyCF_ALLOW_TOP_LEVEL_AWAIT)
+    except SyntaxError as e:
+        return f"line {e.lineno}: {e.msg}"
+    return None
+
+
+def validate_json(code: str) -> Optional[str]:
+    try:
+        json.loads(code)
+    except ValueError as e:
+        try:
+            # An excerpt of object members, such as `"input": {...}`
+            json.loads('{' + code + '}')
+        except ValueError:
+            return f"line {e.lineno}: {e.msg}"
+    return None
+
+
+class TagTolerantLoader(getattr(yaml, 'CSafeLoader', yaml.SafeLoader)):
+    """A safe loader that accepts application tags such as CloudFormation's `!GetAtt`."""
+
+
+TagTolerantLoader.add_multi_constructor('!', lambda loader, suffix, node: None)
+
+
+def validate_yaml(code: str) -> Optional[str]:
+    try:
+        for _ in yaml.load_all(code, Loader=TagTolerantLoader):
+            pass
+    except yaml.YAMLError as e:
+        mark = getattr(e, 'problem_mark', None)
+        problem = getattr(e, 'problem', None) or str(e)
+        return f"line {mark.line + 1}: {problem}" if mark else problem
+    return None
+
+
+def validate_toml(code: str) -> Optional[str]:
+    try:
+        tomllib.loads(code)
+    except tomllib.TOMLDecodeError as e:
+        return str(e)
+    return None
+
+
+def validate_bash(code: str) -> Optional[str]:
+    code = SHELL_PLACEHOLDER_PATTERN.sub(r'\1', code)
+    result = subprocess.run(['bash', '-n'], input=code, capture_output=True, text=True)
+    if result.returncode == 0:
+        return None
+    message = result.stderr.strip().split('\n')[0]
+    return message.removeprefix('bash: ') or f"exit code {result.returncode}"
+
+
+VALIDATORS = {
+    'python': validate_python,
+    'json': validate_json,
+    'yaml': validate_yaml,
+    'toml': validate_toml,
+    'bash': validate_bash,
+}
+
+
+def validate(validator: str, code: str) -> Optional[str]:
+    """Return the first syntax error in the code, or None if it parses."""
+    return VALIDATORS[validator](code)
+
+
+def is_skipped(lines: List[str], fence_index: int) -> bool:
+    """Whether the nearest non-blank line above the fence is the opt-out directive."""
+    for line in reversed(lines[:fence_index]):
+        if line.strip():
+            return bool(SKIP_DIRECTIVE_PATTERN.match(line))
+    return False
+
+
+def extract_blocks(root: Path, pages: List[str], languages: Optional[List[str]],
+                   skipped: Optional[List[Block]] = None) -> Iterator[Block]:
+    """Yield the checkable code blocks of each page, one page at a time. Excerpts and opted-out blocks are added
+    to skipped instead."""
+    for page in pages:
+        content = (root / page).read_text(encoding='utf-8')
+        if '```' not in content and '~~~' not in content:
+            continue
+        _, body, body_start_line = parse_frontmatter(content)
+        lines = body.split('\n')
+        for block in iter_code_blocks(body, body_start_line):
+            validator = LANGUAGES.get(block.language)
+            if validator is None or (languages and validator not in languages) or not block.code.strip():
+                continue
+            if ELLIPSIS_LINE_PATTERN.search(block.code) or is_skipped(lines, block.line - body_start_line):
+                if skipped is not None:
+                    skipped.append(Block(page, block.line, validator, block.code))
+                continue
+            yield Block(page, block.line, validator, block.code)
+
+
+def check_blocks(blocks: List[Block], cache: Dict[str, Optional[str]],
+                 jobs: int) -> Tuple[Dict[str, Optional[str]], int]:
+    """Return the result for every block (by key) and how many distinct blocks were not in the cache."""
+    pending: Dict[str, Block] = {}
+    for block in blocks:
+        if block.key not in cache:
+            pending.setdefault(block.key, block)
+    results = {block.key: cache[block.key] for block in blocks if block.key in cache}
+
+    keys = list(pending)
+    validators = [pending[key].validator for key in keys]
+    codes = [pending[key].code for key in keys]
+    if jobs <= 1 or len(keys) < 2:
+        errors = [validate(validator, code) for validator, code in zip(validators, codes)]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            errors = list(executor.map(validate, validators, codes, chunksize=8))
+    results.update(zip(keys, errors))
+    return results, len(keys)
+
+
+def load_cache(cache_path: Path) -> Dict[str, Optional[str]]:
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data['blocks'] if data.get('version') == CODE_BLOCKS_VERSION else {}
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def save_cache(cache_path: Path, results: Dict[str, Optional[str]]) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': CODE_BLOCKS_VERSION, 'blocks': results}, f, separators=(',', ':'), sort_keys=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check that the fenced code blocks in the pages parse')
+    parser.add_argument('pages', nargs='*', help='Pages to check, relative to the repository root (default: all)')
+    parser.add_argument('--language', action='append', choices=sorted(VALIDATORS),
+                        help='Only check blocks of this language (repeatable)')
+    parser.add_argument('--root-dir', default=str(Path(__file__).parent.parent),
+                        help='Repository root (default: parent of the scripts directory)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes for checking blocks (default: CPU count)')
+    parser.add_argument('--no-cache', action='store_true', help='Check every block, even if it was checked before')
+
+    args = parser.parse_args()
+
+    root = Path(args.root_dir)
+    pages = args.pages or discover_files(str(root)).pages
+    start = time.perf_counter()
+
+    cache_path = root / DEFAULT_CACHE_FILE
+    cache = {} if args.no_cache else load_cache(cache_path)
+    skipped: List[Block] = []
+    blocks = list(extract_blocks(root, pages, args.language, skipped))
+    results, checked = check_blocks(blocks, cache, args.jobs)
+    elapsed = time.perf_counter() - start
+
+    failures = [(block, results[block.key]) for block in blocks if results[block.key]]
+    for block, error in failures:
+        print(f"❌ {block.page}:{block.line} [{block.validator}] {error}")
+
+    counts: Dict[str, int] = {}
+    for block in blocks:
+        counts[block.validator] = counts.get(block.validator, 0) + 1
+    summary = ', '.join(f"{count} {validator}" for validator, count in sorted(counts.items()))
+    print()
+    print(f"📊 {len(blocks)} block(s) in {len(pages)} page(s) ({summary or 'none'}) in {elapsed * 1000:.0f} ms; "
+          f"{checked} new or edited block(s) checked, the rest read from the cache")
+    if skipped:
+        print(f"⏭️  {len(skipped)} excerpt or opted-out block(s) skipped")
+
+    # Keep results for blocks that were not part of this run, so checking a few pages does not empty the cache
+    cache.update(results)
+    save_cache(cache_path, cache)
+
+    if failures:
+        print(f"❌ {len(failures)} code block(s) do not parse")
+        sys.exit(1)
+    print("✅ Every code block parses")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Offline broken-link checker for the documentation pages.
+
+This script:
+1. Discovers every page and asset once and compiles the docs.json redirects into a flattened lookup table
+2. Parses pages in parallel, collecting each page's links (with line numbers). The anchors each page defines come
+   from the heading index (see heading_index.py), so only pages changed since the last run are re-indexed
+3. Resolves every internal link, image and `#anchor` against the page set, the asset index and the redirects. A
+   path with navigation pages below it (a tab or group root such as /reference/saladcloud-api) resolves to the
+   first of them in sidebar order, as it does on the docs site
+4. Reports broken links by file and line, and exits non-zero if any are found
+
+Links into OpenAPI-generated pages are checked by path only, since their anchors are generated from the spec.
+
+With --baseline, links listed in the baseline file (known broken links that predate the check) are reported but do
+not fail the run, so CI only fails on newly broken links. Baseline entries that have since been fixed are listed so
+they can be removed; --update-baseline rewrites the file from the current results.
+
+Usage:
+    python scripts/check-links.py [--jobs N] [--no-anchors] [--baseline FILE [--update-baseline]] [--benchmark]
+
+Example:
+    python scripts/check-links.py --baseline scripts/broken-links-baseline.json
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+from file_discovery import discover_files
+from heading_index import (DEFAULT_CACHE_FILE, HeadingIndex, PageAnchors, content_hash, index_page,
+                           load_heading_index, save_heading_index)
+from page_content import page_url, parse_frontmatter, split_internal_link, strip_code_blocks
+from redirect_table import RedirectTable, compile_redirect_table
+from script_loader import load_script
+
+navigation_tree = load_script('navigation-tree.py')
+resolve_chains = load_script('resolve-redirect-chains.py')
+update_links = load_script('update-links.py')
+
+NPX_COMMAND = ['npx', '--yes', 'mintlify', 'broken-links']
+
+
+@dataclass
+class ParsedPage:
+    """The links a page contains, and its anchors when the heading index had no current entry for it."""
+    path: str
+    links: List[Tuple[int, str]]
+    anchors: Optional[PageAnchors] = None
+
+
+@dataclass
+class BrokenLink:
+    page: str
+    line: int
+    url: str
+    reason: str
+
+
+def parse_page(root_dir: str, page: str, indexed_hash: Optional[str]) -> ParsedPage:
+    """Read a page once and return its links (1-based line, url), and its anchors unless indexed_hash is current."""
+    content = (Path(root_dir) / page).read_text(encoding='utf-8')
+    _, body, body_start_line = parse_frontmatter(content)
+
+    links = []
+    for i, line in enumerate(strip_code_blocks(body).split('\n')):
+        for _, _, url in update_links.extract_links(line):
+            links.append((body_start_line + i, url))
+
+    anchors = None if content_hash(content) == indexed_hash else index_page(page, content)
+    return ParsedPage(page, links, anchors)
+
+
+def parse_pages(root_dir: str, pages: List[str], jobs: int, index: HeadingIndex) -> List[ParsedPage]:
+    """Parse pages across worker processes (or inline with a single job), updating the heading index."""
+    indexed_hashes = []
+    for page in pages:
+        entry = index.pages.get(page_url(page))
+        indexed_hashes.append(entry.hash if entry is not None and entry.path == page else None)
+    if jobs <= 1:
+        parsed_pages = [parse_page(root_dir, page, digest) for page, digest in zip(pages, indexed_hashes)]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            parsed_pages = list(executor.map(parse_page, [root_dir] * len(pages), pages, indexed_hashes,
+                                             chunksize=16))
+    for parsed in parsed_pages:
+        if parsed.anchors is None:
+            index.reused += 1
+        else:
+            index.add(parsed.anchors)
+    return parsed_pages
+
+
+class LinkChecker:
+    """Resolves internal links against the page set, asset index and redirect table."""
+
+    def __init__(self, parsed_pages: List[ParsedPage], assets: List[str], redirects: RedirectTable,
+                 anchors: HeadingIndex, check_anchors: bool = True, navigation_pages: Optional[List[str]] = None):
+        self.pages: Dict[str, ParsedPage] = {page_url(parsed.path): parsed for parsed in parsed_pages}
+        self.anchors = anchors
+        self.assets: Set[str] = {'/' + asset for asset in assets}
+        self.redirects = redirects
+        self.check_anchors = check_anchors
+        self.section_roots = section_roots(navigation_pages or [], self.pages)
+
+    def serves(self, path: str) -> Optional[str]:
+        """Return the page URL or asset path served at path itself, without following redirects."""
+        if path in self.pages or path in self.assets:
+            return path
+        return self.section_roots.get(path)
+
+    def resolve(self, path: str) -> Optional[str]:
+        """Return the page URL or asset path a link path ends up at, or None if nothing serves it."""
+        path = unquote(path).rstrip('/') or '/'
+        served = self.serves(path)
+        if served is not None:
+            return served
+        destination = self.redirects.lookup(path)
+        if destination is None:
+            return None
+        if split_internal_link(destination) is None:
+            # Redirected off-site
+            return destination
+        return self.serves(split_internal_link(destination)[0].rstrip('/') or '/')
+
+    def check_link(self, source: ParsedPage, url: str) -> Optional[str]:
+        """Return why a link is broken, or None if it resolves."""
+        link = split_internal_link(url)
+        if link is None:
+            return None
+        path, fragment = link
+
+        if path:
+            target_path = self.resolve(path)
+            if target_path is None:
+                return 'target not found'
+            target = self.pages.get(target_path)
+        else:
+            target = source
+
+        if not fragment or not self.check_anchors or target is None:
+            return None
+        if self.anchors.has_anchor(page_url(target.path), fragment) is False:
+            return f"anchor #{fragment} not found in {target.path}"
+        return None
+
+    def check(self) -> List[BrokenLink]:
+        """Check every link on every page."""
+        broken = []
+        for parsed in self.pages.values():
+            for line, url in parsed.links:
+                reason = self.check_link(parsed, url)
+                if reason:
+                    broken.append(BrokenLink(parsed.path, line, url, reason))
+        return sorted(broken, key=lambda link: (link.page, link.line))
+
+
+def section_roots(navigation_pages: List[str], pages: Dict[str, ParsedPage]) -> Dict[str, str]:
+    """Map every directory above a navigation page to the first existing navigation page below it, in sidebar
+    order. The docs site sends a request for such a directory (/reference, /reference/imds) to that page."""
+    roots: Dict[str, str] = {}
+    for page in navigation_pages:
+        url = '/' + page.strip('/')
+        if url not in pages:
+            continue
+        parts = url.split('/')
+        for depth in range(2, len(parts)):
+            roots.setdefault('/'.join(parts[:depth]), url)
+    return roots
+
+
+def check_links(root_dir: str, jobs: int, check_anchors: bool = True) -> Tuple[List[BrokenLink], int, int]:
+    """Run the full check. Returns (broken links, pages checked, links checked)."""
+    docs = resolve_chains.load_docs_json(str(Path(root_dir) / 'docs.json'))
+    redirects = compile_redirect_table(docs.get('redirects', []))
+    discovered = discover_files(root_dir)
+    index_path = Path(root_dir) / DEFAULT_CACHE_FILE
+    index = load_heading_index(index_path)
+
+    parsed_pages = parse_pages(root_dir, discovered.pages_with_extension('.mdx'), jobs, index)
+    index.prune(discovered.pages)
+    save_heading_index(index, index_path)
+    navigation_pages = navigation_tree.collect_nav_pages(docs.get('navigation', {}))
+    checker = LinkChecker(parsed_pages, discovered.assets, redirects, index, check_anchors, navigation_pages)
+    link_count = sum(len(parsed.links) for parsed in parsed_pages)
+    return checker.check(), len(parsed_pages), link_count
+
+
+def load_baseline(path: Path) -> Set[Tuple[str, str]]:
+    """Read the known broken links as (page, url) pairs; line numbers are left out so edits do not invalidate them."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return {(entry['page'], entry['url']) for entry in json.load(f)}
+
+
+def save_baseline(path: Path, broken: List[BrokenLink]) -> None:
+    entries = sorted({(link.page, link.url) for link in broken})
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump([{'page': page, 'url': url} for page, url in entries], f, indent=2)
+        f.write('\n')
+
+
+def print_report(broken: List[BrokenLink], baseline: Set[Tuple[str, str]]) -> None:
+    """Print broken links grouped by page; links in the baseline are marked as known."""
+    current_page = None
+    for link in broken:
+        if link.page != current_page:
+            current_page = link.page
+            print(f"\n📄 {link.page}")
+        if (link.page, link.url) in baseline:
+            print(f"  ⚠️  line {link.line}: {link.url} ({link.reason}) [baseline]")
+        else:
+            print(f"  ❌ line {link.line}: {link.url} ({link.reason})")
+
+
+def run_npx_benchmark(root_dir: str) -> Optional[float]:
+    """Time the Mintlify CLI check on the same tree. Returns None if it cannot run here."""
+    if shutil.which('npx') is None:
+        print("⚠️  npx is not installed, skipping the Mintlify comparison")
+        return None
+
+    start = time.perf_counter()
+    try:
+        result = subprocess.run(NPX_COMMAND, cwd=root_dir, capture_output=True, text=True, timeout=600)
+    except subprocess.TimeoutExpired:
+        print("⚠️  Mintlify broken-links timed out after 600 s")
+        return None
+    elapsed = time.perf_counter() - start
+
+    if result.returncode != 0 and 'broken' not in (result.stdout + result.stderr).lower():
+        print(f"⚠️  `{' '.join(NPX_COMMAND)}` failed (exit code {result.returncode}), skipping the comparison")
+        return None
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check internal links, images and anchors without the Mintlify CLI')
+    parser.add_argument('--root-dir', default=str(Path(__file__).parent.parent),
+                        help='Repository root (default: parent of the scripts directory)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes for parsing pages (default: CPU count)')
+    parser.add_argument('--no-anchors', action='store_true', help='Only check link targets, not #anchors')
+    parser.add_argument('--baseline', help='JSON file of known broken links that do not fail the check')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Rewrite the --baseline file with the broken links found now')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Also time `npx mintlify broken-links` on the same tree for comparison')
+
+    args = parser.parse_args()
+
+    if not (Path(args.root_dir) / 'docs.json').exists():
+        print(f"Error: docs.json not found in {args.root_dir}")
+        sys.exit(1)
+    if args.update_baseline and not args.baseline:
+        parser.error('--update-baseline needs --baseline')
+    baseline_path = Path(args.baseline) if args.baseline else None
+    baseline = load_baseline(baseline_path) if baseline_path and baseline_path.exists() and \
+        not args.update_baseline else set()
+
+    print("🔍 Checking links...")
+    start = time.perf_counter()
+    broken, page_count, link_count = check_links(args.root_dir, args.jobs, not args.no_anchors)
+    elapsed = time.perf_counter() - start
+
+    print_report(broken, baseline)
+    print()
+    print(f"📊 Checked {link_count} links in {page_count} pages in {elapsed * 1000:.0f} ms")
+
+    if args.update_baseline:
+        save_baseline(baseline_path, broken)
+        print(f"📝 Wrote {len({(link.page, link.url) for link in broken})} known broken link(s) to {baseline_path}")
+        return
+    fixed = baseline - {(link.page, link.url) for link in broken}
+    if fixed:
+        print(f"🎉 {len(fixed)} baseline link(s) are no longer broken; remove them from {baseline_path}:")
+        for page, url in sorted(fixed):
+            print(f"  {page}: {url}")
+    new = [link for link in broken if (link.page, link.url) not in baseline]
+
+    if args.benchmark:
+        npx_elapsed = run_npx_benchmark(args.root_dir)
+        if npx_elapsed is not None:
+            print(f"⏱️  Mintlify broken-links: {npx_elapsed:.2f} s ({npx_elapsed / elapsed:.0f}x slower)")
+
+    if new:
+        print(f"❌ Found {len(new)} broken link(s)" + (f" ({len(broken) - len(new)} more in the baseline)"
+                                                     if len(new) < len(broken) else ''))
+        sys.exit(1)
+    if broken:
+        print(f"✅ No new broken links ({len(broken)} known in the baseline)")
+        return
+    print("✅ No broken links found")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Structural check for the JSX in the documentation pages, to catch MDX build breaks before the hosted build does.
+
+This script:
+1. Scans every page for tags outside fenced and inline code (and outside comments), in parallel
+2. Checks that every tag is closed, in the right order, and that void elements such as `<br />` are self-closing
+3. Flags `<YOUR_API_KEY>`-style placeholders in prose, which MDX parses as tags; they need to be in backticks or
+   escaped as `&lt;`
+4. Checks the props of the known Mintlify components (`<Card>`, `<Tab>`, `<Frame>`, ...), that `<Tab>` and
+   `<Step>` sit inside `<Tabs>` and `<Steps>`, and that any other component is imported by the page
+5. Reports problems by file and line, and exits non-zero if any are found
+
+Usage:
+    python scripts/check-mdx.py [<page> ...] [--jobs N]
+
+Example:
+    python scripts/check-mdx.py container-engine/tutorials/quickstart.mdx
+
+Arguments:
+    page: Pages to check, relative to the repository root (default: every page)
+"""
+
+import argparse
+import bisect
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from file_discovery import discover_files
+from page_content import mask_code_blocks, parse_frontmatter
+
+# Props every component accepts
+COMMON_PROPS = {'className', 'style', 'id', 'key'}
+
+# Mintlify components and the props they take
+COMPONENT_PROPS: Dict[str, Set[str]] = {
+    'Accordion': {'title', 'description', 'defaultOpen', 'icon', 'iconType'},
+    'AccordionGroup': set(),
+    'Badge': {'color', 'size', 'shape', 'icon', 'stroke', 'disabled'},
+    'Callout': {'icon', 'iconType', 'color'},
+    'Card': {'title', 'icon', 'iconType', 'color', 'href', 'horizontal', 'img', 'cta', 'arrow'},
+    'CardGroup': {'cols'},
+    'Check': set(),
+    'CodeGroup': {'dropdown'},
+    'Columns': {'cols'},
+    'Danger': set(),
+    'Expandable': {'title', 'defaultOpen'},
+    'Frame': {'caption', 'hint'},
+    'Icon': {'icon', 'iconType', 'color', 'size'},
+    'Info': set(),
+    'Note': set(),
+    'ParamField': {'query', 'path', 'body', 'header', 'type', 'required', 'default', 'deprecated', 'placeholder'},
+    'RequestExample': {'dropdown'},
+    'ResponseExample': {'dropdown'},
+    'ResponseField': {'name', 'type', 'required', 'default', 'deprecated', 'pre', 'post'},
+    'Snippet': {'file'},
+    'Step': {'title', 'icon', 'iconType', 'stepNumber', 'titleSize'},
+    'Steps': {'titleSize'},
+    'Tab': {'title', 'icon', 'iconType'},
+    'Tabs': set(),
+    'Tip': set(),
+    'Tooltip': {'tip', 'headline', 'cta', 'href'},
+    'Update': {'label', 'description', 'tags'},
+    'Warning': set(),
+}
+REQUIRED_PROPS = {'Tab': {'title'}, 'Accordion': {'title'}, 'Snippet': {'file'}}
+PARENTS = {'Tab': 'Tabs', 'Step': 'Steps'}
+
+VOID_ELEMENTS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track',
+                 'wbr'}
+
+TAG_START_PATTERN = re.compile(r'<(/?)([A-Za-z][\w.:-]*)')
+COMMENT_PATTERN = re.compile(r'<!--.*?-->|\{/\*.*?\*/\}', re.DOTALL)
+IMPORT_PATTERN = re.compile(r'^import\s+(?:\{([^}]*)\}|(\w+))', re.MULTILINE)
+PROP_PATTERN = re.compile(r'([A-Za-z_][\w:-]*)(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|\{))?')
+
+
+@dataclass
+class Tag:
+    name: str
+    line: int
+    closing: bool
+    self_closing: bool
+    props: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Problem:
+    page: str
+    line: int
+    message: str
+
+
+def is_placeholder(name: str) -> bool:
+    """`<YOUR_API_KEY>`, `<ORG>` or `<your-bucket>`: text in angle brackets, not a tag. Any other lowercase name is
+    taken as an HTML element, whether or not it is one, and is left to the closing-tag checks."""
+    return name.isupper() or ('-' in name and name.islower())
+
+
+def scan_tag_end(text: str, start: int) -> Optional[Tuple[int, str]]:
+    """
+    From just after a tag name, find the closing `>`, skipping quoted strings and {...} expressions.
+    Returns (index after `>`, raw attribute text), or None if the tag never ends.
+    """
+    i = start
+    depth = 0
+    quote = None
+    while i < len(text):
+        char = text[i]
+        if quote:
+            if char == quote:
+                quote = None
+        elif depth:
+            if char in '"\'`':
+                quote = char
+            elif char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+        elif char in '"\'':
+            quote = char
+        elif char == '{':
+            depth += 1
+        elif char == '>':
+            return i + 1, text[start:i]
+        elif char == '<':
+            return None
+        i += 1
+    return None
+
+
+def prop_names(attributes: str) -> List[str]:
+    """Names of the props in a tag's attribute text (expression values are skipped)."""
+    names = []
+    i = 0
+    while i < len(attributes):
+        match = PROP_PATTERN.match(attributes, i)
+        if not match:
+            i += 1
+            continue
+        names.append(match.group(1))
+        i = match.end()
+        if match.group(0).endswith('{'):
+            depth = 1
+            while i < len(attributes) and depth:
+                depth += {'{': 1, '}': -1}.get(attributes[i], 0)
+                i += 1
+    return names
+
+
+def scan_tags(body: str, first_line: int) -> Tuple[List[Tag], List[Tuple[int, str]]]:
+    """Return the tags of a page body outside code and comments, and (line, name) for every placeholder."""
+    text = mask_code_blocks(body)
+    text = COMMENT_PATTERN.sub(lambda comment: re.sub(r'[^\n]', ' ', comment.group(0)), text)
+    line_starts = [0] + [match.end() for match in re.finditer('\n', text)]
+
+    tags, placeholders = [], []
+    position = 0
+    while True:
+        match = TAG_START_PATTERN.search(text, position)
+        if match is None:
+            return tags, placeholders
+        closing, name = match.group(1) == '/', match.group(2)
+        line = first_line + bisect.bisect_right(line_starts, match.start()) - 1
+        position = match.end()
+        if ':' in name:
+            continue  # An autolink such as <https://salad.com> or <mailto:support@salad.com>
+        if not closing and is_placeholder(name):
+            placeholders.append((line, name))
+            continue
+        end = scan_tag_end(text, match.end())
+        if end is None:
+            continue
+        position, attributes = end
+        self_closing = attributes.rstrip().endswith('/')
+        tags.append(Tag(name, line, closing, self_closing, [] if closing else prop_names(attributes.rstrip('/'))))
+
+
+def check_page(root_dir: str, page: str) -> List[Problem]:
+    content = (Path(root_dir) / page).read_text(encoding='utf-8')
+    if '<' not in content:
+        return []
+    _, body, body_start_line = parse_frontmatter(content)
+    imported = set()
+    for names, default in IMPORT_PATTERN.findall(mask_code_blocks(body)):
+        imported.update(name.split(' as ')[-1].strip() for name in names.split(',') if name.strip())
+        if default:
+            imported.add(default)
+
+    tags, placeholders = scan_tags(body, body_start_line)
+    problems = [Problem(page, line, f"<{name}> looks like a placeholder; MDX reads it as a tag. Put it in backticks "
+                                    f"or write &lt;{name}&gt;") for line, name in placeholders]
+
+    stack: List[Tag] = []
+    for tag in tags:
+        if tag.closing:
+            if stack and stack[-1].name == tag.name:
+                stack.pop()
+            elif any(open_tag.name == tag.name for open_tag in stack):
+                while stack[-1].name != tag.name:
+                    unclosed = stack.pop()
+                    problems.append(Problem(page, unclosed.line, f"<{unclosed.name}> is not closed before "
+                                                                 f"</{tag.name}> on line {tag.line}"))
+                stack.pop()
+            else:
+                problems.append(Problem(page, tag.line, f"</{tag.name}> has no matching <{tag.name}>"))
+            continue
+
+        if tag.name in COMPONENT_PROPS:
+            unknown = [prop for prop in tag.props if prop not in COMPONENT_PROPS[tag.name] | COMMON_PROPS]
+            if unknown:
+                problems.append(Problem(page, tag.line, f"<{tag.name}> does not take {', '.join(unknown)}"))
+            missing = REQUIRED_PROPS.get(tag.name, set()) - set(tag.props)
+            if missing:
+                problems.append(Problem(page, tag.line, f"<{tag.name}> needs {', '.join(sorted(missing))}"))
+        elif tag.name[0].isupper() and tag.name.split('.')[0] not in imported:
+            problems.append(Problem(page, tag.line, f"<{tag.name}> is not a known component and is not imported"))
+
+        parent = PARENTS.get(tag.name)
+        if parent and not (stack and stack[-1].name == parent):
+            problems.append(Problem(page, tag.line, f"<{tag.name}> must be directly inside <{parent}>"))
+
+        if tag.self_closing:
+            continue
+        if tag.name in VOID_ELEMENTS:
+            problems.append(Problem(page, tag.line, f"<{tag.name}> must be self-closing in MDX: <{tag.name} />"))
+            continue
+        stack.append(tag)
+
+    for unclosed in stack:
+        problems.append(Problem(page, unclosed.line, f"<{unclosed.name}> is never closed"))
+    return sorted(problems, key=lambda problem: problem.line)
+
+
+def check_pages(root_dir: str, pages: List[str], jobs: int) -> List[Problem]:
+    """Check pages across worker processes (or inline with a single job)."""
+    if jobs <= 1:
+        results = [check_page(root_dir, page) for page in pages]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(check_page, [root_dir] * len(pages), pages, chunksize=16))
+    return [problem for problems in results for problem in problems]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check JSX tag balance, placeholders and component props in the pages')
+    parser.add_argument('pages', nargs='*', help='Pages to check, relative to the repository root (default: all)')
+    parser.add_argument('--root-dir', default=str(Path(__file__).parent.parent),
+                        help='Repository root (default: parent of the scripts directory)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes (default: CPU count)')
+
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    pages = args.pages or discover_files(args.root_dir).pages_with_extension('.mdx')
+    problems = check_pages(args.root_dir, pages, args.jobs)
+    elapsed = time.perf_counter() - start
+
+    current_page = None
+    for problem in problems:
+        if problem.page != current_page:
+            current_page = problem.page
+            print(f"\n📄 {problem.page}")
+        print(f"  ❌ Line {problem.line}: {problem.message}")
+
+    print()
+    print(f"📊 Checked {len(pages)} pages in {elapsed * 1000:.0f} ms")
+    if problems:
+        print(f"❌ Found {len(problems)} problem(s)")
+        sys.exit(1)
+    print("✅ No problems found")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Compact the docs.json redirects by replacing groups of 1:1 renames with wildcard rules.
+
+This script:
+1. Finds groups of redirects that move a whole prefix, e.g. every `/products/sgs/<page>` →
+   `/gateway-service/explanation/<page>`, and proposes one `:slug*` rule per group
+2. Rejects any rule that would capture a live page or asset
+3. Accepts a rule only if, with it in place, every existing source still ends up at exactly the same page in no
+   more hops. Redirects are followed one hop at a time, as the docs platform serves them, and a rule only covers
+   sources it sends straight to their final page. Sources under the prefix that go elsewhere stay as exact
+   redirects ahead of the wildcard rules.
+4. Reports the before/after rule count and, with --write, rewrites docs.json
+
+Usage:
+    python scripts/compact-redirects.py [--docs-file docs.json] [--min-group 3] [--write]
+
+Example:
+    python scripts/compact-redirects.py --min-group 3
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from file_discovery import discover_files
+from page_content import page_url
+from path_trie import PathTrie
+from redirect_table import RedirectTable, is_pattern, normalize_path, raw_redirect_table
+
+MAX_HOPS = 20
+WILDCARD = ':slug*'
+
+
+@dataclass
+class Candidate:
+    """A proposed wildcard rule and the exact redirects it would replace."""
+    source_prefix: str
+    destination_prefix: str
+    covered: List[str] = field(default_factory=list)
+
+    @property
+    def rule(self) -> dict:
+        return {'source': f"{self.source_prefix}/{WILDCARD}", 'destination': f"{self.destination_prefix}/{WILDCARD}"}
+
+
+def follow(table: RedirectTable, path: str) -> Tuple[str, int]:
+    """Follow a path through the table one redirect at a time. Returns (final destination, number of hops)."""
+    seen = set()
+    current = normalize_path(path)
+    hops = 0
+    for _ in range(MAX_HOPS):
+        destination = table.next_hop(current)
+        if destination is None or destination in seen:
+            break
+        seen.add(current)
+        current = destination
+        hops += 1
+    return current, hops
+
+
+def live_paths(root_dir: str) -> Set[str]:
+    """Every URL the site serves without a redirect: pages and assets."""
+    discovered = discover_files(root_dir)
+    return {page_url(page) for page in discovered.pages_with_extension('.mdx')} | \
+        {'/' + asset for asset in discovered.assets}
+
+
+def find_candidates(sources: PathTrie, old_finals: Dict[str, str], live: PathTrie,
+                    min_group: int) -> List[Candidate]:
+    """Propose a rule for every (source prefix, destination prefix) pair shared by at least min_group redirects."""
+    pairs: Set[Tuple[str, str]] = set()
+    for source, final in old_finals.items():
+        source_segments = source.split('/')
+        final_segments = final.split('/')
+        # Every shared trailing run of segments suggests a prefix rename
+        k = 1
+        while (k < len(source_segments) - 1 and k < len(final_segments) - 1
+               and source_segments[-k] == final_segments[-k]):
+            pairs.add(('/'.join(source_segments[:-k]), '/'.join(final_segments[:-k])))
+            k += 1
+
+    candidates = []
+    for source_prefix, destination_prefix in pairs:
+        if not source_prefix or source_prefix == destination_prefix:
+            continue
+        # `:slug*` also matches the prefix itself, so neither it nor anything under it may be a live path
+        if source_prefix in live or live.count(source_prefix + '/'):
+            continue
+
+        candidate = Candidate(source_prefix, destination_prefix)
+        under = sources.items(source_prefix + '/')
+        if source_prefix in sources:
+            under.append((source_prefix, sources.get(source_prefix)))
+        for source, _ in under:
+            # Only cover sources the rule sends straight to their final page; landing on another redirect
+            # would add a hop
+            if destination_prefix + source[len(source_prefix):] == old_finals[source]:
+                candidate.covered.append(source)
+        if len(candidate.covered) >= min_group:
+            candidates.append(candidate)
+
+    # Largest savings first; deeper (more specific) prefixes break ties
+    return sorted(candidates, key=lambda c: (-len(c.covered), -c.source_prefix.count('/'), c.source_prefix,
+                                             c.destination_prefix))
+
+
+def assemble(redirects: List[dict], rules: List[Candidate]) -> List[dict]:
+    """Build the new redirects array: untouched entries in their original order, then wildcard rules."""
+    covered = {source for rule in rules for source in rule.covered}
+    kept = [redirect for redirect in redirects if normalize_path(redirect.get('source', '')) not in covered]
+    # More specific wildcard rules first, so the first match is the right one
+    ordered = sorted(rules, key=lambda rule: (-rule.source_prefix.count('/'), rule.source_prefix))
+    return kept + [rule.rule for rule in ordered]
+
+
+def verify(redirects: List[dict], old_routes: Dict[str, Tuple[str, int]], live: Set[str]) -> Optional[str]:
+    """Return why a redirects array changes behaviour, or None if every source reaches the same page in no more
+    hops and no live path is redirected."""
+    table = raw_redirect_table(redirects)
+    for source, (final, hops) in old_routes.items():
+        new_final, new_hops = follow(table, source)
+        if new_final != final:
+            return f"{source} would go to {new_final} instead of {final}"
+        if new_hops > hops:
+            return f"{source} would take {new_hops} hops instead of {hops}"
+    for path in live:
+        destination = table.next_hop(path)
+        if destination is not None:
+            return f"live path {path} would redirect to {destination}"
+    return None
+
+
+def compact(redirects: List[dict], root_dir: str, min_group: int) -> Tuple[List[dict], List[Candidate]]:
+    """Greedily accept candidate rules that keep every redirect's behaviour. Returns (new redirects, rules)."""
+    old_table = raw_redirect_table(redirects)
+    exact_sources = {normalize_path(r.get('source', '')) for r in redirects
+                     if r.get('source') and r.get('destination') and not is_pattern(r['source'])}
+    old_routes = {source: follow(old_table, source) for source in exact_sources}
+    old_finals = {source: final for source, (final, _) in old_routes.items()}
+
+    live = live_paths(root_dir)
+    live_trie = PathTrie()
+    for path in live:
+        live_trie.insert(path, True)
+    sources = PathTrie()
+    for source in exact_sources:
+        sources.insert(source, old_finals[source])
+
+    accepted: List[Candidate] = []
+    taken: Set[str] = set()
+    for candidate in find_candidates(sources, old_finals, live_trie, min_group):
+        candidate.covered = [source for source in candidate.covered if source not in taken]
+        if len(candidate.covered) < min_group:
+            continue
+        if verify(assemble(redirects, accepted + [candidate]), old_routes, live) is not None:
+            continue
+        accepted.append(candidate)
+        taken.update(candidate.covered)
+
+    return assemble(redirects, accepted), accepted
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replace groups of prefix-rename redirects with wildcard rules')
+    parser.add_argument('--docs-file', default='docs.json', help='Path to docs.json file (default: docs.json)')
+    parser.add_argument('--min-group', type=int, default=3,
+                        help='Minimum number of redirects a wildcard rule must replace (default: 3)')
+    parser.add_argument('--write', action='store_true', help='Rewrite docs.json (default: only report)')
+
+    args = parser.parse_args()
+
+    docs_file = Path(args.docs_file)
+    if not docs_file.is_absolute():
+        # Assume relative to the script's parent directory (repository root)
+        docs_file = Path(__file__).parent.parent / docs_file
+    if not docs_file.exists():
+        print(f"Error: docs.json file not found at {docs_file}")
+        sys.exit(1)
+
+    with open(docs_file, 'r', encoding='utf-8') as f:
+        docs_data = json.load(f)
+    redirects = docs_data.get('redirects', [])
+
+    print(f"🔍 Looking for wildcard rules in {len(redirects)} redirects...")
+    compacted, rules = compact(redirects, str(docs_file.parent), args.min_group)
+
+    for rule in rules:
+        print(f"  ✨ {rule.rule['source']} → {rule.rule['destination']} (replaces {len(rule.covered)})")
+        for source in sorted(rule.covered):
+            print(f"       {source}")
+
+    print()
+    print(f"📊 Redirect rules: {len(redirects)} → {len(compacted)} "
+          f"({len(redirects) - len(compacted)} fewer, {len(rules)} wildcard rule(s) added)")
+
+    if not rules:
+        print("✨ Nothing to compact")
+        return
+
+    if args.write:
+        docs_data['redirects'] = compacted
+        with open(docs_file, 'w', encoding='utf-8') as f:
+            json.dump(docs_data, f, indent=2, ensure_ascii=False)
+        print(f"✅ Updated {docs_file}")
+    else:
+        print("ℹ️  Run with --write to update docs.json")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Structural diff of an OpenAPI spec between two revisions, for reviewing API reference changes.
+
+This script:
+1. Loads the spec at the base revision (from git) and at the head revision (from git, or the working tree)
+2. Indexes both by operation and by component schema, hashing every subtree with its `$ref`s dereferenced, so
+   operations and schemas that did not change are skipped after one hash comparison
+3. Reports added, removed and changed operations, with their changed parameters, request bodies and responses,
+   down to the schema properties that changed
+4. Flags breaking changes (removed operations, responses or properties; new required inputs; narrowed types or enums)
+5. Lists the reference pages that document changed operations and need regenerating, the pages of removed
+   operations, and the operations that have no page yet
+
+Usage:
+    python scripts/diff-spec.py <spec> [--base REV] [--head REV] [--fail-on-breaking]
+
+Example:
+    python scripts/diff-spec.py api-specs/salad-cloud.yaml --base origin/main
+
+Arguments:
+    spec: The spec file, relative to the repository root
+"""
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from openapi_spec import SemanticHasher, find_api_pages, iter_operations, parse_spec, resolve_local_ref
+
+MAX_DEPTH = 12
+
+
+@dataclass
+class Change:
+    location: str
+    message: str
+    breaking: bool = False
+
+
+@dataclass
+class SpecDiff:
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: Dict[str, List[Change]] = field(default_factory=dict)
+    schemas_added: List[str] = field(default_factory=list)
+    schemas_removed: List[str] = field(default_factory=list)
+    schemas_changed: List[str] = field(default_factory=list)
+
+    @property
+    def breaking(self) -> List[Tuple[str, Change]]:
+        found = [(operation, Change('', 'operation removed', True)) for operation in self.removed]
+        found += [(operation, change) for operation, changes in self.changed.items()
+                  for change in changes if change.breaking]
+        return found
+
+
+class SpecComparer:
+    """Compares two versions of a spec, skipping every subtree whose dereferenced hash is unchanged."""
+
+    def __init__(self, old: dict, new: dict):
+        self.old = old
+        self.new = new
+        self.old_hasher = SemanticHasher(old)
+        self.new_hasher = SemanticHasher(new)
+
+    def same(self, old: object, new: object) -> bool:
+        return self.old_hasher.hash(old) == self.new_hasher.hash(new)
+
+    def compare_schema(self, old: object, new: object, location: str, direction: str, changes: List[Change],
+                       depth: int = 0) -> None:
+        """Describe how a schema changed. direction is 'request' or 'response', which decides what breaks clients."""
+        if self.same(old, new):
+            return
+        old = resolve_local_ref(self.old, old)
+        new = resolve_local_ref(self.new, new)
+        if depth > MAX_DEPTH or not isinstance(old, dict) or not isinstance(new, dict):
+            changes.append(Change(location, 'schema changed'))
+            return
+
+        if old.get('type') != new.get('type'):
+            changes.append(Change(location, f"type {old.get('type')} → {new.get('type')}", True))
+            return
+
+        old_enum, new_enum = old.get('enum'), new.get('enum')
+        if isinstance(old_enum, list) and isinstance(new_enum, list) and old_enum != new_enum:
+            removed = [value for value in old_enum if value not in new_enum]
+            added = [value for value in new_enum if value not in old_enum]
+            if removed:
+                changes.append(Change(location, f"enum values removed: {removed}", direction == 'request'))
+            if added:
+                changes.append(Change(location, f"enum values added: {added}", direction == 'response'))
+        elif isinstance(new_enum, list) and old_enum is None:
+            changes.append(Change(location, 'now restricted to an enum', direction == 'request'))
+
+        old_required = set(old.get('required') or [])
+        new_required = set(new.get('required') or [])
+        for name in sorted(new_required - old_required):
+            changes.append(Change(f"{location}.{name}", 'now required', direction == 'request'))
+        for name in sorted(old_required - new_required):
+            changes.append(Change(f"{location}.{name}", 'no longer required', direction == 'response'))
+
+        old_properties = old.get('properties') or {}
+        new_properties = new.get('properties') or {}
+        for name in old_properties:
+            if name not in new_properties:
+                changes.append(Change(f"{location}.{name}", 'property removed', True))
+        for name in new_properties:
+            if name not in old_properties:
+                changes.append(Change(f"{location}.{name}", 'property added',
+                                      direction == 'request' and name in new_required))
+            else:
+                self.compare_schema(old_properties[name], new_properties[name], f"{location}.{name}", direction,
+                                    changes, depth + 1)
+
+        if 'items' in old or 'items' in new:
+            self.compare_schema(old.get('items'), new.get('items'), f"{location}[]", direction, changes, depth + 1)
+
+        for keyword in ('allOf', 'anyOf', 'oneOf'):
+            if not self.same(old.get(keyword), new.get(keyword)):
+                changes.append(Change(location, f"{keyword} changed"))
+
+        compared = {'type', 'enum', 'required', 'properties', 'items', 'allOf', 'anyOf', 'oneOf'}
+        for keyword in sorted((set(old) | set(new)) - compared):
+            if not self.same(old.get(keyword), new.get(keyword)):
+                breaking = keyword in ('maxLength', 'maximum', 'maxItems') and direction == 'request' \
+                    and new.get(keyword) is not None and (old.get(keyword) is None or new[keyword] < old[keyword])
+                breaking = breaking or (keyword in ('minLength', 'minimum', 'minItems', 'pattern')
+                                        and direction == 'request' and new.get(keyword) is not None)
+                changes.append(Change(location, f"{keyword}: {old.get(keyword)!r} → {new.get(keyword)!r}", breaking))
+
+    def parameters(self, spec: dict, path_item: dict, operation: dict) -> Dict[Tuple[str, str], dict]:
+        """Effective parameters of an operation (path-level ones included), keyed by (in, name)."""
+        result = {}
+        for parameter in (path_item.get('parameters') or []) + (operation.get('parameters') or []):
+            resolved = resolve_local_ref(spec, parameter)
+            if isinstance(resolved, dict):
+                result[(resolved.get('in', ''), resolved.get('name', ''))] = resolved
+        return result
+
+    def compare_operation(self, path: str, method: str) -> List[Change]:
+        old_item, new_item = self.old['paths'][path], self.new['paths'][path]
+        old_op, new_op = old_item[method], new_item[method]
+        changes: List[Change] = []
+
+        old_parameters = self.parameters(self.old, old_item, old_op)
+        new_parameters = self.parameters(self.new, new_item, new_op)
+        for key, parameter in old_parameters.items():
+            if key not in new_parameters:
+                changes.append(Change(f"{key[0]} parameter {key[1]}", 'removed', True))
+        for key, parameter in new_parameters.items():
+            location = f"{key[0]} parameter {key[1]}"
+            if key not in old_parameters:
+                changes.append(Change(location, 'added' + (' (required)' if parameter.get('required') else ''),
+                                      bool(parameter.get('required'))))
+                continue
+            old_parameter = old_parameters[key]
+            if self.same(old_parameter, parameter):
+                continue
+            if parameter.get('required') and not old_parameter.get('required'):
+                changes.append(Change(location, 'now required', True))
+            self.compare_schema(old_parameter.get('schema'), parameter.get('schema'), location, 'request', changes)
+            for keyword in ('description', 'deprecated', 'example'):
+                if not self.same(old_parameter.get(keyword), parameter.get(keyword)):
+                    changes.append(Change(location, f"{keyword} changed"))
+
+        old_body = resolve_local_ref(self.old, old_op.get('requestBody')) or {}
+        new_body = resolve_local_ref(self.new, new_op.get('requestBody')) or {}
+        if not self.same(old_body, new_body):
+            if new_body and not old_body:
+                changes.append(Change('request body', 'added', bool(new_body.get('required'))))
+            elif old_body and not new_body:
+                changes.append(Change('request body', 'removed', True))
+            else:
+                if new_body.get('required') and not old_body.get('required'):
+                    changes.append(Change('request body', 'now required', True))
+                self.compare_content(old_body.get('content'), new_body.get('content'), 'request body', 'request',
+                                     changes)
+
+        old_responses = old_op.get('responses') or {}
+        new_responses = new_op.get('responses') or {}
+        for status in old_responses:
+            if status not in new_responses:
+                changes.append(Change(f"response {status}", 'removed', True))
+        for status, response in new_responses.items():
+            if status not in old_responses:
+                changes.append(Change(f"response {status}", 'added'))
+            elif not self.same(old_responses[status], response):
+                old_response = resolve_local_ref(self.old, old_responses[status]) or {}
+                new_response = resolve_local_ref(self.new, response) or {}
+                self.compare_content(old_response.get('content'), new_response.get('content'), f"response {status}",
+                                     'response', changes)
+                if not self.same(old_response.get('description'), new_response.get('description')):
+                    changes.append(Change(f"response {status}", 'description changed'))
+
+        for keyword in ('summary', 'description', 'deprecated', 'security', 'tags', 'operationId'):
+            if not self.same(old_op.get(keyword), new_op.get(keyword)):
+                changes.append(Change(keyword, 'changed', keyword in ('security', 'operationId')))
+
+        if not changes:
+            changes.append(Change('operation', 'changed (examples or extensions)'))
+        return changes
+
+    def compare_content(self, old: Optional[dict], new: Optional[dict], location: str, direction: str,
+                        changes: List[Change]) -> None:
+        old, new = old or {}, new or {}
+        for media_type in old:
+            if media_type not in new:
+                changes.append(Change(f"{location} {media_type}", 'removed', True))
+        for media_type, media in new.items():
+            if media_type not in old:
+                changes.append(Change(f"{location} {media_type}", 'added'))
+            elif not self.same(old[media_type], media):
+                self.compare_schema(old[media_type].get('schema'), media.get('schema'), f"{location} {media_type}",
+                                    direction, changes)
+                if not self.same(old[media_type].get('example'), media.get('example')) or \
+                        not self.same(old[media_type].get('examples'), media.get('examples')):
+                    changes.append(Change(f"{location} {media_type}", 'example changed'))
+
+    def diff(self) -> SpecDiff:
+        result = SpecDiff()
+        old_operations = {(path, method): operation for path, method, operation in iter_operations(self.old)}
+        new_operations = {(path, method): operation for path, method, operation in iter_operations(self.new)}
+
+        for key in old_operations:
+            if key not in new_operations:
+                result.removed.append(operation_label(*key))
+        for key in new_operations:
+            if key not in old_operations:
+                result.added.append(operation_label(*key))
+                continue
+            path, method = key
+            # Path-level parameters belong to the operation too
+            old_item, new_item = self.old['paths'][path], self.new['paths'][path]
+            if self.same(old_operations[key], new_operations[key]) and \
+                    self.same(old_item.get('parameters'), new_item.get('parameters')):
+                continue
+            result.changed[operation_label(*key)] = self.compare_operation(path, method)
+
+        old_schemas = (self.old.get('components') or {}).get('schemas') or {}
+        new_schemas = (self.new.get('components') or {}).get('schemas') or {}
+        result.schemas_removed = [name for name in old_schemas if name not in new_schemas]
+        result.schemas_added = [name for name in new_schemas if name not in old_schemas]
+        result.schemas_changed = [name for name in new_schemas
+                                  if name in old_schemas and not self.same(old_schemas[name], new_schemas[name])]
+        return result
+
+
+def operation_label(path: str, method: str) -> str:
+    return f"{method.upper()} {path}"
+
+
+def git(root: Path, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(['git', *args], cwd=root, capture_output=True, text=True)
+
+
+def read_revision(root: Path, spec: str, revision: Optional[str]) -> Optional[dict]:
+    """
+    Load the spec at a git revision, or from the working tree when revision is None. Returns None when the spec does
+    not exist there; exits with git's error when the revision itself cannot be read (a typo, or a shallow clone
+    without it), rather than diffing against an empty spec.
+    """
+    if revision is None:
+        path = root / spec
+        return parse_spec(path.read_text(encoding='utf-8'), path.suffix) if path.exists() else None
+    verified = git(root, 'rev-parse', '--verify', f"{revision}^{{commit}}")
+    if verified.returncode != 0:
+        print(f"❌ Cannot read revision {revision!r}: {verified.stderr.strip()}", file=sys.stderr)
+        print("   In a shallow clone, fetch it first, e.g. git fetch --depth=1 origin <branch>", file=sys.stderr)
+        sys.exit(1)
+    if git(root, 'cat-file', '-e', f"{revision}:{spec}").returncode != 0:
+        return None
+    result = git(root, 'show', f"{revision}:{spec}")
+    if result.returncode != 0:
+        print(f"❌ git show {revision}:{spec} failed: {result.stderr.strip()}", file=sys.stderr)
+        sys.exit(1)
+    return parse_spec(result.stdout, Path(spec).suffix)
+
+
+def affected_pages(root: Path, spec: str, diff: SpecDiff) -> Tuple[List[str], List[str], List[str]]:
+    """Return (pages documenting changed operations, pages documenting removed operations, added operations that
+    have no page yet)."""
+    changed: Set[str] = set(diff.changed)
+    removed: Set[str] = set(diff.removed)
+    regenerate, delete = [], []
+    documented = set()
+    for page in find_api_pages(root, spec):
+        label = operation_label(page.api_path, page.method)
+        documented.add(label)
+        if label in changed:
+            regenerate.append(page.path)
+        elif label in removed:
+            delete.append(page.path)
+    missing = [label for label in diff.added if label not in documented]
+    return sorted(regenerate), sorted(delete), missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Structural diff of an OpenAPI spec between two revisions')
+    parser.add_argument('spec', help='Spec file, relative to the repository root')
+    parser.add_argument('--base', default='HEAD', help='Base revision (default: HEAD)')
+    parser.add_argument('--head', help='Head revision (default: the working tree)')
+    parser.add_argument('--root-dir', default=str(Path(__file__).parent.parent),
+                        help='Repository root (default: parent of the scripts directory)')
+    parser.add_argument('--fail-on-breaking', action='store_true', help='Exit with an error if anything breaks')
+
+    args = parser.parse_args()
+
+    root = Path(args.root_dir)
+    spec = args.spec.removeprefix('./').lstrip('/')
+    old = read_revision(root, spec, args.base) or {'paths': {}}
+    new = read_revision(root, spec, args.head) or {'paths': {}}
+
+    diff = SpecComparer(old, new).diff()
+    head_label = args.head or 'working tree'
+    print(f"🔍 {spec}: {args.base} → {head_label}")
+
+    if not (diff.added or diff.removed or diff.changed or diff.schemas_added or diff.schemas_removed
+            or diff.schemas_changed):
+        print("✅ No structural changes")
+        return
+
+    for label in diff.added:
+        print(f"  ➕ {label}")
+    for label in diff.removed:
+        print(f"  ➖ {label} 💥")
+    for label, changes in diff.changed.items():
+        print(f"  ✏️  {label}")
+        for change in changes:
+            print(f"      {change.location}: {change.message}{' 💥' if change.breaking else ''}")
+
+    if diff.schemas_added or diff.schemas_removed or diff.schemas_changed:
+        print("\n📦 Component schemas")
+        for name in diff.schemas_added:
+            print(f"  ➕ {name}")
+        for name in diff.schemas_removed:
+            print(f"  ➖ {name}")
+        for name in diff.schemas_changed:
+            print(f"  ✏️  {name}")
+
+    regenerate, delete, missing = affected_pages(root, spec, diff)
+    if regenerate or delete or missing:
+        print("\n📄 Reference pages")
+        for page in regenerate:
+            print(f"  🔄 {page} (regenerate)")
+        for page in delete:
+            print(f"  🗑️  {page} (operation removed)")
+        for label in missing:
+            print(f"  🆕 {label} has no page yet (see generate-api-pages.py)")
+
+    breaking = diff.breaking
+    print("-" * 60)
+    print(f"📊 {len(diff.added)} added, {len(diff.removed)} removed, {len(diff.changed)} changed operation(s); "
+          f"{len(breaking)} breaking change(s)")
+    if breaking and args.fail_on_breaking:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
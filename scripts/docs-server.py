@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Local redirect and link-check stand-in for the hosted docs site.
+
+This script:
+1. Serves every page at its docs.json path and every image at its file path, over plain asyncio HTTP
+2. Applies the docs.json redirects one hop at a time, like the docs platform (or pre-flattened with --flatten)
+3. Crawls every internal link found in the pages with concurrent keep-alive connections
+4. Reports 404s, redirect hop counts and request throughput, and exits non-zero on broken links
+
+Usage:
+    python scripts/docs-server.py serve [--port 8000] [--flatten]
+    python scripts/docs-server.py crawl [--url http://127.0.0.1:8000] [--concurrency 32] [--flatten] [--verbose]
+
+Example:
+    python scripts/docs-server.py crawl
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from collections import Counter, OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import quote, unquote, urlsplit
+
+from file_discovery import discover_files
+from page_content import page_url, split_internal_link, strip_code_blocks
+from redirect_table import RedirectTable, compile_redirect_table, normalize_path, raw_redirect_table
+from script_loader import load_script
+
+resolve_chains = load_script('resolve-redirect-chains.py')
+update_links = load_script('update-links.py')
+
+REDIRECT_STATUSES = {301, 302, 307, 308}
+MAX_REDIRECT_HOPS = 10
+# Upper bound on the bytes of cached responses; the least recently served are dropped first
+RESPONSE_CACHE_BYTES = 64 * 1024 * 1024
+
+CONTENT_TYPES = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.svg': 'image/svg+xml',
+    '.webp': 'image/webp',
+    '.avif': 'image/avif',
+    '.ico': 'image/x-icon',
+    '.mp4': 'video/mp4',
+    '.webm': 'video/webm',
+    '.mov': 'video/quicktime',
+}
+
+
+class DocsSite:
+    """
+    The pages, assets and redirects of the documentation tree, with an LRU cache of HTTP responses. Responses for
+    files are keyed on the file's modification time, so edits are served without restarting.
+    """
+
+    def __init__(self, root_dir: str, docs_file: str, flatten: bool = False):
+        self.root = Path(root_dir)
+        self.flatten = flatten
+        docs = resolve_chains.load_docs_json(docs_file)
+        redirects = docs.get('redirects', [])
+        self.redirects: RedirectTable = compile_redirect_table(redirects) if flatten else raw_redirect_table(redirects)
+
+        discovered = discover_files(root_dir)
+        self.pages: Dict[str, str] = {page_url(page): page for page in discovered.pages_with_extension('.mdx')}
+        self.assets: Dict[str, str] = {'/' + asset: asset for asset in discovered.assets}
+        self._responses: 'OrderedDict[Tuple[str, bool], Tuple[Optional[int], bytes]]' = OrderedDict()
+        self._cached_bytes = 0
+
+    def source_file(self, path: str) -> Optional[Path]:
+        """The page or asset file a request path serves, if any."""
+        clean_path = normalize_path(path) or '/'
+        source = self.pages.get(clean_path) or self.assets.get(clean_path)
+        return self.root / source if source is not None else None
+
+    def route(self, path: str) -> Tuple[int, Dict[str, str], bytes]:
+        """Resolve a request path to (status, headers, body)."""
+        clean_path = normalize_path(path) or '/'
+
+        page = self.pages.get(clean_path)
+        if page is not None:
+            body = (self.root / page).read_bytes()
+            return 200, {'Content-Type': 'text/markdown; charset=utf-8'}, body
+
+        asset = self.assets.get(clean_path)
+        if asset is not None:
+            content_type = CONTENT_TYPES.get(Path(asset).suffix.lower(), 'application/octet-stream')
+            return 200, {'Content-Type': content_type}, (self.root / asset).read_bytes()
+
+        destination = self.redirects.lookup(clean_path) if self.flatten else self.redirects.next_hop(clean_path)
+        if destination is not None:
+            return 301, {'Location': quote(destination, safe="/:@-._~!$&'()*+,;=#?")}, b''
+
+        return 404, {'Content-Type': 'text/plain; charset=utf-8'}, b'Not Found'
+
+    def response(self, path: str, keep_alive: bool) -> bytes:
+        """Return the full HTTP response for a path, served from memory until its file changes."""
+        key = (path, keep_alive)
+        source = self.source_file(path)
+        mtime = source.stat().st_mtime_ns if source is not None else None
+        cached = self._responses.get(key)
+        if cached is not None and cached[0] == mtime:
+            self._responses.move_to_end(key)
+            return cached[1]
+
+        response = http_response(*self.route(path), keep_alive)
+        if cached is not None:
+            self._cached_bytes -= len(cached[1])
+        self._responses[key] = (mtime, response)
+        self._responses.move_to_end(key)
+        self._cached_bytes += len(response)
+        while self._cached_bytes > RESPONSE_CACHE_BYTES:
+            _, (_, evicted) = self._responses.popitem(last=False)
+            self._cached_bytes -= len(evicted)
+        return response
+
+
+def http_response(status: int, headers: Dict[str, str], body: bytes, keep_alive: bool) -> bytes:
+    """Serialize a complete HTTP/1.1 response."""
+    reason = {200: 'OK', 204: 'No Content', 301: 'Moved Permanently', 404: 'Not Found'}[status]
+    head = [f"HTTP/1.1 {status} {reason}", f"Content-Length: {len(body)}"]
+    head.extend(f"{name}: {value}" for name, value in headers.items())
+    head.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+    return ('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body
+
+
+async def handle_connection(site: DocsSite, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """Serve HTTP/1.1 requests on one connection until the client closes it."""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+
+            parts = request_line.decode('latin-1').split()
+            keep_alive = len(parts) == 3 and parts[2] == 'HTTP/1.1'
+            while True:
+                header = await reader.readline()
+                if header in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = header.decode('latin-1').partition(':')
+                if name.strip().lower() == 'connection':
+                    keep_alive = value.strip().lower() == 'keep-alive'
+
+            if len(parts) < 2:
+                break
+
+            path = unquote(urlsplit(parts[1]).path)
+            response = site.response(path, keep_alive)
+            if asyncio.iscoroutine(response):
+                # Sites may answer some requests asynchronously, such as long polls
+                response = await response
+            if parts[0] == 'HEAD':
+                response = response.split(b'\r\n\r\n', 1)[0] + b'\r\n\r\n'
+            writer.write(response)
+            await writer.drain()
+
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_server(site: DocsSite, host: str, port: int) -> asyncio.AbstractServer:
+    """Start the stand-in server."""
+    return await asyncio.start_server(lambda r, w: handle_connection(site, r, w), host, port)
+
+
+class HttpConnection:
+    """A minimal keep-alive HTTP/1.1 client connection."""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def get(self, path: str) -> Tuple[int, Dict[str, str], bytes]:
+        """Send a GET request, reconnecting once if the server closed the connection."""
+        for attempt in range(2):
+            if self.writer is None:
+                self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+            try:
+                return await self._request(path)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                self.close()
+                if attempt:
+                    raise
+        raise ConnectionError(f"Request failed: {path}")
+
+    async def _request(self, path: str) -> Tuple[int, Dict[str, str], bytes]:
+        request = f"GET {quote(path, safe='/:@-._~!$&()*+,;=')} HTTP/1.1\r\nHost: {self.host}\r\n\r\n"
+        self.writer.write(request.encode('latin-1'))
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("Connection closed by server")
+        status = int(status_line.split()[1])
+
+        headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        body = await self.reader.readexactly(int(headers.get('content-length', '0')))
+        if headers.get('connection', '').lower() == 'close':
+            self.close()
+        return status, headers, body
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+@dataclass
+class LinkResult:
+    """The outcome of requesting one internal URL and following its redirects."""
+    path: str
+    status: int
+    hops: int
+    final_path: str
+
+
+@dataclass
+class CrawlReport:
+    """Everything the crawler learned about the site."""
+    pages: int = 0
+    requests: int = 0
+    elapsed: float = 0.0
+    results: Dict[str, LinkResult] = field(default_factory=dict)
+    referrers: Dict[str, Set[str]] = field(default_factory=lambda: defaultdict(set))
+
+    @property
+    def broken(self) -> List[LinkResult]:
+        return sorted((r for r in self.results.values() if r.status != 200), key=lambda r: r.path)
+
+    @property
+    def redirected(self) -> List[LinkResult]:
+        return sorted((r for r in self.results.values() if r.hops > 0), key=lambda r: r.path)
+
+
+def extract_internal_links(content: str) -> Set[str]:
+    """Return the internal link targets of a page, ignoring code blocks and fragments."""
+    targets = set()
+    for _, _, url in update_links.extract_links(strip_code_blocks(content)):
+        link = split_internal_link(url)
+        if link and link[0]:
+            targets.add(link[0])
+    return targets
+
+
+async def crawl(host: str, port: int, seed_pages: List[str], concurrency: int) -> CrawlReport:
+    """Fetch every seed page, then request every internal link they contain, following redirects."""
+    report = CrawlReport(pages=len(seed_pages))
+    queue: asyncio.Queue = asyncio.Queue()
+    queued: Set[str] = set()
+
+    for page in seed_pages:
+        queued.add(page)
+        queue.put_nowait((page, True))
+
+    async def check(connection: HttpConnection, path: str, extract: bool) -> None:
+        current = path
+        hops = 0
+        while True:
+            status, headers, body = await connection.get(current)
+            report.requests += 1
+            if status not in REDIRECT_STATUSES or hops >= MAX_REDIRECT_HOPS:
+                break
+            location = unquote(headers.get('location', ''))
+            if split_internal_link(location) is None:
+                # Redirects off-site count as resolved
+                status = 200
+                break
+            current = split_internal_link(location)[0] or '/'
+            hops += 1
+
+        report.results[path] = LinkResult(path, status, hops, current)
+
+        if extract and status == 200:
+            for target in extract_internal_links(body.decode('utf-8', errors='replace')):
+                report.referrers[target].add(path)
+                if target not in queued:
+                    queued.add(target)
+                    queue.put_nowait((target, False))
+
+    async def worker() -> None:
+        connection = HttpConnection(host, port)
+        try:
+            while True:
+                path, extract = await queue.get()
+                try:
+                    await check(connection, path, extract)
+                except Exception as e:
+                    print(f"❌ Error requesting {path}: {e}")
+                    report.results[path] = LinkResult(path, 0, 0, path)
+                finally:
+                    queue.task_done()
+        finally:
+            connection.close()
+
+    start = time.perf_counter()
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    await queue.join()
+    report.elapsed = time.perf_counter() - start
+    for task in workers:
+        task.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+
+    return report
+
+
+def print_report(report: CrawlReport, verbose: bool) -> None:
+    """Print the crawl summary, broken links and redirect hop counts."""
+    rate = report.requests / report.elapsed if report.elapsed else 0
+    hop_counts = Counter(result.hops for result in report.results.values())
+
+    print()
+    print("📊 Summary:")
+    print(f"  Pages crawled: {report.pages}")
+    print(f"  Unique URLs checked: {len(report.results)}")
+    print(f"  Requests: {report.requests} in {report.elapsed:.2f}s ({rate:,.0f} req/s)")
+    print(f"  Redirected links: {len(report.redirected)}")
+    for hops in sorted(hop_counts):
+        if hops:
+            print(f"    {hops} hop(s): {hop_counts[hops]}")
+    print(f"  Broken links: {len(report.broken)}")
+
+    if verbose and report.redirected:
+        print()
+        print("🔀 Redirected links:")
+        for result in report.redirected:
+            print(f"  {result.path} → {result.final_path} ({result.hops} hop(s))")
+
+    if report.broken:
+        print()
+        print("❌ Broken links:")
+        for result in report.broken:
+            suffix = f" (via {result.final_path})" if result.final_path != result.path else ""
+            print(f"  {result.path} [{result.status or 'error'}]{suffix}")
+            for referrer in sorted(report.referrers.get(result.path, ())):
+                print(f"      linked from {referrer}")
+
+
+async def run_crawl(args, site: DocsSite) -> CrawlReport:
+    """Crawl an already-running server, or start one in-process on an ephemeral port."""
+    server = None
+    if args.url:
+        parsed = urlsplit(args.url)
+        host, port = parsed.hostname or '127.0.0.1', parsed.port or 80
+    else:
+        server = await start_server(site, '127.0.0.1', 0)
+        host, port = server.sockets[0].getsockname()[:2]
+
+    print(f"🕷️  Crawling http://{host}:{port} with {args.concurrency} connections...")
+    try:
+        return await crawl(host, port, sorted(site.pages), args.concurrency)
+    finally:
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
+
+async def run_server(args, site: DocsSite) -> None:
+    """Serve the site until interrupted."""
+    server = await start_server(site, args.host, args.port)
+    print(f"🚀 Serving {len(site.pages)} pages, {len(site.assets)} assets and "
+          f"{len(site.redirects)} redirects on http://{args.host}:{args.port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Serve the docs tree locally and crawl it for broken links and redirect hops')
+    parser.add_argument('command', choices=['serve', 'crawl'], help='Start the server or crawl the site')
+    parser.add_argument('--root-dir', default=str(Path(__file__).parent.parent),
+                        help='Repository root (default: parent of the scripts directory)')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to bind the server to (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8000, help='Port to bind the server to (default: 8000)')
+    parser.add_argument('--url', help='Crawl an already-running server instead of starting one in-process')
+    parser.add_argument('--concurrency', type=int, default=32,
+                        help='Number of concurrent crawler connections (default: 32)')
+    parser.add_argument('--flatten', action='store_true',
+                        help='Serve pre-flattened redirects instead of one hop at a time')
+    parser.add_argument('--verbose', '-v', action='store_true', help='List every redirected link')
+
+    args = parser.parse_args()
+
+    docs_file = Path(args.root_dir) / 'docs.json'
+    if not docs_file.exists():
+        print(f"Error: docs.json not found at {docs_file}")
+        sys.exit(1)
+
+    site = DocsSite(args.root_dir, str(docs_file), flatten=args.flatten)
+
+    if args.command == 'serve':
+        try:
+            asyncio.run(run_server(args, site))
+        except KeyboardInterrupt:
+            print("\n👋 Server stopped")
+        return
+
+    report = asyncio.run(run_crawl(args, site))
+    print_report(report, args.verbose)
+    sys.exit(1 if report.broken else 0)
+
+
+if __name__ == '__main__':
+    main()
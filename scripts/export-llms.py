@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Export the documentation as llms.txt and llms-full.txt files, one pair per product tab.
+
+This script:
+1. Walks each tab of the docs.json navigation (General, Container Engine, Transcription, ...) in sidebar order
+2. Writes <tab>/llms.txt: the tab's pages as links with their descriptions, under their navigation groups
+3. Writes <tab>/llms-full.txt: the content of every page of the tab, one page at a time, with the frontmatter and
+   JSX removed (component titles, captions and images are kept as markdown) and every link made absolute
+4. Writes a top-level llms.txt that links to each tab's files
+5. Rebuilds only the tabs whose pages, navigation or settings changed since the last export, recorded in
+   build/cache/llms.json
+
+Pages are streamed to disk as they are converted, so memory use does not grow with the size of the docs.
+
+Usage:
+    python scripts/export-llms.py [--tab NAME ...] [--base-url URL] [--output-dir build/llms] [--full]
+
+Example:
+    python scripts/export-llms.py --tab "Container Engine" --tab Transcription
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from mdx_render import TAG_PATTERN, parse_attributes
+from page_content import mask_code_blocks, page_url, parse_frontmatter, split_internal_link
+from script_loader import load_script
+
+navigation_tree = load_script('navigation-tree.py')
+
+# Bump when the output format changes, so every tab is exported again
+EXPORT_VERSION = 1
+DEFAULT_CACHE_FILE = 'build/cache/llms.json'
+DEFAULT_BASE_URL = 'https://docs.salad.com'
+
+# Components whose title is content: it is kept as a bold line where the component opens
+TITLED_COMPONENTS = {'Tab', 'Step', 'Accordion', 'Expandable', 'Update', 'Card', 'ParamField', 'ResponseField'}
+CALLOUTS = {'Note', 'Tip', 'Warning', 'Info', 'Check', 'Danger'}
+
+LINK_PATTERN = re.compile(r'(!?\[[^\[\]]*\]\()([^)\s]+)((?:\s+"[^"\n]*")?\))')
+IMPORT_PATTERN = re.compile(r'^(?:import|export)\s.*$', re.MULTILINE)
+COMMENT_PATTERN = re.compile(r'<!--.*?-->|\{/\*.*?\*/\}', re.DOTALL)
+
+
+def slugify(text: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+def tab_sections(tab: dict) -> List[Tuple[str, List[str]]]:
+    """(section title, pages) for a tab in sidebar order; nested groups are titled 'Group > Subgroup'."""
+    sections: List[Tuple[str, List[str]]] = []
+
+    def walk(node: object, path: List[str]) -> None:
+        if isinstance(node, str):
+            title = ' > '.join(path)
+            if not sections or sections[-1][0] != title:
+                sections.append((title, []))
+            sections[-1][1].append(f"{node.lstrip('/')}.mdx")
+        elif isinstance(node, list):
+            for child in node:
+                walk(child, path)
+        elif isinstance(node, dict):
+            name = next((node[key] for key in navigation_tree.CONTAINER_KEYS if key in node), None)
+            for key in navigation_tree.CHILD_KEYS:
+                if key in node:
+                    walk(node[key], path + [name] if name and 'tab' not in node else path)
+
+    walk(tab, [])
+    return sections
+
+
+def absolute_url(url: str, page: str, base_url: str) -> str:
+    """Make an internal link absolute; external links are returned unchanged."""
+    link = split_internal_link(url)
+    if link is None:
+        return url
+    path, fragment = link
+    if not path:
+        path = page_url(page)
+    return f"{base_url}{path}" + (f"#{fragment}" if fragment else '')
+
+
+def replace_tag(match: re.Match, page: str, base_url: str) -> str:
+    """The markdown that stands in for a JSX or HTML tag: its meaningful attributes, or nothing."""
+    closing, name, attribute_text, _ = match.groups()
+    if closing:
+        return ''
+    attributes = parse_attributes(attribute_text or '')
+
+    def text(key: str) -> Optional[str]:
+        value = attributes.get(key)
+        return value.strip() if isinstance(value, str) and value.strip() else None
+
+    if name == 'img' and text('src'):
+        return f"![{text('alt') or ''}]({absolute_url(text('src'), page, base_url)})"
+    if name in ('iframe', 'video') and text('src'):
+        return f"[{text('title') or 'Video'}]({absolute_url(text('src'), page, base_url)})"
+    if name == 'br':
+        return '\n'
+    if name == 'Frame' and text('caption'):
+        return f"*{text('caption')}*\n"
+    if name in CALLOUTS:
+        return f"**{name}:** "
+    if name in TITLED_COMPONENTS and (text('title') or text('name')):
+        title = text('title') or text('name')
+        if text('href'):
+            return f"**[{title}]({absolute_url(text('href'), page, base_url)})**\n\n"
+        return f"**{title}**\n\n"
+    return ''
+
+
+def clean_body(body: str, page: str, base_url: str) -> str:
+    """Page body as plain markdown: no imports, comments or JSX, with absolute links. Code blocks are kept."""
+    masked = mask_code_blocks(body)
+    replacements: List[Tuple[int, int, str]] = []
+    for pattern in (IMPORT_PATTERN, COMMENT_PATTERN):
+        replacements.extend((m.start(), m.end(), '') for m in pattern.finditer(masked))
+    replacements.extend((m.start(), m.end(), replace_tag(m, page, base_url)) for m in TAG_PATTERN.finditer(masked))
+    replacements.extend((m.start(2), m.end(2), absolute_url(m.group(2), page, base_url))
+                        for m in LINK_PATTERN.finditer(masked))
+
+    # Apply from the end so earlier offsets stay valid; skip anything inside a span already replaced
+    output = []
+    position = len(body)
+    for start, end, replacement in sorted(replacements, key=lambda item: (item[0], item[1]), reverse=True):
+        if end > position:
+            continue
+        output.append(body[end:position])
+        output.append(replacement)
+        position = start
+    output.append(body[:position])
+    text = ''.join(reversed(output))
+
+    # Lines emptied of their tags leave whitespace behind
+    text = re.sub(r'[ \t]+$', '', text, flags=re.MULTILINE)
+    return re.sub(r'\n{3,}', '\n\n', text).strip()
+
+
+def page_document(root: Path, page: str, base_url: str) -> Tuple[str, str, str]:
+    """(title, description, cleaned markdown) of a page."""
+    frontmatter, body, _ = parse_frontmatter((root / page).read_text(encoding='utf-8'))
+    title = str(frontmatter.get('title') or Path(page).stem)
+    description = str(frontmatter.get('description') or '')
+    text = clean_body(body, page, base_url)
+    openapi = frontmatter.get('openapi')
+    if isinstance(openapi, str) and not text:
+        spec, method, path = (openapi.split() + ['', ''])[:3]
+        text = f"API operation `{method.upper()} {path}` from `{spec}`."
+    return title, description, text
+
+
+def tab_hash(root: Path, tab: dict, base_url: str) -> str:
+    """Hash of everything a tab's export is made from."""
+    digest = hashlib.sha256(f"{EXPORT_VERSION}\0{base_url}\0{json.dumps(tab, sort_keys=True)}".encode('utf-8'))
+    for _, pages in tab_sections(tab):
+        for page in pages:
+            path = root / page
+            digest.update(page.encode('utf-8') + b'\0')
+            digest.update(path.read_bytes() if path.is_file() else b'\0missing')
+    return digest.hexdigest()
+
+
+def export_tab(root: Path, tab: dict, output_dir: Path, base_url: str) -> int:
+    """Write a tab's llms.txt and llms-full.txt, one page at a time. Returns the number of pages written."""
+    name = tab.get('tab', '')
+    output_dir.mkdir(parents=True, exist_ok=True)
+    index_path, full_path = output_dir / 'llms.txt', output_dir / 'llms-full.txt'
+    count = 0
+    with open(f"{index_path}.tmp", 'w', encoding='utf-8') as index, \
+            open(f"{full_path}.tmp", 'w', encoding='utf-8') as full:
+        index.write(f"# SaladCloud {name}\n\n> The {name} section of the SaladCloud documentation.\n")
+        full.write(f"# SaladCloud {name}\n")
+        for section, pages in tab_sections(tab):
+            if section:
+                index.write(f"\n## {section}\n\n")
+            for page in pages:
+                if not (root / page).is_file():
+                    print(f"⚠️  {page} is in the navigation but does not exist")
+                    continue
+                title, description, text = page_document(root, page, base_url)
+                url = base_url + page_url(page)
+                index.write(f"- [{title}]({url})" + (f": {description}" if description else '') + '\n')
+                full.write(f"\n---\n\n# {title}\n\nSource: {url}\n\n")
+                if description:
+                    full.write(f"> {description}\n\n")
+                full.write(text + '\n')
+                count += 1
+    os.replace(f"{index_path}.tmp", index_path)
+    os.replace(f"{full_path}.tmp", full_path)
+    return count
+
+
+def load_cache(cache_path: Path) -> Dict[str, str]:
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data['tabs'] if data.get('version') == EXPORT_VERSION else {}
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export the docs as llms.txt and llms-full.txt per product tab')
+    parser.add_argument('--tab', action='append', help='Only export this navigation tab (repeatable)')
+    parser.add_argument('--root-dir', default=str(Path(__file__).parent.parent),
+                        help='Repository root (default: parent of the scripts directory)')
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL, help=f'Site URL (default: {DEFAULT_BASE_URL})')
+    parser.add_argument('--output-dir', default='build/llms', help='Where to write the files (default: build/llms)')
+    parser.add_argument('--full', action='store_true', help='Export every tab, even if nothing changed')
+
+    args = parser.parse_args()
+
+    root = Path(args.root_dir)
+    base_url = args.base_url.rstrip('/')
+    output_dir = root / args.output_dir
+    with open(root / 'docs.json', 'r', encoding='utf-8') as f:
+        tabs = json.load(f).get('navigation', {}).get('tabs', [])
+    if args.tab:
+        unknown = set(args.tab) - {tab.get('tab') for tab in tabs}
+        if unknown:
+            names = ', '.join(tab.get('tab') for tab in tabs)
+            print(f"❌ No such tab(s): {', '.join(sorted(unknown))}. Tabs: {names}")
+            sys.exit(1)
+        tabs = [tab for tab in tabs if tab.get('tab') in args.tab]
+
+    cache_path = root / DEFAULT_CACHE_FILE
+    cache = {} if args.full else load_cache(cache_path)
+    for tab in tabs:
+        name = tab.get('tab', '')
+        slug = slugify(name)
+        digest = tab_hash(root, tab, base_url)
+        tab_dir = output_dir / slug
+        if cache.get(slug) == digest and (tab_dir / 'llms-full.txt').exists():
+            print(f"⏭️  {name}: unchanged")
+            continue
+        count = export_tab(root, tab, tab_dir, base_url)
+        size = (tab_dir / 'llms-full.txt').stat().st_size
+        print(f"✅ {name}: {count} page(s), llms-full.txt {size:,} bytes")
+        cache[slug] = digest
+
+    # The top-level index lists every exported tab, including ones exported by earlier runs
+    lines = ['# SaladCloud Documentation', '',
+             '> Documentation for SaladCloud, a distributed GPU cloud, split by product.', '']
+    with open(root / 'docs.json', 'r', encoding='utf-8') as f:
+        for tab in json.load(f).get('navigation', {}).get('tabs', []):
+            slug = slugify(tab.get('tab', ''))
+            if (output_dir / slug / 'llms.txt').exists():
+                lines.append(f"- [{tab['tab']}]({base_url}/llms/{slug}/llms.txt): page index; full text in "
+                             f"{base_url}/llms/{slug}/llms-full.txt")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / 'llms.txt').write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': EXPORT_VERSION, 'tabs': cache}, f, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Export the docs.json redirects for static hosting.
+
+This script:
+1. Flattens the redirects in docs.json so every source points at its final destination
+2. Writes an nginx `map` file (redirects.map)
+3. Writes a Netlify / Cloudflare Pages style `_redirects` file
+4. Writes a compact, sorted JSON lookup table (redirects.json) for a local redirect server
+
+Usage:
+    python scripts/export-redirects.py [--docs-file docs.json] [--output-dir build/redirects] [--format ...]
+
+Example:
+    python scripts/export-redirects.py --format nginx json
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import List
+
+from redirect_table import PLACEHOLDER_PATTERN, RedirectTable, compile_source_pattern, load_redirect_table
+
+FORMATS = {
+    'nginx': 'redirects.map',
+    'redirects': '_redirects',
+    'json': 'redirects.json',
+}
+
+GENERATED_HEADER = "Generated by scripts/export-redirects.py from docs.json. Do not edit by hand."
+
+
+def nginx_quote(value: str) -> str:
+    """Quote an nginx map key or value if it contains characters nginx would treat as syntax."""
+    if re.search(r'[\s;{}#"\'\\$]', value):
+        return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+    return value
+
+
+def nginx_pattern(source: str, destination: str) -> str:
+    """Convert a wildcard redirect into an nginx regex map entry."""
+    # PCRE accepts the same (?P<name>...) groups as Python
+    regex = compile_source_pattern(source).pattern
+    value = PLACEHOLDER_PATTERN.sub(lambda m: '$' + (m.group(1) or 'splat'), destination)
+    return f"    ~^{regex}$ {value};"
+
+
+def render_nginx_map(table: RedirectTable, variable: str) -> str:
+    """Render the redirect table as an nginx map block."""
+    longest_key = max((len(source) for source in table.exact), default=0)
+    bucket_size = 64
+    while bucket_size < longest_key + 32:
+        bucket_size *= 2
+
+    lines = [
+        f"# {GENERATED_HEADER}",
+        "#",
+        "# In the http block:",
+        f"#   map_hash_bucket_size {bucket_size};",
+        f"#   map_hash_max_size {max(2048, len(table.exact) * 2)};",
+        "#   include redirects.map;",
+        "# In the server block:",
+        f"#   if (${variable}) {{ return 301 ${variable}; }}",
+        f"map $uri ${variable} {{",
+        '    default "";',
+    ]
+    for source in sorted(table.exact):
+        lines.append(f"    {nginx_quote(source)} {nginx_quote(table.exact[source])};")
+        # nginx keeps the trailing slash in $uri
+        if source != '/':
+            lines.append(f"    {nginx_quote(source + '/')} {nginx_quote(table.exact[source])};")
+    for pattern in table.patterns:
+        lines.append(nginx_pattern(pattern.source, pattern.destination))
+    lines.append("}")
+    return '\n'.join(lines) + '\n'
+
+
+def render_redirects_file(table: RedirectTable, status: int) -> str:
+    """Render the redirect table in `_redirects` format. Exact rules come first because matching is first-wins."""
+    def splat(path: str) -> str:
+        return PLACEHOLDER_PATTERN.sub(lambda m: '*' if (m.group(2) or not m.group(1)) else m.group(0), path)
+
+    def splat_destination(path: str) -> str:
+        return PLACEHOLDER_PATTERN.sub(lambda m: ':splat' if (m.group(2) or not m.group(1)) else m.group(0), path)
+
+    lines = [f"# {GENERATED_HEADER}"]
+    for source in sorted(table.exact):
+        lines.append(f"{source} {table.exact[source]} {status}")
+    for pattern in table.patterns:
+        lines.append(f"{splat(pattern.source)} {splat_destination(pattern.destination)} {status}")
+    return '\n'.join(lines) + '\n'
+
+
+def render_lookup_json(table: RedirectTable) -> str:
+    """Render the compact JSON lookup table."""
+    return json.dumps(table.to_lookup_json(), separators=(',', ':'), ensure_ascii=False) + '\n'
+
+
+def export_redirects(docs_file: Path, output_dir: Path, formats: List[str],
+                     status: int, variable: str) -> RedirectTable:
+    """Compile the redirect table and write every requested output format."""
+    table = load_redirect_table(str(docs_file))
+
+    renderers = {
+        'nginx': lambda: render_nginx_map(table, variable),
+        'redirects': lambda: render_redirects_file(table, status),
+        'json': lambda: render_lookup_json(table),
+    }
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for fmt in formats:
+        output_path = output_dir / FORMATS[fmt]
+        content = renderers[fmt]()
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        print(f"✅ Wrote {output_path} ({len(content.encode('utf-8')):,} bytes)")
+
+    return table
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Export docs.json redirects as nginx, _redirects and JSON lookup tables')
+    parser.add_argument('--docs-file', default='docs.json',
+                        help='Path to docs.json file (default: docs.json)')
+    parser.add_argument('--output-dir', default='build/redirects',
+                        help='Directory to write the exported files to (default: build/redirects)')
+    parser.add_argument('--format', nargs='+', choices=sorted(FORMATS), default=sorted(FORMATS),
+                        dest='formats', help='Output formats (default: all)')
+    parser.add_argument('--status', type=int, default=301,
+                        help='HTTP status code for the _redirects file (default: 301)')
+    parser.add_argument('--nginx-variable', default='docs_redirect',
+                        help='Name of the nginx map variable (default: docs_redirect)')
+
+    args = parser.parse_args()
+
+    # Resolve relative paths against the repository root
+    repo_root = Path(__file__).parent.parent
+    docs_file = Path(args.docs_file)
+    if not docs_file.is_absolute():
+        docs_file = repo_root / docs_file
+    output_dir = Path(args.output_dir)
+    if not output_dir.is_absolute():
+        output_dir = repo_root / output_dir
+
+    if not docs_file.exists():
+        print(f"Error: docs.json file not found at {docs_file}")
+        sys.exit(1)
+
+    print(f"📖 Compiling redirects from {docs_file}")
+    table = export_redirects(docs_file, output_dir, args.formats, args.status, args.nginx_variable)
+
+    print()
+    print("📊 Summary:")
+    print(f"  Exact redirects: {len(table.exact)}")
+    print(f"  Wildcard redirects: {len(table.patterns)}")
+    print(f"  Chains collapsed: {table.chains_collapsed}")
+    if table.cycles:
+        print(f"  ⚠️  Circular redirects dropped: {len(table.cycles)}")
+        for source in table.cycles:
+            print(f"    - {source}")
+
+
+if __name__ == '__main__':
+    main()
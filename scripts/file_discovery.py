@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Shared file discovery for the documentation scripts.
+
+Lists every page and asset in the repository in a single pass. The file list comes from the git index
+(`git ls-files`, plus untracked files that are not ignored) when git is available, and from one pruned
+`os.scandir` walk otherwise. Excluded directories such as `node_modules` are never descended into.
+
+Usage:
+    python scripts/file_discovery.py [root_dir] [--no-git] [--benchmark]
+
+Example:
+    python scripts/file_discovery.py . --benchmark
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, List, Optional, Set, Tuple
+
+# Directories that never contain documentation content
+EXCLUDED_DIRS = {'.git', 'node_modules', '.next', 'dist', 'build', '__pycache__'}
+
+PAGE_EXTENSIONS = ('.mdx', '.md')
+ASSET_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.avif', '.ico', '.mp4', '.webm', '.mov')
+
+
+@dataclass
+class DiscoveredFiles:
+    """Pages and assets found under a root directory, as sorted POSIX paths relative to that root."""
+    root: Path
+    source: str
+    pages: List[str] = field(default_factory=list)
+    assets: List[str] = field(default_factory=list)
+
+    def pages_with_extension(self, *extensions: str) -> List[str]:
+        """Return the pages that end with one of the given extensions."""
+        return [page for page in self.pages if page.endswith(extensions)]
+
+    def page_paths(self, *extensions: str) -> List[Path]:
+        """Return pages as Path objects joined onto the root directory."""
+        pages = self.pages_with_extension(*extensions) if extensions else self.pages
+        return [self.root / page for page in pages]
+
+
+def is_excluded(relative_path: str, excluded_dirs: Set[str] = EXCLUDED_DIRS) -> bool:
+    """Check whether any directory component of a relative POSIX path is excluded."""
+    return any(part in excluded_dirs for part in relative_path.split('/')[:-1])
+
+
+def list_git_files(root_dir: str, excluded_dirs: Set[str] = EXCLUDED_DIRS) -> Optional[List[str]]:
+    """
+    List tracked and untracked-but-not-ignored files from the git index.
+    Returns None when git is unavailable or root_dir is not inside a work tree.
+    """
+    # node_modules is not in .gitignore, so tell git not to descend into it when listing untracked files
+    cmd = ['git', 'ls-files', '-z', '--cached', '--others', '--exclude-standard']
+    cmd.extend(f'--exclude={excluded_dir}/' for excluded_dir in sorted(excluded_dirs))
+
+    try:
+        result = subprocess.run(cmd, cwd=root_dir, capture_output=True)
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    if result.returncode != 0:
+        return None
+
+    files = result.stdout.decode('utf-8').split('\0')
+    # Deleted-but-not-staged files are still in the index
+    return [f for f in files if f and os.path.isfile(os.path.join(root_dir, f))]
+
+
+def walk_files(root_dir: str, excluded_dirs: Set[str] = EXCLUDED_DIRS) -> List[str]:
+    """List files with a single os.scandir walk, pruning excluded directories before descending."""
+    files = []
+    stack = ['']
+
+    while stack:
+        relative_dir = stack.pop()
+        try:
+            with os.scandir(os.path.join(root_dir, relative_dir)) as entries:
+                for entry in entries:
+                    relative_path = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in excluded_dirs:
+                            stack.append(relative_path)
+                    elif entry.is_file():
+                        files.append(relative_path)
+        except OSError as e:
+            print(f"⚠️  Could not read directory {relative_dir or root_dir}: {e}", file=sys.stderr)
+
+    return files
+
+
+def classify_files(root_dir: str, files: Iterable[str], source: str) -> DiscoveredFiles:
+    """Split a flat file list into pages and assets."""
+    discovered = DiscoveredFiles(root=Path(root_dir), source=source)
+
+    for relative_path in files:
+        lower_path = relative_path.lower()
+        if lower_path.endswith(PAGE_EXTENSIONS):
+            discovered.pages.append(relative_path)
+        elif lower_path.endswith(ASSET_EXTENSIONS):
+            discovered.assets.append(relative_path)
+
+    discovered.pages.sort()
+    discovered.assets.sort()
+    return discovered
+
+
+def list_files(root_dir: str = '.', use_git: bool = True,
+               excluded_dirs: Set[str] = EXCLUDED_DIRS) -> Tuple[List[str], str]:
+    """
+    List every file under root_dir outside excluded directories.
+    Returns (relative_paths, source) where source is 'git' or 'scandir'.
+    """
+    files = list_git_files(root_dir, excluded_dirs) if use_git else None
+    if files is not None:
+        return [f for f in files if not is_excluded(f, excluded_dirs)], 'git'
+
+    return walk_files(root_dir, excluded_dirs), 'scandir'
+
+
+def discover_files(root_dir: str = '.', use_git: bool = True,
+                   excluded_dirs: Set[str] = EXCLUDED_DIRS) -> DiscoveredFiles:
+    """Find all pages and assets under root_dir in one pass."""
+    files, source = list_files(root_dir, use_git, excluded_dirs)
+    return classify_files(root_dir, files, source)
+
+
+def legacy_glob_pages(root_dir: str) -> List[Path]:
+    """The two-pass glob discovery previously used by update-links.py, kept for benchmarking."""
+    markdown_files = []
+    root_path = Path(root_dir)
+
+    for pattern in ['**/*.md', '**/*.mdx']:
+        markdown_files.extend(root_path.glob(pattern))
+
+    return [
+        file_path for file_path in markdown_files
+        if not any(excluded_dir in file_path.parts for excluded_dir in EXCLUDED_DIRS)
+    ]
+
+
+def run_benchmark(root_dir: str, repeat: int) -> None:
+    """Compare the legacy glob discovery against git index and scandir discovery."""
+    node_modules = Path(root_dir) / 'node_modules'
+    if node_modules.is_dir():
+        print(f"📦 node_modules present: {node_modules}")
+    else:
+        print("⚠️  node_modules not installed - run `npm install` first for a representative benchmark")
+
+    candidates = [
+        ('glob (**/*.md + **/*.mdx)', lambda: legacy_glob_pages(root_dir)),
+        ('git ls-files', lambda: discover_files(root_dir).pages),
+        ('os.scandir (pruned)', lambda: discover_files(root_dir, use_git=False).pages),
+    ]
+
+    print()
+    print(f"⏱️  Best of {repeat} runs:")
+    for name, func in candidates:
+        timings = []
+        count = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            count = len(func())
+            timings.append(time.perf_counter() - start)
+        print(f"  {name:<28} {min(timings) * 1000:9.1f} ms  ({count} pages)")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='List documentation pages and assets in one pass')
+    parser.add_argument('root_dir', nargs='?', default='.',
+                        help='Repository root (default: current directory)')
+    parser.add_argument('--no-git', action='store_true',
+                        help='Skip the git index and walk the file system')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Time discovery against the legacy glob approach')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Number of benchmark runs (default: 5)')
+
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.root_dir):
+        print(f"Error: Directory {args.root_dir} does not exist")
+        sys.exit(1)
+
+    if args.benchmark:
+        run_benchmark(args.root_dir, args.repeat)
+        return
+
+    discovered = discover_files(args.root_dir, use_git=not args.no_git)
+    print(f"🔍 Discovered files using {discovered.source}")
+    print(f"📄 Pages: {len(discovered.pages)}")
+    print(f"🖼️  Assets: {len(discovered.assets)}")
+
+
+if __name__ == '__main__':
+    main()
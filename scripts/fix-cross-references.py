@@ -8,6 +8,8 @@
 import argparse
 from pathlib import Path
 
+from path_trie import PathTrie
+
 
 def create_reference_mapping():
     """Create a mapping of old /guides/ paths to new container-engine paths"""
@@ -65,59 +67,40 @@ def create_reference_mapping():
     }
 
 
-def fix_cross_references_in_file(file_path, mapping):
-    """Fix cross-references in a single file"""
+# Markdown links [text](/path...) and quoted "/path..." or '/path...' references (which covers href attributes)
+REFERENCE_PATTERN = re.compile(r'\[([^\]]*)\]\((/[^)]*)\)|"(/[^"]*)"|\'(/[^\']*)\'')
+
+
+def fix_cross_references_in_file(file_path, mapping_trie):
+    """Fix cross-references in a single file, mapping each reference through the longest matching old path"""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
 
-        original_content = content
         changes_made = []
 
-        # Sort mappings by length (longest first) to avoid partial replacements
-        sorted_mappings = sorted(
-            mapping.items(), key=lambda x: len(x[0]), reverse=True)
-
-        for old_path, new_path in sorted_mappings:
-            # Look for various forms of references
-            patterns = [
-                # Markdown links [text](path)
-                rf'\[([^\]]*)\]\({re.escape(old_path)}([^)]*)\)',
-                # Direct references in quotes
-                rf'"{re.escape(old_path)}([^"]*)"',
-                rf"'{re.escape(old_path)}([^']*)'",
-                # HTML href attributes
-                rf'href="{re.escape(old_path)}([^"]*)"',
-                rf"href='{re.escape(old_path)}([^']*)'",
-            ]
-
-            for pattern in patterns:
-                matches = list(re.finditer(pattern, content))
-                # Process in reverse to maintain positions
-                for match in reversed(matches):
-                    if pattern.startswith(r'\['):
-                        # Markdown link
-                        link_text = match.group(1)
-                        remaining_path = match.group(2)
-                        replacement = f'[{link_text}]({new_path}{remaining_path})'
-                    elif 'href=' in pattern:
-                        # HTML href
-                        remaining_path = match.group(1)
-                        quote_char = '"' if '"{' in pattern else "'"
-                        replacement = f'href={quote_char}{new_path}{remaining_path}{quote_char}'
-                    else:
-                        # Direct reference in quotes
-                        remaining_path = match.group(1)
-                        quote_char = '"' if pattern.startswith('"{') else "'"
-                        replacement = f'{quote_char}{new_path}{remaining_path}{quote_char}'
-
-                    old_match = match.group(0)
-                    content = content[:match.start()] + \
-                        replacement + content[match.end():]
-                    changes_made.append(f"  {old_match} → {replacement}")
+        def replace(match):
+            if match.group(2) is not None:
+                path = match.group(2)
+            else:
+                path = match.group(3) if match.group(3) is not None else match.group(4)
+            found = mapping_trie.longest_prefix(path)
+            if found is None:
+                return match.group(0)
+            old_path, new_path = found
+            new_reference = new_path + path[len(old_path):]
+            if match.group(2) is not None:
+                replacement = f'[{match.group(1)}]({new_reference})'
+            else:
+                quote_char = match.group(0)[0]
+                replacement = f'{quote_char}{new_reference}{quote_char}'
+            changes_made.append(f"  {match.group(0)} → {replacement}")
+            return replacement
+
+        content = REFERENCE_PATTERN.sub(replace, content)
 
         # Write back if changes were made
-        if content != original_content:
+        if changes_made:
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(content)
             return changes_made
@@ -143,6 +126,10 @@ def main():
         return 1
 
     mapping = create_reference_mapping()
+    # Old paths are prefixes, so each reference is looked up once by longest prefix instead of once per mapping
+    mapping_trie = PathTrie()
+    for old_path, new_path in mapping.items():
+        mapping_trie.insert(old_path, new_path)
     total_files_processed = 0
     total_files_changed = 0
 
@@ -179,7 +166,7 @@ def main():
                         print(f"Error reading {file_path}: {e}")
                 else:
                     # Actually make changes
-                    changes = fix_cross_references_in_file(file_path, mapping)
+                    changes = fix_cross_references_in_file(file_path, mapping_trie)
                     if changes:
                         total_files_changed += 1
                         print(f"\n✅ {file_path}")
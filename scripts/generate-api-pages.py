@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Generate API reference pages from OpenAPI specs, offline and in one process.
+
+This script:
+1. Loads each spec once (JSON or YAML)
+2. Writes one page per operation straight into the output directory, named after the operation summary and
+   containing only the `openapi: <spec> <method> <path>` frontmatter the docs platform renders the page from
+   (long values are wrapped the way prettier formats them)
+3. Leaves pages that already document an operation alone, matched on method and path wherever they are in the
+   tree and whether they point at the spec or at one of the parts split-specs.py made of it, and lists pages whose
+   operation no longer exists in the spec
+4. Prints the navigation JSON (one group per tag) to add to docs.json
+
+It replaces `npx @mintlify/scraping openapi-file` followed by moving the generated directories around, patching
+the frontmatter with sed and running prettier.
+
+Usage:
+    python scripts/generate-api-pages.py <spec> [<spec> ...] [--output-dir DIR] [--spec-ref NAME] [--dry-run]
+    python scripts/generate-api-pages.py --config scripts/endpoint-schema-configs/*.json
+
+Example:
+    python scripts/generate-api-pages.py api-specs/s4.yml --output-dir reference/s4
+
+Arguments:
+    spec: OpenAPI spec file. Unless --output-dir is given, pages go to the directory holding the spec's existing
+          pages (e.g. reference/saladcloud-api for salad-cloud.yaml), or to reference/<spec name> when it has no
+          pages yet. Unless --spec-ref is given, the frontmatter refers to the spec the way its existing pages do
+          (e.g. /api-specs/salad-cloud.yaml or s4), or by its path from the repository root (/api-specs/<file>).
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import textwrap
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from openapi_spec import ApiPage, find_api_pages, iter_operations, load_spec, split_dir
+
+PRINT_WIDTH = 120
+
+
+@dataclass
+class SpecJob:
+    """One spec to generate pages for."""
+    spec_path: Path
+    output_dir: str
+    spec_ref: str
+    group: Optional[str] = None
+
+
+@dataclass
+class GeneratedPage:
+    path: str
+    openapi: str
+    tag: Optional[str]
+
+
+@dataclass
+class GenerationResult:
+    pages: List[GeneratedPage] = field(default_factory=list)
+    written: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    stale: List[str] = field(default_factory=list)
+
+
+def slugify(text: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+def page_slug(method: str, path: str, operation: dict) -> str:
+    """Name a page after the operation summary, falling back to its operationId, then its method and path."""
+    for candidate in (operation.get('summary'), operation.get('operationId')):
+        if candidate and slugify(candidate):
+            return slugify(candidate)
+    return slugify(f"{method} {path}")
+
+
+def format_openapi_field(openapi: str) -> str:
+    """The openapi frontmatter field, wrapped onto indented lines when it is too long, as prettier does."""
+    line = f"openapi: {openapi}"
+    if len(line) <= PRINT_WIDTH:
+        return line
+    wrapped = textwrap.wrap(openapi, width=PRINT_WIDTH, initial_indent='  ', subsequent_indent='  ',
+                            break_long_words=False, break_on_hyphens=False)
+    return "openapi:\n" + '\n'.join(wrapped)
+
+
+def format_frontmatter(openapi: str) -> str:
+    return f"---\n{format_openapi_field(openapi)}\n---\n"
+
+
+def spec_source(root: Path, spec_path: Path) -> str:
+    """The spec's path relative to the repository root, as pages and split-specs.py refer to it."""
+    try:
+        return spec_path.resolve().relative_to(root.resolve()).as_posix()
+    except ValueError:
+        return spec_path.name
+
+
+def default_spec_ref(root: Path, spec_path: Path, pages: List[ApiPage]) -> str:
+    """The ref the spec's existing pages already use, or /api-specs/<file> for a spec without pages."""
+    source = spec_source(root, spec_path)
+    refs = Counter(page.spec_ref for page in pages if not page.spec_ref.startswith(f"/{split_dir(source)}/"))
+    return refs.most_common(1)[0][0] if refs else f"/{source}"
+
+
+def default_output_dir(spec_path: Path, pages: List[ApiPage]) -> str:
+    """The directory holding all of the spec's existing pages, or reference/<spec name> for a spec without pages."""
+    if pages:
+        common = Path(os.path.commonpath([Path(page.path).parent.as_posix() for page in pages])).as_posix()
+        if common not in ('', '.'):
+            return common
+    return f"reference/{spec_path.stem}"
+
+
+def existing_operations(root: Path, job: SpecJob) -> Dict[Tuple[str, str], str]:
+    """Map (method, path) to the page that already documents it, whether the page points at the spec itself, at
+    one of its split-specs.py parts or at job.spec_ref."""
+    pages = find_api_pages(root, spec_source(root, job.spec_path), [job.spec_ref])
+    return {(page.method, page.api_path): page.path for page in sorted(pages, key=lambda page: page.path)}
+
+
+def generate_pages(root: Path, job: SpecJob, dry_run: bool) -> GenerationResult:
+    """Write a page for every operation in one spec that does not have one yet."""
+    spec = load_spec(job.spec_path)
+    existing = existing_operations(root, job)
+    result = GenerationResult()
+    directory = root / job.output_dir
+    taken = {page.relative_to(root).as_posix().removesuffix('.mdx') for page in directory.glob('*.mdx')}
+
+    for path, method, operation in iter_operations(spec):
+        openapi = f"{job.spec_ref} {method} {path}"
+        tags = operation.get('tags') or []
+        tag = tags[0] if tags else None
+
+        existing_page = existing.pop((method, path), None)
+        if existing_page:
+            result.pages.append(GeneratedPage(existing_page, openapi, tag))
+            result.skipped.append(existing_page)
+            continue
+
+        base = f"{job.output_dir}/{page_slug(method, path, operation)}"
+        name = base
+        suffix = 1
+        while name in taken:
+            name = f"{base}-{suffix}"
+            suffix += 1
+        taken.add(name)
+
+        page = f"{name}.mdx"
+        result.pages.append(GeneratedPage(page, openapi, tag))
+        result.written.append(page)
+        if not dry_run:
+            target = root / page
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(format_frontmatter(openapi), encoding='utf-8')
+
+    result.stale = sorted(existing.values())
+    return result
+
+
+def navigation_groups(job: SpecJob, pages: List[GeneratedPage]) -> List[dict]:
+    """One navigation group per tag, in spec order, in the same shape as docs.json."""
+    groups: Dict[str, List[str]] = {}
+    for page in pages:
+        name = job.group or page.tag or job.spec_ref
+        groups.setdefault(name, []).append(re.sub(r'\.mdx$', '', page.path))
+    return [{'group': name, 'pages': group_pages} for name, group_pages in groups.items()]
+
+
+def jobs_from_configs(root: Path, config_files: List[str]) -> List[SpecJob]:
+    """Build jobs from endpoint schema configs (endpointId, apiDocPath), as used by add-one-endpoint."""
+    jobs = []
+    for config_file in config_files:
+        with open(config_file, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        endpoint_id = config['endpointId']
+        jobs.append(SpecJob(root / 'api-specs' / f"{endpoint_id}.json", config['apiDocPath'].strip('/'), endpoint_id))
+    return jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate API reference pages from OpenAPI specs')
+    parser.add_argument('specs', nargs='*', help='OpenAPI spec files')
+    parser.add_argument('--config', nargs='+', default=[], help='Endpoint schema config files to generate pages for')
+    parser.add_argument('--output-dir', help='Directory for the pages (only with a single spec)')
+    parser.add_argument('--spec-ref', help='How the frontmatter refers to the spec (only with a single spec; default: '
+                        'the ref its existing pages use, or /api-specs/<file>)')
+    parser.add_argument('--group', help='Navigation group name (default: the operation tags)')
+    parser.add_argument('--root-dir', default=str(Path(__file__).parent.parent),
+                        help='Repository root (default: parent of the scripts directory)')
+    parser.add_argument('--dry-run', action='store_true', help='Show the pages without writing them')
+
+    args = parser.parse_args()
+
+    root = Path(args.root_dir)
+    if not args.specs and not args.config:
+        parser.error('give at least one spec or --config file')
+    if len(args.specs) + len(args.config) > 1 and (args.output_dir or args.spec_ref):
+        parser.error('--output-dir and --spec-ref only apply to a single spec')
+
+    jobs = jobs_from_configs(root, args.config)
+    for spec in args.specs:
+        spec_path = Path(spec) if Path(spec).is_absolute() else root / spec
+        pages = [] if args.output_dir and args.spec_ref else find_api_pages(root, spec_source(root, spec_path))
+        jobs.append(SpecJob(spec_path, (args.output_dir or default_output_dir(spec_path, pages)).strip('/'),
+                            args.spec_ref or default_spec_ref(root, spec_path, pages)))
+    for job in jobs:
+        job.group = args.group
+
+    navigation = []
+    failed = False
+    for job in jobs:
+        if not job.spec_path.exists():
+            print(f"❌ Spec not found: {job.spec_path}", file=sys.stderr)
+            failed = True
+            continue
+        result = generate_pages(root, job, args.dry_run)
+        print(f"📄 {job.spec_path.name} → {job.output_dir}: {len(result.written)} page(s) written, "
+              f"{len(result.skipped)} already present", file=sys.stderr)
+        for page in result.written:
+            print(f"  ✅ {page}", file=sys.stderr)
+        for page in result.stale:
+            print(f"  ⚠️  {page} documents an operation that is no longer in the spec", file=sys.stderr)
+        navigation.extend(navigation_groups(job, result.pages))
+
+    if args.dry_run:
+        print("🔍 Dry run - no pages were written", file=sys.stderr)
+    print("Navigation for docs.json:", file=sys.stderr)
+    print(json.dumps(navigation, indent=2))
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
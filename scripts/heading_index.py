@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Heading-slug index of the documentation pages.
+
+Maps every page URL to the set of `#anchor` slugs it defines (see `page_content.page_anchors`), so `page#anchor`
+links can be validated with a set lookup. Entries are keyed by page content hash and cached in
+build/cache/heading-index.json, so pages that have not changed are not re-parsed.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+from page_content import page_anchors, page_url, parse_frontmatter, split_internal_link
+
+# Bump when the slug rules in page_content.heading_slug_variants change, so cached anchors are recomputed
+HEADING_INDEX_VERSION = 3
+DEFAULT_CACHE_FILE = 'build/cache/heading-index.json'
+
+
+def normalize_fragment(fragment: str) -> str:
+    """Normalize a link fragment for comparison with heading slugs."""
+    return unquote(fragment).lower()
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+@dataclass
+class PageAnchors:
+    """The anchors one page defines, and the hash of the content they were computed from."""
+    path: str
+    hash: str
+    anchors: Set[str]
+    generated: bool = False
+
+
+def index_page(page: str, content: str) -> 'PageAnchors':
+    """Compute the anchors of a page from its content."""
+    frontmatter, body, _ = parse_frontmatter(content)
+    # Anchors on OpenAPI pages are generated from the spec, not from the page body
+    return PageAnchors(page, content_hash(content), page_anchors(body), 'openapi' in frontmatter)
+
+
+@dataclass
+class HeadingIndex:
+    """Page URL → anchors, updated incrementally as pages are read."""
+    pages: Dict[str, PageAnchors] = field(default_factory=dict)
+    parsed: int = 0
+    reused: int = 0
+
+    def is_current(self, page: str, digest: str) -> bool:
+        """Check whether the cached anchors of a page were computed from content with this hash."""
+        entry = self.pages.get(page_url(page))
+        return entry is not None and entry.hash == digest and entry.path == page
+
+    def add(self, entry: PageAnchors) -> None:
+        """Store anchors computed elsewhere (by index_page in a worker process)."""
+        self.pages[page_url(entry.path)] = entry
+        self.parsed += 1
+
+    def update(self, page: str, content: str) -> PageAnchors:
+        """Index a page from content that has already been read. Unchanged pages reuse their cached anchors."""
+        if self.is_current(page, content_hash(content)):
+            self.reused += 1
+            return self.pages[page_url(page)]
+        entry = index_page(page, content)
+        self.add(entry)
+        return entry
+
+    def prune(self, pages: List[str]) -> None:
+        """Drop entries for pages that no longer exist."""
+        urls = {page_url(page) for page in pages}
+        for url in set(self.pages) - urls:
+            del self.pages[url]
+
+    def has_anchor(self, url: str, fragment: str) -> Optional[bool]:
+        """Check whether the page at url defines fragment. Returns None when the page or its anchors are unknown."""
+        entry = self.pages.get(url.rstrip('/') or '/')
+        if entry is None or entry.generated:
+            return None
+        return normalize_fragment(fragment) in entry.anchors
+
+    def check_link(self, source_page: str, url: str) -> Optional[bool]:
+        """
+        Check the fragment of a link found on source_page.
+        Returns False for a missing anchor, True for a valid one and None when there is nothing to check.
+        """
+        link = split_internal_link(url)
+        if link is None or not link[1]:
+            return None
+        path, fragment = link
+        return self.has_anchor(path or page_url(source_page), fragment)
+
+    def to_json(self) -> dict:
+        return {
+            'version': HEADING_INDEX_VERSION,
+            'pages': {
+                url: {'path': entry.path, 'hash': entry.hash, 'anchors': sorted(entry.anchors),
+                      'generated': entry.generated}
+                for url, entry in sorted(self.pages.items())
+            },
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'HeadingIndex':
+        index = cls()
+        if data.get('version') != HEADING_INDEX_VERSION:
+            return index
+        for url, entry in data.get('pages', {}).items():
+            index.pages[url] = PageAnchors(entry['path'], entry['hash'], set(entry['anchors']), entry['generated'])
+        return index
+
+
+def load_heading_index(cache_path: Path) -> HeadingIndex:
+    """Load a cached index, or start an empty one if there is no usable cache."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return HeadingIndex.from_json(json.load(f))
+    except (OSError, ValueError, KeyError):
+        return HeadingIndex()
+
+
+def save_heading_index(index: HeadingIndex, cache_path: Path) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(index.to_json(), f, separators=(',', ':'))
+
+
+def find_broken_anchors(index: HeadingIndex, links: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """Return the (source page, url) pairs whose `#anchor` is not defined on the target page."""
+    return [(page, url) for page, url in links if index.check_link(page, url) is False]
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Intrinsic image dimensions read from file headers.
+
+Only the header is parsed (PNG IHDR, GIF logical screen, WebP VP8/VP8L/VP8X, JPEG SOF marker), so pixels are never
+decoded. Dimensions are cached in build/cache/image-dimensions.json. An image whose path, size and modification
+time are unchanged is not even opened; otherwise it is hashed, so an image that was only touched (by a checkout, say)
+is not parsed again either.
+"""
+
+import hashlib
+import json
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Tuple
+
+IMAGE_DIMENSIONS_VERSION = 2
+DEFAULT_CACHE_FILE = 'build/cache/image-dimensions.json'
+
+# JPEG start-of-frame markers; C4 (DHT), C8 (JPG) and CC (DAC) share the range but carry no dimensions
+JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+# Markers that stand alone, without a length field
+JPEG_STANDALONE_MARKERS = {0x01, 0xD0, 0xD1, 0xD2, 0xD3, 0xD4, 0xD5, 0xD6, 0xD7, 0xD8}
+
+
+def _jpeg_size(f: BinaryIO) -> Optional[Tuple[int, int]]:
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        while byte and byte != b'\xff':
+            byte = f.read(1)
+        while byte == b'\xff':
+            byte = f.read(1)
+        if not byte:
+            return None
+        marker = byte[0]
+        if marker in JPEG_STANDALONE_MARKERS:
+            continue
+        if marker == 0xD9:
+            return None
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack('>H', length_bytes)[0]
+        if marker in JPEG_SOF_MARKERS:
+            frame = f.read(5)
+            if len(frame) < 5:
+                return None
+            height, width = struct.unpack('>xHH', frame)
+            return width, height
+        f.seek(length - 2, 1)
+
+
+def read_image_size(path: Path) -> Optional[Tuple[int, int]]:
+    """Return (width, height) of a PNG, JPEG, GIF or WebP file, or None if the format is not recognised."""
+    with open(path, 'rb') as f:
+        head = f.read(30)
+        if head.startswith(b'\x89PNG\r\n\x1a\n') and head[12:16] == b'IHDR':
+            return struct.unpack('>II', head[16:24])
+        if head[:6] in (b'GIF87a', b'GIF89a'):
+            return struct.unpack('<HH', head[6:10])
+        if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+            chunk = head[12:16]
+            if chunk == b'VP8 ' and len(head) >= 30:
+                width, height = struct.unpack('<HH', head[26:30])
+                return width & 0x3FFF, height & 0x3FFF
+            if chunk == b'VP8L' and len(head) >= 25:
+                bits = int.from_bytes(head[21:25], 'little')
+                return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+            if chunk == b'VP8X' and len(head) >= 30:
+                return int.from_bytes(head[24:27], 'little') + 1, int.from_bytes(head[27:30], 'little') + 1
+            return None
+        if head.startswith(b'\xff\xd8'):
+            return _jpeg_size(f)
+    return None
+
+
+def file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class DimensionCache:
+    """Image hash → (width, height), where None marks files whose format is not recognised, and image path →
+    (size, mtime_ns, hash) of the file when it was last hashed."""
+    sizes: Dict[str, Optional[Tuple[int, int]]] = field(default_factory=dict)
+    files: Dict[str, Tuple[int, int, str]] = field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+
+    def size_of(self, path: Path) -> Optional[Tuple[int, int]]:
+        stat = path.stat()
+        entry = self.files.get(str(path))
+        if entry and entry[:2] == (stat.st_size, stat.st_mtime_ns) and entry[2] in self.sizes:
+            self.hits += 1
+            return self.sizes[entry[2]]
+
+        key = file_hash(path)
+        self.files[str(path)] = (stat.st_size, stat.st_mtime_ns, key)
+        if key in self.sizes:
+            self.hits += 1
+            return self.sizes[key]
+        self.misses += 1
+        size = read_image_size(path)
+        self.sizes[key] = size
+        return size
+
+    def to_json(self) -> dict:
+        return {
+            'version': IMAGE_DIMENSIONS_VERSION,
+            'sizes': {key: list(size) if size else None for key, size in self.sizes.items()},
+            'files': {path: list(entry) for path, entry in self.files.items()},
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> 'DimensionCache':
+        if data.get('version') != IMAGE_DIMENSIONS_VERSION:
+            return cls()
+        return cls({key: tuple(size) if size else None for key, size in data['sizes'].items()},
+                   {path: tuple(entry) for path, entry in data['files'].items()})
+
+
+def load_dimension_cache(cache_path: Path) -> DimensionCache:
+    """Load cached dimensions, or start an empty cache if there is no usable one."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return DimensionCache.from_json(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError):
+        return DimensionCache()
+
+
+def save_dimension_cache(cache: DimensionCache, cache_path: Path) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(cache.to_json(), f, separators=(',', ':'))
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+A small MDX-to-HTML renderer for previewing pages locally.
+
+It covers the markdown the pages use (headings, paragraphs, lists, tables, block quotes, fenced code, links,
+images and emphasis) and stands in simple HTML for the Mintlify components: callouts become asides, cards become
+boxes or links, tabs and steps become titled sections, and anything else becomes a labelled div. It is a preview,
+not a replica of the hosted renderer.
+"""
+
+import html
+import re
+from typing import Dict, List, Optional, Tuple
+
+from page_content import FENCE_PATTERN, heading_slug, mask_code_blocks
+
+CALLOUTS = {'Note', 'Tip', 'Warning', 'Info', 'Check', 'Danger', 'Callout'}
+TITLED_SECTIONS = {'Tab', 'Step', 'Accordion', 'Expandable', 'Update', 'ParamField', 'ResponseField'}
+VOID_ELEMENTS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track',
+                 'wbr'}
+
+TAG_PATTERN = re.compile(r'<(/?)([A-Za-z][\w.-]*)((?:\s+(?:[^<>"\'{}]|"[^"]*"|\'[^\']*\'|\{[^{}]*\})*?)?)\s*(/?)>')
+TAG_START_PATTERN = re.compile(r'^\s*</?[A-Za-z][\w.-]*(\s|/?>|$)')
+ATTRIBUTE_PATTERN = re.compile(r'([A-Za-z_][\w:-]*)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|\{([^{}]*)\}))?')
+INLINE_PATTERN = re.compile(r'(`+)(.+?)\1|<!--.*?-->|\{/\*.*?\*/\}|' + TAG_PATTERN.pattern)
+IMPORT_PATTERN = re.compile(r'^(?:import|export)\s.*$', re.MULTILINE)
+COMMENT_PATTERN = re.compile(r'<!--.*?-->|\{/\*.*?\*/\}', re.DOTALL)
+IMPORT_SOURCE_PATTERN = re.compile(r'^import\s+(?:(\w+)\b)?.*?from\s+[\'"]([^\'"]+)[\'"]', re.MULTILINE)
+LIST_ITEM_PATTERN = re.compile(r'^(\s*)([-*+]|\d+[.)])\s+(.*)$')
+HEADING_PATTERN = re.compile(r'^\s*(#{1,6})\s+(.+?)\s*#*\s*$')
+TABLE_SEPARATOR_PATTERN = re.compile(r'^\s*\|?\s*:?-{3,}:?\s*(\|\s*:?-{3,}:?\s*)*\|?\s*$')
+
+
+def page_imports(body: str) -> List[Tuple[str, str]]:
+    """(default import name, source) for every import in a page, as written; the name is empty for named imports."""
+    return IMPORT_SOURCE_PATTERN.findall(mask_code_blocks(body))
+
+
+def parse_attributes(text: str) -> Dict[str, object]:
+    """Attributes of a tag: quoted values as strings, {expressions} as their raw text, bare names as True."""
+    attributes: Dict[str, object] = {}
+    for match in ATTRIBUTE_PATTERN.finditer(text):
+        name, double, single, expression = match.groups()
+        if double is not None or single is not None:
+            attributes[name] = double if double is not None else single
+        elif expression is not None:
+            attributes[name] = expression.strip().strip('"\'`')
+        else:
+            attributes[name] = True
+    return attributes
+
+
+def render_tag(closing: bool, name: str, attribute_text: str, self_closing: bool) -> str:
+    """The HTML that stands in for a JSX or HTML tag."""
+    if name[0].islower():
+        # Plain HTML passes through, with JSX-only spellings fixed
+        attributes = attribute_text.replace('className=', 'class=')
+        attributes = re.sub(r'=\{"([^"]*)"\}', r'="\1"', attributes)
+        attributes = re.sub(r'\s\w+=\{[^{}]*\}', '', attributes)
+        if closing:
+            return f"</{name}>"
+        return f"<{name}{attributes}{' /' if self_closing or name in VOID_ELEMENTS else ''}>" + \
+            (f"</{name}>" if self_closing and name not in VOID_ELEMENTS else '')
+
+    attributes = parse_attributes(attribute_text)
+    title = attributes.get('title') or attributes.get('name') or attributes.get('label')
+    title = title if isinstance(title, str) else ''
+    kind = name.lower()
+
+    if name in CALLOUTS:
+        if closing:
+            return '</aside>'
+        return f'<aside class="callout callout-{kind}">' + ('</aside>' if self_closing else '')
+    if name == 'Frame':
+        if closing:
+            return '</figure>'
+        caption = attributes.get('caption')
+        caption_html = f"<figcaption>{html.escape(caption)}</figcaption>" if isinstance(caption, str) else ''
+        return f'<figure class="frame">{caption_html}' + ('</figure>' if self_closing else '')
+    if name == 'Card':
+        tag = 'a' if isinstance(attributes.get('href'), str) else 'div'
+        if closing:
+            return f"</{tag}>"
+        href = f' href="{html.escape(attributes["href"])}"' if tag == 'a' else ''
+        heading = f"<strong>{html.escape(title)}</strong>" if title else ''
+        return f'<{tag} class="card"{href}>{heading}' + (f"</{tag}>" if self_closing else '')
+    if name in TITLED_SECTIONS:
+        if closing:
+            return '</section>'
+        heading = f'<div class="section-title">{html.escape(title)}</div>' if title else ''
+        return f'<section class="{kind}">{heading}' + ('</section>' if self_closing else '')
+    if name == 'Icon':
+        icon = attributes.get('icon')
+        return f'<span class="icon">[{html.escape(icon)}]</span>' if isinstance(icon, str) and not closing else ''
+    if closing:
+        return '</div>'
+    return f'<div class="component {kind}" data-component="{html.escape(name)}">' + ('</div>' if self_closing else '')
+
+
+def render_inline(text: str) -> str:
+    """Render the inline markdown of one block of text: code, tags, images, links and emphasis."""
+    output = []
+    position = 0
+    for match in INLINE_PATTERN.finditer(text):
+        output.append(render_text(text[position:match.start()]))
+        token = match.group(0)
+        if match.group(1):
+            output.append(f"<code>{html.escape(match.group(2).strip())}</code>")
+        elif token.startswith(('<!--', '{/*')):
+            pass
+        else:
+            closing, name, attribute_text, self_closing = match.group(3, 4, 5, 6)
+            output.append(render_tag(closing == '/', name, attribute_text or '', self_closing == '/'))
+        position = match.end()
+    output.append(render_text(text[position:]))
+    return ''.join(output)
+
+
+def render_text(text: str) -> str:
+    """Markdown emphasis, images and links in text that has no code or tags."""
+    text = re.sub(r'\{["\'`]([^{}]*)["\'`]\}', r'\1', text)  # {" "} and similar JSX string expressions
+    text = html.escape(text, quote=False)
+    text = re.sub(r'!\[([^\]]*)\]\(([^)\s]+)(?:\s+"[^"]*")?\)',
+                  lambda m: f'<img src="{m.group(2)}" alt="{m.group(1)}" loading="lazy" />', text)
+    text = re.sub(r'\[([^\]]+)\]\(([^)\s]+)(?:\s+"[^"]*")?\)', r'<a href="\2">\1</a>', text)
+    text = re.sub(r'&lt;(https?://[^\s&]+)&gt;', r'<a href="\1">\1</a>', text)
+    text = re.sub(r'\*\*(.+?)\*\*|__(.+?)__', lambda m: f"<strong>{m.group(1) or m.group(2)}</strong>", text)
+    text = re.sub(r'(?<![\w*])\*(?!\s)(.+?)(?<!\s)\*(?!\w)|(?<!\w)_(?!\s)(.+?)(?<!\s)_(?!\w)',
+                  lambda m: f"<em>{m.group(1) or m.group(2)}</em>", text)
+    return re.sub(r'~~(.+?)~~', r'<del>\1</del>', text)
+
+
+class BlockRenderer:
+    """Renders the block structure of a page body, line by line."""
+
+    def __init__(self):
+        self.slugs: Dict[str, int] = {}
+
+    def heading_id(self, text: str) -> str:
+        slug = heading_slug(text)
+        count = self.slugs.get(slug, 0)
+        self.slugs[slug] = count + 1
+        return slug if count == 0 else f"{slug}-{count}"
+
+    def render(self, lines: List[str]) -> str:
+        output: List[str] = []
+        paragraph: List[str] = []
+
+        def flush() -> None:
+            if paragraph:
+                output.append(f"<p>{render_inline(' '.join(line.strip() for line in paragraph))}</p>")
+                paragraph.clear()
+
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+            stripped = line.strip()
+
+            fence = FENCE_PATTERN.match(line)
+            if fence:
+                flush()
+                i = self.code_block(lines, i, fence, output)
+                continue
+            if not stripped:
+                flush()
+                i += 1
+                continue
+            heading = HEADING_PATTERN.match(line)
+            if heading:
+                flush()
+                level, text = len(heading.group(1)), heading.group(2)
+                output.append(f'<h{level} id="{html.escape(self.heading_id(text))}">{render_inline(text)}</h{level}>')
+                i += 1
+                continue
+            if re.match(r'^\s*([-*_])(\s*\1){2,}\s*$', line):
+                flush()
+                output.append('<hr />')
+                i += 1
+                continue
+            if TAG_START_PATTERN.match(line):
+                flush()
+                i = self.tag_block(lines, i, output)
+                continue
+            if stripped.startswith('>'):
+                flush()
+                quoted = []
+                while i < len(lines) and lines[i].strip().startswith('>'):
+                    quoted.append(re.sub(r'^\s*>\s?', '', lines[i]))
+                    i += 1
+                output.append(f"<blockquote>{BlockRenderer().render(quoted)}</blockquote>")
+                continue
+            if '|' in stripped and i + 1 < len(lines) and TABLE_SEPARATOR_PATTERN.match(lines[i + 1]):
+                flush()
+                i = self.table(lines, i, output)
+                continue
+            if LIST_ITEM_PATTERN.match(line) and not paragraph:
+                i = self.list_block(lines, i, output)
+                continue
+            paragraph.append(line)
+            i += 1
+        flush()
+        return '\n'.join(output)
+
+    def code_block(self, lines: List[str], start: int, fence: 're.Match', output: List[str]) -> int:
+        indent, marker, info = len(fence.group(1)), fence.group(2), fence.group(3).strip()
+        code = []
+        i = start + 1
+        while i < len(lines):
+            closing = FENCE_PATTERN.match(lines[i])
+            if closing and closing.group(2).startswith(marker[0] * len(marker)) and not closing.group(3).strip():
+                i += 1
+                break
+            code.append(lines[i][indent:] if not lines[i][:indent].strip() else lines[i].lstrip())
+            i += 1
+        language = info.split()[0] if info else ''
+        title = ' '.join(info.split()[1:])
+        title_html = f'<div class="code-title">{html.escape(title)}</div>' if title else ''
+        output.append(f'<div class="code-block">{title_html}<pre><code class="language-{html.escape(language)}">'
+                      f"{html.escape(chr(10).join(code))}</code></pre></div>")
+        return i
+
+    def tag_block(self, lines: List[str], start: int, output: List[str]) -> int:
+        """A line starting with a tag: the tag (which may span lines) and anything after it on its last line."""
+        text = lines[start]
+        i = start + 1
+        while '>' not in text and i < len(lines):
+            text += '\n' + lines[i]
+            i += 1
+        match = TAG_PATTERN.match(text.strip())
+        if match is None:
+            output.append(f"<p>{render_inline(text.strip())}</p>")
+            return i
+        closing, name, attribute_text, self_closing = match.groups()
+        output.append(render_tag(closing == '/', name, attribute_text or '', self_closing == '/'))
+        rest = text.strip()[match.end():].strip()
+        if rest:
+            # Content on the same line as the tag, such as <Tip>Short tip</Tip>
+            output.append(render_inline(rest))
+        return i
+
+    def table(self, lines: List[str], start: int, output: List[str]) -> int:
+        def cells(row: str) -> List[str]:
+            row = row.strip()
+            row = row[1:] if row.startswith('|') else row
+            row = row[:-1] if row.endswith('|') and not row.endswith('\\|') else row
+            return [cell.strip() for cell in re.split(r'(?<!\\)\|', row)]
+
+        header = ''.join(f"<th>{render_inline(cell)}</th>" for cell in cells(lines[start]))
+        rows = []
+        i = start + 2
+        while i < len(lines) and '|' in lines[i] and lines[i].strip():
+            rows.append('<tr>' + ''.join(f"<td>{render_inline(cell)}</td>" for cell in cells(lines[i])) + '</tr>')
+            i += 1
+        output.append(f"<table><thead><tr>{header}</tr></thead><tbody>{''.join(rows)}</tbody></table>")
+        return i
+
+    def list_block(self, lines: List[str], start: int, output: List[str]) -> int:
+        """A list, with items nested by indentation and continuation lines folded into their item."""
+        first = LIST_ITEM_PATTERN.match(lines[start])
+        base_indent = len(first.group(1))
+        content_indent = base_indent + len(first.group(2)) + 1
+        items: List[List[str]] = []
+        i = start
+        while i < len(lines):
+            line = lines[i]
+            item = LIST_ITEM_PATTERN.match(line)
+            indent = len(line) - len(line.lstrip())
+            if item and indent == base_indent:
+                items.append([item.group(3)])
+            elif not line.strip():
+                # A blank line ends the list unless the list, or the content of its last item, carries on after it
+                following = next((candidate for candidate in lines[i + 1:] if candidate.strip()), '')
+                following_indent = len(following) - len(following.lstrip())
+                if following_indent <= base_indent and not (LIST_ITEM_PATTERN.match(following)
+                                                            and following_indent == base_indent):
+                    break
+                items[-1].append('')
+            elif indent > base_indent:
+                items[-1].append(line[min(indent, content_indent):])
+            elif items[-1][-1] and not (HEADING_PATTERN.match(line) or TAG_START_PATTERN.match(line)
+                                        or FENCE_PATTERN.match(line)):
+                items[-1].append(line.strip())  # A lazy continuation line
+            else:
+                break
+            i += 1
+
+        tag = 'ol' if first.group(2)[0].isdigit() else 'ul'
+        rendered = []
+        for item in items:
+            content = BlockRenderer().render(item)
+            if '' not in item:
+                # Tight items hold their text directly, like markdown renders them
+                content = re.sub(r'<p>(.*?)</p>', r'\1', content, flags=re.DOTALL)
+            rendered.append(f"<li>{content}</li>")
+        output.append(f"<{tag}>{''.join(rendered)}</{tag}>")
+        return i
+
+
+def render_mdx(body: str, snippets: Optional[Dict[str, str]] = None) -> str:
+    """
+    Render the body of a page (without its frontmatter) to HTML. snippets maps the names of imported MDX snippets
+    to their bodies, which are rendered in place of `<Name />`.
+    """
+    for name, snippet in (snippets or {}).items():
+        body = re.sub(rf'<{re.escape(name)}\s*/>', lambda _: snippet, body)
+    # Imports, exports and comments are found in the masked text, so code blocks that contain them are left alone
+    masked = mask_code_blocks(body)
+    spans = [match.span() for match in IMPORT_PATTERN.finditer(masked)]
+    spans += [match.span() for match in COMMENT_PATTERN.finditer(masked)]
+    for start, end in sorted(spans, reverse=True):
+        body = body[:start] + re.sub(r'[^\n]', '', body[start:end]) + body[end:]
+    return BlockRenderer().render(body.split('\n'))
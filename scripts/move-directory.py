@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Move a documentation directory in one pass, updating links, images, navigation and redirects.
+
+This script:
+1. Plans every page and image move up front (everything under the source directory moves with it; images the
+   moved pages use from another product's images directory follow them, as in move-file.py, unless other pages
+   still use them)
+2. Moves the directory with a single git mv (preserves history) and the followed images with git mv
+3. Reads every page once and rewrites the ones that link to a moved page or use a moved image, each written once
+4. Updates docs.json once: navigation entries are renamed in place, a redirect is added per moved page and
+   existing redirects that pointed at a moved page are re-pointed at its new URL
+
+Usage:
+    python scripts/move-directory.py <source_dir> <dest_dir> [--dry-run]
+
+Example:
+    python scripts/move-directory.py container-engine/how-to-guides/miners container-engine/tutorials/miners
+
+Arguments:
+    source_dir: Directory to move, relative to the repository root
+    dest_dir: New location of the directory, relative to the repository root (must not exist)
+"""
+
+import argparse
+import json
+import os
+import posixpath
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Tuple
+
+from asset_index import AssetIndex, build_asset_index, rewrite_image_references
+from file_discovery import discover_files
+from script_loader import load_script
+
+move_file = load_script('move-file.py')
+update_links = load_script('update-links.py')
+
+
+@dataclass
+class MovePlan:
+    """Every path and URL change a directory move makes."""
+    source_dir: str
+    dest_dir: str
+    pages: Dict[str, str] = field(default_factory=dict)
+    assets: Dict[str, str] = field(default_factory=dict)
+    followed_images: Dict[str, str] = field(default_factory=dict)
+    page_updates: Dict[str, Tuple[str, str, int]] = field(default_factory=dict)
+
+    @property
+    def urls(self) -> Dict[str, str]:
+        """Old page URL → new page URL."""
+        return {'/' + move_file.path_to_url(source): '/' + move_file.path_to_url(dest)
+                for source, dest in self.pages.items()}
+
+    @property
+    def all_assets(self) -> Dict[str, str]:
+        return {**self.assets, **self.followed_images}
+
+
+def relocate(path: str, source_dir: str, dest_dir: str) -> str:
+    return dest_dir + path[len(source_dir):]
+
+
+def product_of(path: str) -> str:
+    return path.split('/', 1)[0]
+
+
+def plan_followed_images(root: Path, plan: MovePlan, index: AssetIndex) -> None:
+    """Move product images used only by moved pages into the new product's images directory, like move-file.py."""
+    if product_of(plan.source_dir) == product_of(plan.dest_dir):
+        return
+
+    for asset, referencing in sorted(index.references.items()):
+        if asset.startswith(plan.source_dir + '/') or product_of(asset) != product_of(plan.source_dir):
+            continue
+        if not all(page in plan.pages for page in referencing):
+            continue
+        source_page = next(iter(referencing))
+        new_path = move_file.determine_new_image_path(source_page, plan.pages[source_page], asset)
+        if new_path != asset and not (root / new_path).exists() and new_path not in plan.followed_images.values():
+            plan.followed_images[asset] = new_path
+
+
+def build_plan(root: Path, source_dir: str, dest_dir: str) -> MovePlan:
+    """Plan the whole move, including the rewritten content of every affected page."""
+    plan = MovePlan(source_dir, dest_dir)
+    discovered = discover_files(str(root))
+
+    for page in discovered.pages:
+        if page.startswith(source_dir + '/'):
+            plan.pages[page] = relocate(page, source_dir, dest_dir)
+    for asset in discovered.assets:
+        if asset.startswith(source_dir + '/'):
+            plan.assets[asset] = relocate(asset, source_dir, dest_dir)
+
+    index = build_asset_index(str(root), discovered.pages)
+    plan_followed_images(root, plan, index)
+
+    url_moves = plan.urls
+    asset_moves = plan.all_assets
+    for page, original in index.contents.items():
+        new_page = plan.pages.get(page, page)
+        content, image_changes = rewrite_image_references(original, page, asset_moves, new_page)
+        content, link_changes = update_links.update_links_in_content(content, url_moves)
+        if content != original:
+            plan.page_updates[page] = (new_page, content, len(image_changes) + len(link_changes))
+
+    return plan
+
+
+def rename_navigation_pages(items: list, url_map: Dict[str, str]) -> int:
+    """Rename moved pages in place in a navigation list, keeping their position. Returns the number renamed."""
+    renamed = 0
+    for i, item in enumerate(items):
+        if isinstance(item, str) and item in url_map:
+            items[i] = url_map[item]
+            renamed += 1
+        elif isinstance(item, dict):
+            for key in ('tabs', 'groups', 'pages'):
+                if isinstance(item.get(key), list):
+                    renamed += rename_navigation_pages(item[key], url_map)
+    return renamed
+
+
+def update_docs_json(docs_json_path: Path, plan: MovePlan, dry_run: bool) -> bool:
+    """Apply every navigation edit and redirect of the move with one read and one write of docs.json."""
+    try:
+        with open(docs_json_path, 'r', encoding='utf-8') as f:
+            docs_data = json.load(f)
+    except Exception as e:
+        print(f"❌ Failed to load docs.json: {e}")
+        return False
+
+    # Navigation entries are URLs without the leading slash
+    nav_map = {source.lstrip('/'): dest.lstrip('/') for source, dest in plan.urls.items()}
+    navigation = docs_data.get('navigation', {})
+    renamed = rename_navigation_pages([navigation], nav_map)
+    print(f"✅ Renamed {renamed} navigation entr{'y' if renamed == 1 else 'ies'}")
+
+    redirects = docs_data.setdefault('redirects', [])
+    url_moves = plan.urls
+    repointed = 0
+    for redirect in redirects:
+        destination = redirect.get('destination', '')
+        if destination in url_moves:
+            redirect['destination'] = url_moves[destination]
+            repointed += 1
+    if repointed:
+        print(f"✅ Re-pointed {repointed} existing redirect(s) at the new URLs")
+
+    for source, dest in sorted(plan.pages.items()):
+        if source.endswith('.mdx'):
+            move_file.add_redirect(redirects, source, dest)
+
+    if dry_run:
+        return True
+
+    try:
+        with open(docs_json_path, 'w', encoding='utf-8') as f:
+            json.dump(docs_data, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        print("✅ Updated docs.json")
+        return True
+    except Exception as e:
+        print(f"❌ Failed to save docs.json: {e}")
+        return False
+
+
+def move_paths(root: Path, source: str, dest: str) -> bool:
+    """Move a file or directory with git mv, falling back to a plain rename for untracked paths."""
+    (root / dest).parent.mkdir(parents=True, exist_ok=True)
+    exit_code, _, stderr = move_file.run_command(['git', 'mv', source, dest], cwd=str(root))
+    if exit_code == 0:
+        return True
+    try:
+        os.rename(root / source, root / dest)
+        return True
+    except OSError as e:
+        print(f"❌ Failed to move {source}: {stderr.strip() or e}")
+        return False
+
+
+def print_plan(plan: MovePlan) -> None:
+    print(f"📄 {len(plan.pages)} page(s), {len(plan.assets)} asset(s) move with the directory")
+    for source, dest in sorted(plan.followed_images.items()):
+        print(f"  📷 {source} → {dest}")
+    print(f"📝 {len(plan.page_updates)} page(s) need updated links or image references")
+    for page, (new_page, _, count) in sorted(plan.page_updates.items()):
+        location = f"{page} → {new_page}" if new_page != page else page
+        print(f"  {location} ({count} change(s))")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Move a documentation directory and update everything that uses it')
+    parser.add_argument('source_dir', help='Directory to move, relative to the repository root')
+    parser.add_argument('dest_dir', help='New location of the directory, relative to the repository root')
+    parser.add_argument('--root-dir', default=str(Path(__file__).parent.parent),
+                        help='Repository root (default: parent of the scripts directory)')
+    parser.add_argument('--dry-run', action='store_true', help='Show the plan without changing anything')
+
+    args = parser.parse_args()
+
+    root = Path(args.root_dir)
+    source_dir = posixpath.normpath(args.source_dir.strip('/'))
+    dest_dir = posixpath.normpath(args.dest_dir.strip('/'))
+
+    if not (root / source_dir).is_dir():
+        print(f"❌ Source directory does not exist: {source_dir}")
+        sys.exit(1)
+    if (root / dest_dir).exists():
+        print(f"❌ Destination already exists: {dest_dir}")
+        sys.exit(1)
+    if (dest_dir + '/').startswith(source_dir + '/'):
+        print("❌ Cannot move a directory into itself")
+        sys.exit(1)
+
+    print(f"📁 Moving directory: {source_dir} → {dest_dir}")
+    print("-" * 60)
+
+    plan = build_plan(root, source_dir, dest_dir)
+    if not plan.pages and not plan.assets:
+        print("⚠️  No pages or assets found in the source directory")
+    print_plan(plan)
+
+    if args.dry_run:
+        update_docs_json(root / 'docs.json', plan, dry_run=True)
+        print("🔍 Dry run - nothing was changed")
+        return
+
+    if not move_paths(root, source_dir, dest_dir):
+        sys.exit(1)
+    print(f"✅ Moved directory: {source_dir} → {dest_dir}")
+    for source, dest in sorted(plan.followed_images.items()):
+        if not move_paths(root, source, dest):
+            sys.exit(1)
+        print(f"  📷 Moved image: {source} → {dest}")
+
+    for page, (new_page, content, _) in sorted(plan.page_updates.items()):
+        with open(root / new_page, 'w', encoding='utf-8') as f:
+            f.write(content)
+    print(f"✅ Updated {len(plan.page_updates)} page(s)")
+
+    if not update_docs_json(root / 'docs.json', plan, dry_run=False):
+        print("❌ Failed to update docs.json - you may need to revert the directory move")
+        sys.exit(1)
+
+    print("-" * 60)
+    print("✅ Directory move completed successfully!")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Move one or more images and update every page that references them.
+
+This script:
+1. Validates every move up front (source exists, destination is free, no two moves collide)
+2. Builds a reverse index of which pages reference which images, reading each page once
+3. Moves the images with git mv (preserves history)
+4. Rewrites only the image spans of the pages that reference a moved image, each page written once
+
+Absolute references stay absolute and relative references are recomputed relative to the page.
+
+Usage:
+    python scripts/move-image.py <source> <destination> [<source> <destination> ...]
+    python scripts/move-image.py --batch moves.txt
+
+Example:
+    python scripts/move-image.py container-engine/images/old.png container-engine/images/new.png
+
+Arguments:
+    source, destination: Image paths relative to the repository root
+    --batch: A file with one "<source> <destination>" pair per line (blank lines and # comments are ignored)
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from asset_index import AssetIndex, build_asset_index, rewrite_image_references
+
+
+def read_batch_file(batch_file: str) -> List[Tuple[str, str]]:
+    """Read "<source> <destination>" pairs from a batch file."""
+    moves = []
+    with open(batch_file, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            parts = line.split()
+            if len(parts) != 2:
+                raise ValueError(f"{batch_file}:{line_number}: expected '<source> <destination>'")
+            moves.append((parts[0], parts[1]))
+    return moves
+
+
+def normalize_image_path(path: str) -> str:
+    """Normalize an image path to be relative to the repository root."""
+    return os.path.normpath(path.lstrip('/')).replace('\\', '/')
+
+
+def validate_moves(root: Path, moves: List[Tuple[str, str]]) -> List[str]:
+    """Return every problem with the requested moves."""
+    errors = []
+    sources = set()
+    destinations = set()
+    for source, dest in moves:
+        if not (root / source).is_file():
+            errors.append(f"Source image does not exist: {source}")
+        if (root / dest).exists():
+            errors.append(f"Destination already exists: {dest}")
+        if source in sources:
+            errors.append(f"Image is moved more than once: {source}")
+        if dest in destinations:
+            errors.append(f"Two images are moved to the same destination: {dest}")
+        sources.add(source)
+        destinations.add(dest)
+    return errors
+
+
+def plan_page_updates(index: AssetIndex, moves: Dict[str, str]) -> Dict[str, Tuple[str, List[Tuple[str, str]]]]:
+    """Return page → (new content, changes) for every page that references a moved image."""
+    pages = sorted({page for source in moves for page in index.pages_referencing(source)})
+    updates = {}
+    for page in pages:
+        content, changes = rewrite_image_references(index.contents[page], page, moves)
+        if changes:
+            updates[page] = (content, changes)
+    return updates
+
+
+def move_file(root: Path, source: str, dest: str) -> bool:
+    """Move a file with git mv, falling back to a plain rename for untracked files."""
+    (root / dest).parent.mkdir(parents=True, exist_ok=True)
+    result = subprocess.run(['git', 'mv', source, dest], cwd=root, capture_output=True, text=True)
+    if result.returncode == 0:
+        return True
+    try:
+        os.rename(root / source, root / dest)
+        return True
+    except OSError as e:
+        print(f"❌ Failed to move {source}: {e}")
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Move images and update the pages that reference them')
+    parser.add_argument('paths', nargs='*', help='Pairs of <source> <destination> image paths')
+    parser.add_argument('--batch', help='File with one "<source> <destination>" pair per line')
+    parser.add_argument('--root-dir', default=str(Path(__file__).parent.parent),
+                        help='Repository root (default: parent of the scripts directory)')
+    parser.add_argument('--dry-run', action='store_true', help='Show what would change without moving anything')
+
+    args = parser.parse_args()
+
+    if len(args.paths) % 2:
+        parser.error('paths must be given as <source> <destination> pairs')
+    pairs = list(zip(args.paths[::2], args.paths[1::2]))
+    if args.batch:
+        try:
+            pairs.extend(read_batch_file(args.batch))
+        except (OSError, ValueError) as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+    if not pairs:
+        parser.error('no image moves given')
+
+    root = Path(args.root_dir)
+    moves = [(normalize_image_path(source), normalize_image_path(dest)) for source, dest in pairs]
+
+    errors = validate_moves(root, moves)
+    if errors:
+        for error in errors:
+            print(f"❌ {error}")
+        sys.exit(1)
+
+    move_map = dict(moves)
+    index = build_asset_index(str(root))
+    updates = plan_page_updates(index, move_map)
+
+    print(f"🖼️  Moving {len(moves)} image(s), updating {len(updates)} page(s)")
+    for source, dest in moves:
+        referencing = index.pages_referencing(source)
+        print(f"  📷 {source} → {dest} ({len(referencing)} page(s))")
+        if not referencing:
+            print("     ⚠️  No page references this image")
+
+    if args.dry_run:
+        for page, (_, changes) in sorted(updates.items()):
+            print(f"  📝 {page}")
+            for old_url, new_url in changes:
+                print(f"     {old_url} → {new_url}")
+        print("🔍 Dry run - nothing was changed")
+        return
+
+    for source, dest in moves:
+        if not move_file(root, source, dest):
+            sys.exit(1)
+
+    for page, (content, changes) in sorted(updates.items()):
+        with open(root / page, 'w', encoding='utf-8') as f:
+            f.write(content)
+        print(f"  📝 Updated {len(changes)} reference(s) in {page}")
+
+    print(f"✅ Moved {len(moves)} image(s) and updated {len(updates)} page(s)")
+
+
+if __name__ == '__main__':
+    main()
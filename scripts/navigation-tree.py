@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Precompute the docs.json sidebar tree and diff it between revisions.
+
+This script:
+1. Materializes every tab's sidebar from docs.json into a JSON tree with depth, sibling order and page titles
+   (titles come from each page's frontmatter)
+2. Builds the tree for the working tree or any git revision, reading all page frontmatter through one
+   `git cat-file --batch` process
+3. Diffs two trees into a structured report of added, removed, moved, reordered and retitled entries
+
+Usage:
+    python scripts/navigation-tree.py build [--rev REV] [--output build/navigation/navigation-tree.json]
+    python scripts/navigation-tree.py diff <base> [<head>] [--json]
+
+<base> and <head> are git revisions or tree files written by `build`. <head> defaults to the working tree.
+
+Example:
+    python scripts/navigation-tree.py diff origin/main
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from page_content import parse_frontmatter
+
+TREE_VERSION = 1
+
+# Keys that hold the display name of a navigation container, in lookup order
+CONTAINER_KEYS = ('tab', 'group', 'anchor', 'dropdown', 'version', 'language')
+CHILD_KEYS = ('tabs', 'anchors', 'dropdowns', 'groups', 'pages')
+
+
+def read_git_files(rev: str, paths: List[str], root_dir: str = '.') -> Dict[str, Optional[str]]:
+    """Read many files at a git revision through a single `git cat-file --batch` process."""
+    if not paths:
+        return {}
+
+    request = ''.join(f"{rev}:{path}\n" for path in paths).encode('utf-8')
+    result = subprocess.run(['git', 'cat-file', '--batch'], cwd=root_dir, input=request, capture_output=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"git cat-file failed: {result.stderr.decode('utf-8', errors='replace').strip()}")
+
+    output = result.stdout
+    contents: Dict[str, Optional[str]] = {}
+    offset = 0
+    for path in paths:
+        header_end = output.index(b'\n', offset)
+        header = output[offset:header_end].split()
+        offset = header_end + 1
+        if header[-1] == b'missing':
+            contents[path] = None
+            continue
+        size = int(header[2])
+        contents[path] = output[offset:offset + size].decode('utf-8', errors='replace')
+        offset += size + 1
+
+    return contents
+
+
+def collect_nav_pages(navigation: dict) -> List[str]:
+    """Return every page referenced by the navigation, in sidebar order."""
+    pages = []
+
+    def traverse(node):
+        if isinstance(node, str):
+            pages.append(node)
+        elif isinstance(node, list):
+            for item in node:
+                traverse(item)
+        elif isinstance(node, dict):
+            for key in CHILD_KEYS:
+                if key in node:
+                    traverse(node[key])
+
+    traverse(navigation)
+    return pages
+
+
+def page_titles(pages: List[str], read_file: Callable[[List[str]], Dict[str, Optional[str]]]) -> Dict[str, dict]:
+    """Read title and sidebarTitle from the frontmatter of each page. Missing files map to an empty dict."""
+    contents = read_file([f"{page}.mdx" for page in pages])
+    titles = {}
+    for page in pages:
+        content = contents.get(f"{page}.mdx")
+        if content is None:
+            titles[page] = {}
+            continue
+        frontmatter, _, _ = parse_frontmatter(content)
+        titles[page] = {
+            'title': frontmatter.get('title'),
+            'sidebarTitle': frontmatter.get('sidebarTitle'),
+            'openapi': frontmatter.get('openapi'),
+        }
+    return titles
+
+
+def build_tree(docs: dict, read_file: Callable[[List[str]], Dict[str, Optional[str]]]) -> dict:
+    """Materialize the sidebar tree and a flat page index from a parsed docs.json."""
+    navigation = docs.get('navigation', {})
+    titles = page_titles(sorted(set(collect_nav_pages(navigation))), read_file)
+    flat_pages: Dict[str, dict] = {}
+    flat_groups: Dict[str, dict] = {}
+
+    def build_node(node, depth: int, order: int, breadcrumb: List[str]) -> dict:
+        if isinstance(node, str):
+            info = titles.get(node, {})
+            entry = {
+                'type': 'page',
+                'page': node,
+                'title': info.get('sidebarTitle') or info.get('title') or info.get('openapi'),
+                'missing': not info,
+                'depth': depth,
+                'order': order,
+            }
+            flat_pages.setdefault(node, {
+                'breadcrumb': breadcrumb,
+                'depth': depth,
+                'order': order,
+                'title': entry['title'],
+                'missing': entry['missing'],
+            })
+            return entry
+
+        kind = next((key for key in CONTAINER_KEYS if key in node), 'group')
+        title = node.get(kind, '')
+        path = breadcrumb + [title]
+        children = []
+        for key in CHILD_KEYS:
+            for child_order, child in enumerate(node.get(key, [])):
+                children.append(build_node(child, depth + 1, child_order, path))
+
+        flat_groups[' > '.join(path)] = {
+            'type': kind,
+            'depth': depth,
+            'order': order,
+            'children': [child.get('page') or child['title'] for child in children],
+        }
+        return {'type': kind, 'title': title, 'depth': depth, 'order': order, 'children': children}
+
+    tabs = []
+    for key in CHILD_KEYS:
+        for order, node in enumerate(navigation.get(key, [])):
+            tabs.append(build_node(node, 0, order, []))
+
+    return {'version': TREE_VERSION, 'tabs': tabs, 'pages': flat_pages, 'groups': flat_groups}
+
+
+def load_tree(source: Optional[str], root_dir: str) -> dict:
+    """Build a tree from the working tree (None), a saved tree file, or a git revision."""
+    if source is None:
+        with open(os.path.join(root_dir, 'docs.json'), 'r', encoding='utf-8') as f:
+            docs = json.load(f)
+
+        def read_working_tree(paths: List[str]) -> Dict[str, Optional[str]]:
+            contents = {}
+            for path in paths:
+                full_path = os.path.join(root_dir, path)
+                if os.path.exists(full_path):
+                    with open(full_path, 'r', encoding='utf-8') as f:
+                        contents[path] = f.read()
+                else:
+                    contents[path] = None
+            return contents
+
+        return build_tree(docs, read_working_tree)
+
+    if os.path.isfile(source):
+        with open(source, 'r', encoding='utf-8') as f:
+            tree = json.load(f)
+        if tree.get('version') != TREE_VERSION:
+            raise ValueError(f"Unsupported navigation tree version in {source}: {tree.get('version')}")
+        return tree
+
+    docs_content = read_git_files(source, ['docs.json'], root_dir)['docs.json']
+    if docs_content is None:
+        raise ValueError(f"docs.json not found at revision {source}")
+    return build_tree(json.loads(docs_content), lambda paths: read_git_files(source, paths, root_dir))
+
+
+@dataclass
+class NavigationDiff:
+    """Structured differences between two sidebar trees."""
+    added_pages: List[Tuple[str, str]] = field(default_factory=list)
+    removed_pages: List[Tuple[str, str]] = field(default_factory=list)
+    moved_pages: List[Tuple[str, str, str]] = field(default_factory=list)
+    retitled_pages: List[Tuple[str, Optional[str], Optional[str]]] = field(default_factory=list)
+    added_groups: List[str] = field(default_factory=list)
+    removed_groups: List[str] = field(default_factory=list)
+    reordered_groups: List[Tuple[str, List[str], List[str]]] = field(default_factory=list)
+    missing_files: List[str] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not any(getattr(self, name) for name in self.__dataclass_fields__ if name != 'missing_files')
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+
+def diff_trees(base: dict, head: dict) -> NavigationDiff:
+    """Compare the flat page and group indexes of two trees."""
+    diff = NavigationDiff()
+    base_pages, head_pages = base['pages'], head['pages']
+    base_groups, head_groups = base['groups'], head['groups']
+
+    def location(entry: dict) -> str:
+        return ' > '.join(entry['breadcrumb'])
+
+    for page in sorted(head_pages.keys() - base_pages.keys()):
+        diff.added_pages.append((page, location(head_pages[page])))
+    for page in sorted(base_pages.keys() - head_pages.keys()):
+        diff.removed_pages.append((page, location(base_pages[page])))
+
+    for page in sorted(base_pages.keys() & head_pages.keys()):
+        before, after = base_pages[page], head_pages[page]
+        if before['breadcrumb'] != after['breadcrumb']:
+            diff.moved_pages.append((page, location(before), location(after)))
+        if before['title'] != after['title']:
+            diff.retitled_pages.append((page, before['title'], after['title']))
+
+    diff.added_groups = sorted(head_groups.keys() - base_groups.keys())
+    diff.removed_groups = sorted(base_groups.keys() - head_groups.keys())
+
+    for group in sorted(base_groups.keys() & head_groups.keys()):
+        before, after = base_groups[group]['children'], head_groups[group]['children']
+        common = set(before) & set(after)
+        before_common = [child for child in before if child in common]
+        after_common = [child for child in after if child in common]
+        if before_common != after_common:
+            diff.reordered_groups.append((group, before_common, after_common))
+
+    diff.missing_files = sorted(page for page, entry in head_pages.items() if entry['missing'])
+    return diff
+
+
+def print_diff(diff: NavigationDiff) -> None:
+    """Print a human-readable navigation diff."""
+    if diff.is_empty:
+        print("✅ No navigation changes")
+
+    if diff.added_pages:
+        print(f"➕ Added pages ({len(diff.added_pages)}):")
+        for page, location in diff.added_pages:
+            print(f"  + {page}  [{location}]")
+        print()
+    if diff.removed_pages:
+        print(f"➖ Removed pages ({len(diff.removed_pages)}):")
+        for page, location in diff.removed_pages:
+            print(f"  - {page}  [{location}]")
+        print()
+    if diff.moved_pages:
+        print(f"🔀 Moved pages ({len(diff.moved_pages)}):")
+        for page, before, after in diff.moved_pages:
+            print(f"  {page}")
+            print(f"      {before} → {after}")
+        print()
+    if diff.retitled_pages:
+        print(f"✏️  Retitled pages ({len(diff.retitled_pages)}):")
+        for page, before, after in diff.retitled_pages:
+            print(f"  {page}: {before!r} → {after!r}")
+        print()
+    if diff.added_groups or diff.removed_groups:
+        print("📂 Groups:")
+        for group in diff.added_groups:
+            print(f"  + {group}")
+        for group in diff.removed_groups:
+            print(f"  - {group}")
+        print()
+    if diff.reordered_groups:
+        print(f"↕️  Reordered groups ({len(diff.reordered_groups)}):")
+        for group, before, after in diff.reordered_groups:
+            print(f"  {group}")
+            for position, child in enumerate(after):
+                if before[position] != child:
+                    print(f"      {child}: #{before.index(child) + 1} → #{position + 1}")
+        print()
+    if diff.missing_files:
+        print(f"❌ Navigation entries without files ({len(diff.missing_files)}):")
+        for page in diff.missing_files:
+            print(f"  - {page}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute the docs.json sidebar tree and diff revisions')
+    parser.add_argument('command', choices=['build', 'diff'], help='Action to perform')
+    parser.add_argument('revisions', nargs='*', help='For diff: <base> [<head>] as git revisions or tree files')
+    parser.add_argument('--rev', help='For build: git revision to build (default: working tree)')
+    parser.add_argument('--root-dir', default=str(Path(__file__).parent.parent),
+                        help='Repository root (default: parent of the scripts directory)')
+    parser.add_argument('--output', default='build/navigation/navigation-tree.json',
+                        help='For build: output file (default: build/navigation/navigation-tree.json)')
+    parser.add_argument('--json', action='store_true', help='For diff: print the report as JSON')
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'build':
+            tree = load_tree(args.rev, args.root_dir)
+            output_path = Path(args.output)
+            if not output_path.is_absolute():
+                output_path = Path(args.root_dir) / output_path
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(tree, f, indent=2, ensure_ascii=False)
+            print(f"✅ Wrote {output_path}")
+            print(f"   Tabs: {len(tree['tabs'])}, groups: {len(tree['groups'])}, pages: {len(tree['pages'])}")
+            return
+
+        if not args.revisions or len(args.revisions) > 2:
+            print("Usage: python scripts/navigation-tree.py diff <base> [<head>]")
+            sys.exit(1)
+
+        base = load_tree(args.revisions[0], args.root_dir)
+        head = load_tree(args.revisions[1] if len(args.revisions) > 1 else None, args.root_dir)
+        diff = diff_trees(base, head)
+    except (ValueError, RuntimeError, OSError) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(diff.to_dict(), indent=2, ensure_ascii=False))
+    else:
+        print_diff(diff)
+
+
+if __name__ == '__main__':
+    main()
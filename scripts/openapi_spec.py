@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+"""
+Loading, walking and writing the OpenAPI specs in api-specs/.
+
+Specs are JSON or YAML. They are written back in the format they were read in. Specs that are edited in place go
+through `update_spec_text`, which only rewrites the parts that changed, so the hand-maintained formatting, quoting,
+folded descriptions and comments survive. New content is written the way prettier formats the tree: JSON with
+two-space indentation, YAML in block style with indented sequences, double quotes and keys in their original order.
+"""
+
+import difflib
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Set, Tuple
+from urllib.parse import unquote
+
+import yaml
+
+from file_discovery import discover_files
+from page_content import parse_frontmatter
+
+SPEC_DIR = 'api-specs'
+SPEC_EXTENSIONS = ('.json', '.yaml', '.yml')
+HTTP_METHODS = ('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace')
+
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+class SpecDumper(yaml.SafeDumper):
+    """YAML in the style prettier gives the specs: sequences indented under their key, double quotes."""
+
+    def increase_indent(self, flow=False, indentless=False):
+        return super().increase_indent(flow, False)
+
+    def choose_scalar_style(self):
+        style = super().choose_scalar_style()
+        return '"' if style == "'" else style
+
+
+def list_specs(root_dir: str) -> list:
+    """Return every spec file in api-specs/, sorted by name."""
+    spec_dir = Path(root_dir) / SPEC_DIR
+    return sorted(path for path in spec_dir.iterdir() if path.is_file() and path.suffix in SPEC_EXTENSIONS)
+
+
+def parse_spec(text: str, suffix: str) -> object:
+    if suffix == '.json':
+        return json.loads(text)
+    return yaml.load(text, Loader=YAML_LOADER)
+
+
+def load_spec(path: Path) -> object:
+    """Load a JSON or YAML document."""
+    return parse_spec(path.read_text(encoding='utf-8'), path.suffix)
+
+
+def dump_yaml(value: object) -> str:
+    return yaml.dump(value, Dumper=SpecDumper, sort_keys=False, allow_unicode=True)
+
+
+def dump_spec(spec: object, suffix: str) -> str:
+    """Serialize a spec in the format its file extension calls for."""
+    if suffix == '.json':
+        return json.dumps(spec, indent=2, ensure_ascii=False) + '\n'
+    return dump_yaml(spec)
+
+
+def update_spec_text(text: str, spec: object, suffix: str) -> str:
+    """
+    Return the text of a spec file edited to hold spec. Only the mapping entries and list items whose values
+    changed are rewritten; everything else keeps its original text. Falls back to `dump_spec` if the text cannot
+    be spliced.
+    """
+    try:
+        old = parse_spec(text, suffix)
+        root = yaml.compose(text, Loader=yaml.SafeLoader)
+    except (ValueError, yaml.YAMLError):
+        return dump_spec(spec, suffix)
+    if _same(old, spec):
+        return text
+    splicer = _Splicer(text)
+    if root is None or not splicer.edit_collection(root, old, spec):
+        return dump_spec(spec, suffix)
+    updated = splicer.apply()
+    try:
+        if _same(parse_spec(updated, suffix), spec):
+            return updated
+    except (ValueError, yaml.YAMLError):
+        pass
+    return dump_spec(spec, suffix)
+
+
+def _same(a: object, b: object) -> bool:
+    return type(a) is type(b) and a == b
+
+
+class _Splicer:
+    """
+    Collects text edits that turn a composed YAML or JSON document into a new value.
+
+    Block-style YAML is edited a line at a time: a changed entry is re-emitted with `dump_yaml` at its original
+    indentation, new entries are appended after the last one and removed entries lose their lines. Flow collections
+    (all of JSON) have their changed values replaced in place, with commas kept balanced. Returns False from an edit
+    when a collection cannot be edited piecewise, so the caller replaces it whole.
+
+    Re-dumping a spec instead is not an option for the hand-maintained ones: PyYAML drops comments and rewrites
+    quoting, folded descriptions and flow collections, so `dump_spec` alone changes 6,947 of the 9,369 lines of
+    salad-cloud.yaml and 731 of the 931 lines of salad-cloud-imds.yaml for a one-header edit. ruamel.yaml would keep
+    them but is not a dependency here. Every splice is checked by re-parsing the result, so a mistake here falls
+    back to a full dump rather than to a wrong spec.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.edits: List[Tuple[int, int, str]] = []
+
+    def apply(self) -> str:
+        text = self.text
+        for start, end, replacement in sorted(self.edits, key=lambda edit: (edit[0], edit[1]), reverse=True):
+            text = text[:start] + replacement + text[end:]
+        return text
+
+    def line_start(self, index: int) -> int:
+        return self.text.rfind('\n', 0, index) + 1
+
+    def line_end(self, index: int) -> int:
+        """Index just past the line break that ends the line index is on (index itself if it starts a line)."""
+        if index > 0 and self.text[index - 1] == '\n':
+            return index
+        newline = self.text.find('\n', index)
+        return len(self.text) if newline < 0 else newline + 1
+
+    def starts_line(self, index: int) -> bool:
+        return not self.text[self.line_start(index):index].strip()
+
+    def node_end(self, node: yaml.Node) -> int:
+        """Where a node's own text ends (block collections end at their last value, not at the next token)."""
+        while isinstance(node, (yaml.MappingNode, yaml.SequenceNode)) and not node.flow_style and node.value:
+            node = node.value[-1][1] if isinstance(node, yaml.MappingNode) else node.value[-1]
+        return node.end_mark.index
+
+    def block_lines(self, emitted: str, column: int) -> str:
+        return ''.join(' ' * column + line if line.strip() else line for line in emitted.splitlines(True))
+
+    def flow_value(self, value: object, column: int) -> str:
+        return json.dumps(value, indent=2, ensure_ascii=False).replace('\n', '\n' + ' ' * column)
+
+    def edit_collection(self, node: yaml.Node, old: object, new: object) -> bool:
+        """Record the edits that turn node (holding old) into new. Returns False if node must be replaced whole."""
+        if isinstance(node, yaml.MappingNode) and isinstance(old, dict) and isinstance(new, dict) and new:
+            if len(node.value) != len(old):
+                return False  # Duplicate or merge keys: the nodes do not line up with the values
+            if node.flow_style:
+                return self.edit_flow_mapping(node, old, new)
+            return self.edit_block_mapping(node, old, new)
+        if isinstance(node, yaml.SequenceNode) and isinstance(old, list) and isinstance(new, list) and new:
+            if len(node.value) != len(old):
+                return False
+            if node.flow_style:
+                return self.edit_flow_sequence(node, old, new)
+            return self.edit_block_sequence(node, old, new)
+        return False
+
+    def edit_block_entry(self, node: yaml.Node, old: object, new: object, start: int, end: int,
+                         emit: Callable[[object], str], column: int) -> None:
+        """Edit a changed value in place, or re-emit the whole mapping entry or list item spanning start:end."""
+        if _same(old, new):
+            return
+        if isinstance(node, (yaml.MappingNode, yaml.SequenceNode)) and not node.flow_style and \
+                self.edit_collection(node, old, new):
+            return
+        self.edits.append((start, end, self.block_lines(emit(new), column)))
+
+    def edit_block_mapping(self, node: yaml.MappingNode, old: dict, new: dict) -> bool:
+        first_key = node.value[0][0].start_mark.index
+        if not self.starts_line(first_key):
+            return False  # The first key shares a line with a list dash
+        column = node.value[0][0].start_mark.column
+        for (key_node, value_node), (key, old_value) in zip(node.value, old.items()):
+            start, end = self.line_start(key_node.start_mark.index), self.line_end(self.node_end(value_node))
+            if key not in new:
+                self.edits.append((start, end, ''))
+            else:
+                self.edit_block_entry(value_node, old_value, new[key], start, end,
+                                      lambda value, key=key: dump_yaml({key: value}), column)
+        added = {key: value for key, value in new.items() if key not in old}
+        if added:
+            position = self.line_end(self.node_end(node.value[-1][1]))
+            self.edits.append((position, position, self.block_lines(dump_yaml(added), column)))
+        return True
+
+    def dash(self, item: yaml.Node) -> Optional[int]:
+        """Index of the `-` that introduces a block list item, if it is the first thing on its line."""
+        i = item.start_mark.index - 1
+        while i >= 0 and self.text[i] in ' \t\n':
+            i -= 1
+        return i if i >= 0 and self.text[i] == '-' and self.starts_line(i) else None
+
+    def edit_block_sequence(self, node: yaml.SequenceNode, old: list, new: list) -> bool:
+        dashes = [self.dash(item) for item in node.value]
+        if None in dashes:
+            return False
+        column = dashes[0] - self.line_start(dashes[0])
+        spans = [(self.line_start(dash), self.line_end(self.node_end(item))) for dash, item in zip(dashes, node.value)]
+        matcher = difflib.SequenceMatcher(None, [canonical_json(item) for item in old],
+                                          [canonical_json(item) for item in new], autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal':
+                continue
+            if tag == 'replace' and i2 - i1 == j2 - j1:
+                for k in range(i2 - i1):
+                    self.edit_block_entry(node.value[i1 + k], old[i1 + k], new[j1 + k], *spans[i1 + k],
+                                          lambda value: dump_yaml([value]), column)
+                continue
+            start = spans[i1][0] if i1 < len(spans) else spans[-1][1]
+            end = spans[i2 - 1][1] if i2 > i1 else start
+            self.edits.append((start, end, self.block_lines(dump_yaml(new[j1:j2]), column) if j2 > j1 else ''))
+        return True
+
+    def edit_flow_value(self, node: yaml.Node, old: object, new: object) -> None:
+        if _same(old, new) or self.edit_collection(node, old, new):
+            return
+        prefix = self.text[self.line_start(node.start_mark.index):node.start_mark.index]
+        indent = len(prefix) - len(prefix.lstrip())
+        self.edits.append((node.start_mark.index, node.end_mark.index, self.flow_value(new, indent)))
+
+    def edit_flow_mapping(self, node: yaml.MappingNode, old: dict, new: dict) -> bool:
+        if not any(key in new for key in old):
+            return False
+        items = list(zip(node.value, old.items()))
+        for (_, value_node), (key, old_value) in items:
+            if key in new:
+                self.edit_flow_value(value_node, old_value, new[key])
+
+        # Remove runs of deleted entries together with the comma that separates them from the entries kept
+        removed = [key not in new for key in old]
+        i = 0
+        while i < len(items):
+            if not removed[i]:
+                i += 1
+                continue
+            j = i
+            while j + 1 < len(items) and removed[j + 1]:
+                j += 1
+            if i > 0:
+                self.edits.append((self.node_end(items[i - 1][0][1]), self.node_end(items[j][0][1]), ''))
+            else:
+                self.edits.append((items[0][0][0].start_mark.index, items[j + 1][0][0].start_mark.index, ''))
+            i = j + 1
+
+        added = [(key, value) for key, value in new.items() if key not in old]
+        if added:
+            first_key = items[0][0][0]
+            indent = first_key.start_mark.column
+            separator = ',\n' + ' ' * indent if self.starts_line(first_key.start_mark.index) else ', '
+            position = self.node_end(items[-1][0][1])
+            self.edits.append((position, position, ''.join(
+                f"{separator}{json.dumps(key, ensure_ascii=False)}: {self.flow_value(value, indent)}"
+                for key, value in added)))
+        return True
+
+    def edit_flow_sequence(self, node: yaml.SequenceNode, old: list, new: list) -> bool:
+        if len(old) != len(new):
+            return False
+        for item_node, old_item, new_item in zip(node.value, old, new):
+            self.edit_flow_value(item_node, old_item, new_item)
+        return True
+
+
+def bytes_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def escape_pointer(token: object) -> str:
+    return str(token).replace('~', '~0').replace('/', '~1')
+
+
+def resolve_pointer(document: object, pointer: str) -> Tuple[bool, object]:
+    """Resolve a JSON pointer (`/components/schemas/Foo`) inside a document. Returns (found, value)."""
+    current = document
+    if not pointer:
+        return True, current
+    for raw_token in pointer.lstrip('/').split('/'):
+        token = unquote(raw_token).replace('~1', '/').replace('~0', '~')
+        if isinstance(current, dict) and token in current:
+            current = current[token]
+        elif isinstance(current, list) and token.isdigit() and int(token) < len(current):
+            current = current[int(token)]
+        else:
+            return False, None
+    return True, current
+
+
+def resolve_local_ref(spec: object, value: object) -> object:
+    """Follow `#/...` references until a non-reference value is reached. External references are returned as is."""
+    seen = set()
+    while isinstance(value, dict) and isinstance(value.get('$ref'), str) and value['$ref'].startswith('#'):
+        ref = value['$ref']
+        if ref in seen:
+            break
+        seen.add(ref)
+        found, target = resolve_pointer(spec, ref[1:])
+        if not found:
+            break
+        value = target
+    return value
+
+
+def collect_refs(node: object, refs: Set[str]) -> None:
+    """Add every local `$ref` in node to refs."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            ref = current.get('$ref')
+            if isinstance(ref, str) and ref.startswith('#/'):
+                refs.add(ref)
+            stack.extend(current.values())
+        elif isinstance(current, list):
+            stack.extend(current)
+
+
+def reachable_refs(spec: object, roots: List[object]) -> Set[str]:
+    """Every local `$ref` reachable from roots, following references transitively."""
+    reachable: Set[str] = set()
+    pending: Set[str] = set()
+    for root in roots:
+        collect_refs(root, pending)
+    while pending:
+        ref = pending.pop()
+        if ref in reachable:
+            continue
+        reachable.add(ref)
+        found, target = resolve_pointer(spec, ref[1:])
+        if found:
+            refs: Set[str] = set()
+            collect_refs(target, refs)
+            pending.update(refs - reachable)
+    return reachable
+
+
+def iter_operations(spec: dict) -> Iterator[Tuple[str, str, dict]]:
+    """Yield (path, method, operation) for every operation, in spec order."""
+    for path, path_item in (spec.get('paths') or {}).items():
+        if not isinstance(path_item, dict):
+            continue
+        for method in HTTP_METHODS:
+            operation = path_item.get(method)
+            if isinstance(operation, dict):
+                yield path, method, operation
+
+
+@dataclass
+class ApiPage:
+    """A page that documents one operation of a spec."""
+    path: str
+    method: str
+    api_path: str
+    spec_ref: str
+
+
+def split_dir(source: str) -> str:
+    """Where split-specs.py writes the parts of a spec: api-specs/<spec name>."""
+    return f"{Path(source).parent.as_posix()}/{Path(source).stem}"
+
+
+def find_api_pages(root: Path, source: str, extra_refs: Iterable[str] = ()) -> List[ApiPage]:
+    """Every page whose frontmatter points at the spec, at one of its split parts, or at one of extra_refs."""
+    refs = {f"/{source}", source, Path(source).stem, *extra_refs}
+    part_prefix = f"/{split_dir(source)}/"
+    pages = []
+    for page in discover_files(str(root)).pages:
+        content = (root / page).read_text(encoding='utf-8')
+        if 'openapi:' not in content:
+            continue
+        frontmatter, _, _ = parse_frontmatter(content)
+        value = frontmatter.get('openapi')
+        if not isinstance(value, str):
+            continue
+        parts = value.split()
+        if len(parts) != 3 or parts[1].lower() not in HTTP_METHODS:
+            continue
+        spec_ref, method, api_path = parts
+        if spec_ref in refs or spec_ref.startswith(part_prefix):
+            pages.append(ApiPage(page, method.lower(), api_path, spec_ref))
+    return pages
+
+
+# Keywords whose values are schemas, and keywords whose values are maps or lists of schemas
+SCHEMA_KEYWORDS = ('items', 'not', 'additionalProperties', 'if', 'then', 'else', 'contains', 'propertyNames',
+                   'unevaluatedItems', 'unevaluatedProperties', 'additionalItems')
+SCHEMA_MAP_KEYWORDS = ('properties', 'patternProperties', '$defs', 'definitions', 'dependentSchemas')
+SCHEMA_LIST_KEYWORDS = ('allOf', 'anyOf', 'oneOf', 'prefixItems')
+# Keys whose values are free-form data, never OpenAPI objects
+DATA_KEYWORDS = ('example', 'examples', 'default', 'enum', 'const', 'x-codeSamples', 'x-code-samples')
+
+
+def _schema_children(schema: dict) -> Iterator[Tuple[object, object]]:
+    for key in SCHEMA_KEYWORDS:
+        if isinstance(schema.get(key), dict):
+            yield schema, key
+    for key in SCHEMA_MAP_KEYWORDS:
+        if isinstance(schema.get(key), dict):
+            for name, value in schema[key].items():
+                if isinstance(value, dict):
+                    yield schema[key], name
+    for key in SCHEMA_LIST_KEYWORDS:
+        if isinstance(schema.get(key), list):
+            for i, value in enumerate(schema[key]):
+                if isinstance(value, dict):
+                    yield schema[key], i
+
+
+def iter_schema_slots(spec: dict) -> Iterator[Tuple[object, object, bool]]:
+    """
+    Yield (container, key, is_component) for every place a schema object sits, outermost first.
+    container[key] is the schema; is_component marks the top-level entries of `components.schemas`.
+    """
+    stack: list = []
+    component_schemas = (spec.get('components') or {}).get('schemas')
+    if isinstance(component_schemas, dict):
+        for name, value in component_schemas.items():
+            if isinstance(value, dict):
+                stack.append((component_schemas, name, True, True))
+    stack.append((None, spec, False, False))
+
+    while stack:
+        container, key, is_schema, is_component = stack.pop()
+        node = container[key] if container is not None else key
+        if is_schema:
+            yield container, key, is_component
+            stack.extend((child_container, child_key, True, False)
+                         for child_container, child_key in reversed(list(_schema_children(node))))
+            continue
+        # Outside schemas, only the value of a `schema` key is a schema
+        if isinstance(node, dict):
+            for name, value in reversed(list(node.items())):
+                if name in DATA_KEYWORDS:
+                    continue
+                if container is None and name == 'components' and isinstance(value, dict):
+                    stack.extend((value, part, False, False) for part in reversed(list(value)) if part != 'schemas')
+                elif name == 'schema' and isinstance(value, dict):
+                    stack.append((node, name, True, False))
+                elif isinstance(value, (dict, list)):
+                    stack.append((node, name, False, False))
+        elif isinstance(node, list):
+            for i in reversed(range(len(node))):
+                if isinstance(node[i], (dict, list)):
+                    stack.append((node, i, False, False))
+
+
+def canonical_json(value: object) -> str:
+    return json.dumps(value, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+
+class SemanticHasher:
+    """
+    Hash spec subtrees as if every local `$ref` were replaced by its target (a Merkle hash of the dereferenced
+    tree), without expanding anything. Two subtrees hash the same exactly when they dereference to the same value.
+    Hashes of referenced components are memoized, so hashing a whole spec is linear in its size.
+    """
+
+    def __init__(self, spec: object):
+        self.spec = spec
+        self._ref_hashes: dict = {}
+        self._in_progress: set = set()
+
+    def ref_hash(self, ref: str) -> str:
+        if ref in self._ref_hashes:
+            return self._ref_hashes[ref]
+        if ref in self._in_progress:
+            # A recursive schema: identify the cycle by where it points back to
+            return bytes_hash(f"cycle:{ref}".encode())
+        found, target = resolve_pointer(self.spec, ref[1:])
+        if not found:
+            return bytes_hash(f"missing:{ref}".encode())
+        self._in_progress.add(ref)
+        result = self.hash(target)
+        self._in_progress.discard(ref)
+        self._ref_hashes[ref] = result
+        return result
+
+    def hash(self, node: object) -> str:
+        if isinstance(node, dict):
+            ref = node.get('$ref')
+            if isinstance(ref, str) and ref.startswith('#') and len(node) == 1:
+                return self.ref_hash(ref)
+            parts = ','.join(f"{json.dumps(key)}:{self.hash(value)}" for key, value in sorted(node.items()))
+            return bytes_hash(f"{{{parts}}}".encode())
+        if isinstance(node, list):
+            return bytes_hash(f"[{','.join(self.hash(value) for value in node)}]".encode())
+        return bytes_hash(canonical_json(node).encode())
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Shrink the OpenAPI specs by sharing repeated schemas through `$ref` and dropping unused components.
+
+This script:
+1. Removes components (schemas, responses, parameters, request bodies, headers, examples) that nothing references
+2. Finds inline schemas that are structurally identical to each other or to an existing component schema
+3. Replaces them with a `$ref` to that component, creating one in `components.schemas` when none exists
+   (largest savings first, repeated until nothing worth sharing is left)
+4. Proves the result means the same: every operation, and every component that is kept, must dereference to
+   exactly the same value as before (compared with hashes of the dereferenced trees). Specs that fail the check
+   are never written.
+5. Reports the byte savings per spec, and the component schemas that are identical across specs
+
+Usage:
+    python scripts/optimize-specs.py [<spec> ...] [--min-size 200] [--keep-unused] [--write]
+
+Example:
+    python scripts/optimize-specs.py transcribe.json transcription-lite.json
+
+Arguments:
+    spec: File names in api-specs/ to optimize (default: every spec)
+"""
+
+import argparse
+import copy
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from openapi_spec import (SemanticHasher, canonical_json, dump_spec, escape_pointer, iter_schema_slots, list_specs,
+                          load_spec, reachable_refs, update_spec_text)
+
+# Components that are only ever used through $ref; securitySchemes are used by name and always kept
+REFERENCEABLE_COMPONENTS = ('schemas', 'responses', 'parameters', 'requestBodies', 'headers', 'examples', 'links',
+                            'callbacks')
+SCHEMA_REF_PREFIX = '#/components/schemas/'
+
+
+@dataclass
+class OptimizationResult:
+    name: str
+    original_bytes: int
+    optimized_bytes: int = 0
+    reserialized_bytes: int = 0
+    shared: List[Tuple[str, int, bool]] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+    spec: Optional[dict] = None
+
+
+def component_name(schema: dict, key: object, taken: Set[str]) -> str:
+    """Name a new component after the schema title or the property it was found under."""
+    source = schema.get('title') if isinstance(schema.get('title'), str) else key if isinstance(key, str) else ''
+    base = ''.join(word[:1].upper() + word[1:] for word in re.split(r'[^A-Za-z0-9]+', source)) or 'SharedSchema'
+    name = base
+    suffix = 2
+    while name in taken:
+        name = f"{base}{suffix}"
+        suffix += 1
+    return name
+
+
+def share_schemas(spec: dict, min_size: int) -> List[Tuple[str, int, bool]]:
+    """Replace repeated inline schemas with $refs. Returns (component, occurrences replaced, created) per share."""
+    shared = []
+    while True:
+        components: Dict[str, str] = {}
+        slots: Dict[str, List[Tuple[object, object]]] = {}
+        for container, key, is_component in iter_schema_slots(spec):
+            node = container[key]
+            if '$ref' in node:
+                continue
+            canonical = canonical_json(node)
+            if is_component:
+                components.setdefault(canonical, key)
+            elif len(canonical) >= min_size:
+                slots.setdefault(canonical, []).append((container, key))
+
+        best = None
+        for canonical, occurrences in slots.items():
+            existing = components.get(canonical)
+            ref_size = len(SCHEMA_REF_PREFIX) + 12 + len(existing or 'SharedSchema')
+            copies_removed = len(occurrences) if existing else len(occurrences) - 1
+            savings = copies_removed * len(canonical) - len(occurrences) * ref_size
+            if copies_removed and savings > 0 and (best is None or savings > best[0]):
+                best = (savings, canonical, existing)
+        if best is None:
+            return shared
+
+        _, canonical, name = best
+        occurrences = slots[canonical]
+        created = name is None
+        if created:
+            schemas = spec.setdefault('components', {}).setdefault('schemas', {})
+            first_container, first_key = occurrences[0]
+            name = component_name(first_container[first_key], first_key, set(schemas))
+            schemas[name] = copy.deepcopy(first_container[first_key])
+        for container, key in occurrences:
+            container[key] = {'$ref': SCHEMA_REF_PREFIX + escape_pointer(name)}
+        shared.append((name, len(occurrences), created))
+
+
+def remove_unused_components(spec: dict) -> List[str]:
+    """Drop referenceable components that nothing outside `components` reaches. Returns their pointers."""
+    components = spec.get('components') or {}
+    roots = [{key: value for key, value in spec.items() if key != 'components'},
+             # securitySchemes and any extension stay, so whatever they reference stays too
+             {key: value for key, value in components.items() if key not in REFERENCEABLE_COMPONENTS}]
+    reachable = reachable_refs(spec, roots)
+
+    removed = []
+    for kind in REFERENCEABLE_COMPONENTS:
+        entries = components.get(kind)
+        if not isinstance(entries, dict):
+            continue
+        for name in list(entries):
+            pointer = f"#/components/{kind}/{escape_pointer(name)}"
+            # A component is kept if it, or anything inside it, is referenced
+            if not any(ref == pointer or ref.startswith(pointer + '/') for ref in reachable):
+                del entries[name]
+                removed.append(pointer)
+        if not entries:
+            del components[kind]
+    return removed
+
+
+def verify_equivalent(original: dict, optimized: dict) -> Optional[str]:
+    """Return why optimized does not dereference to the same spec as original, or None if it does."""
+    before = SemanticHasher(original)
+    after = SemanticHasher(optimized)
+    for key in set(original) | set(optimized):
+        if key == 'components':
+            continue
+        if before.hash(original.get(key)) != after.hash(optimized.get(key)):
+            return f"'{key}' changed"
+    for kind, entries in (optimized.get('components') or {}).items():
+        if not isinstance(entries, dict):
+            continue
+        original_entries = (original.get('components') or {}).get(kind) or {}
+        for name, value in entries.items():
+            if name in original_entries and before.hash(original_entries[name]) != after.hash(value):
+                return f"components.{kind}.{name} changed"
+    return None
+
+
+def optimize(path: Path, min_size: int, keep_unused: bool) -> OptimizationResult:
+    result = OptimizationResult(path.name, path.stat().st_size)
+    original = load_spec(path)
+    spec = copy.deepcopy(original)
+
+    # Unused components go first, so nothing is shared out of a schema that is about to be removed
+    if not keep_unused:
+        result.removed = remove_unused_components(spec)
+    result.shared = share_schemas(spec, min_size)
+
+    result.error = verify_equivalent(original, spec)
+    result.reserialized_bytes = len(dump_spec(original, path.suffix).encode('utf-8'))
+    result.optimized_bytes = len(dump_spec(spec, path.suffix).encode('utf-8'))
+    result.spec = spec
+    return result
+
+
+def shared_across_specs(specs: Dict[str, dict]) -> List[Tuple[List[str], int]]:
+    """Component schemas that dereference identically in more than one spec: ([spec:name, ...], size)."""
+    by_hash: Dict[str, List[str]] = {}
+    sizes: Dict[str, int] = {}
+    for name, spec in specs.items():
+        hasher = SemanticHasher(spec)
+        for schema_name, schema in ((spec.get('components') or {}).get('schemas') or {}).items():
+            digest = hasher.hash(schema)
+            by_hash.setdefault(digest, []).append(f"{name}:{schema_name}")
+            sizes[digest] = len(canonical_json(schema))
+    return sorted(((owners, sizes[digest]) for digest, owners in by_hash.items()
+                   if len({owner.split(':', 1)[0] for owner in owners}) > 1), key=lambda item: -item[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Share repeated schemas and remove unused components in the specs')
+    parser.add_argument('specs', nargs='*', help='Spec file names in api-specs/ (default: every spec)')
+    parser.add_argument('--root-dir', default=str(Path(__file__).parent.parent),
+                        help='Repository root (default: parent of the scripts directory)')
+    parser.add_argument('--min-size', type=int, default=200,
+                        help='Smallest inline schema, in bytes of compact JSON, worth sharing (default: 200)')
+    parser.add_argument('--keep-unused', action='store_true', help='Keep components that nothing references')
+    parser.add_argument('--write', action='store_true', help='Write the optimized specs (default: only report)')
+
+    args = parser.parse_args()
+
+    paths = list_specs(args.root_dir)
+    if args.specs:
+        paths = [path for path in paths if path.name in args.specs]
+        missing = set(args.specs) - {path.name for path in paths}
+        if missing:
+            print(f"❌ Spec(s) not found in api-specs/: {', '.join(sorted(missing))}")
+            sys.exit(1)
+
+    failed = False
+    results = []
+    for path in paths:
+        result = optimize(path, args.min_size, args.keep_unused)
+        results.append(result)
+        print(f"\n📄 {result.name}")
+        for name, count, created in result.shared:
+            print(f"  🔗 {count} inline cop{'y' if count == 1 else 'ies'} → "
+                  f"{'new ' if created else ''}#/components/schemas/{name}")
+        if result.removed:
+            print(f"  🗑️  {len(result.removed)} unused component(s): {', '.join(result.removed)}")
+        if result.error:
+            print(f"  ❌ Round-trip check failed: {result.error} - not written")
+            failed = True
+            continue
+        saved = result.reserialized_bytes - result.optimized_bytes
+        print(f"  ✅ Dereferenced spec unchanged. {result.original_bytes:,} bytes on disk; re-serialized "
+              f"{result.reserialized_bytes:,} → {result.optimized_bytes:,} bytes ({saved:,} saved, "
+              f"{saved / max(result.reserialized_bytes, 1):.1%})")
+        if args.write and (result.shared or result.removed):
+            path.write_text(update_spec_text(path.read_text(encoding='utf-8'), result.spec, path.suffix),
+                            encoding='utf-8')
+            print(f"  💾 Wrote {path.name}")
+
+    common = shared_across_specs({path.name: load_spec(path) for path in paths})
+    if common:
+        print(f"\n🔁 {len(common)} component schema(s) are identical in more than one spec "
+              f"({sum(size for _, size in common):,} bytes per copy):")
+        for owners, size in common[:10]:
+            print(f"  {', '.join(owners)} ({size:,} bytes)")
+        if len(common) > 10:
+            print(f"  ... and {len(common) - 10} more")
+
+    if not args.write:
+        print("\nℹ️  Run with --write to update the specs")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Find (and optionally remove) images that nothing references.
+
+This script:
+1. Builds the set of referenced assets from every page (media spans via asset_index, plus any other mention of an
+   asset path such as links, component props or code samples), docs.json (logo, favicon and any other asset path)
+   and the site scripts
+2. Diffs that set against every file under a `*/images/` directory
+3. Reports the orphaned files and the bytes they take up
+4. With --remove, deletes all orphans with a single `git rm`
+
+References are matched generously, so an asset is only reported when no file mentions its path at all.
+
+Usage:
+    python scripts/orphan-assets.py [--remove] [--dry-run]
+
+Example:
+    python scripts/orphan-assets.py
+"""
+
+import argparse
+import json
+import posixpath
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Set
+
+from asset_index import build_asset_index, resolve_asset_reference
+from file_discovery import ASSET_EXTENSIONS, discover_files
+from page_content import is_external_link
+from script_loader import load_script
+
+move_file = load_script('move-file.py')
+
+SITE_SCRIPTS_DIR = 'site-scripts'
+ASSET_PATH_PATTERN = re.compile(
+    r'[^\s"\'`()<>\[\]{}=,]+(?:' + '|'.join(re.escape(ext) for ext in ASSET_EXTENSIONS) + r')\b',
+    re.IGNORECASE)
+
+
+def mentioned_assets(source: str, content: str) -> Iterator[str]:
+    """Yield every asset path mentioned anywhere in a file, resolved both relative to it and to the root."""
+    for match in ASSET_PATH_PATTERN.finditer(content):
+        url = match.group(0)
+        if is_external_link(url):
+            continue
+        for asset in (resolve_asset_reference(source, url), resolve_asset_reference('', '/' + url.lstrip('./'))):
+            if asset:
+                yield asset
+
+
+def docs_json_strings(value) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from docs_json_strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from docs_json_strings(item)
+
+
+def referenced_assets(root_dir: str, pages: List[str]) -> Set[str]:
+    """Every asset path that a page, docs.json or a site script refers to."""
+    root = Path(root_dir)
+    index = build_asset_index(root_dir, pages)
+    referenced = set(index.references)
+    for page, content in index.contents.items():
+        referenced.update(mentioned_assets(page, content))
+
+    docs_json_path = root / 'docs.json'
+    if docs_json_path.exists():
+        with open(docs_json_path, 'r', encoding='utf-8') as f:
+            docs_data = json.load(f)
+        for value in docs_json_strings(docs_data):
+            referenced.update(mentioned_assets('docs.json', value))
+
+    scripts_dir = root / SITE_SCRIPTS_DIR
+    if scripts_dir.is_dir():
+        for script in sorted(scripts_dir.rglob('*')):
+            if script.is_file():
+                relative = script.relative_to(root).as_posix()
+                referenced.update(mentioned_assets(relative, script.read_text(encoding='utf-8', errors='replace')))
+
+    return referenced
+
+
+def is_image_directory_asset(asset: str) -> bool:
+    return 'images' in posixpath.dirname(asset).split('/')
+
+
+def find_orphans(root_dir: str) -> Dict[str, int]:
+    """Return orphaned asset path → size in bytes for every unreferenced file under an images directory."""
+    discovered = discover_files(root_dir)
+    referenced = referenced_assets(root_dir, discovered.pages)
+    root = Path(root_dir)
+    return {asset: (root / asset).stat().st_size for asset in sorted(discovered.assets)
+            if is_image_directory_asset(asset) and asset not in referenced}
+
+
+def format_size(size: float) -> str:
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.1f} {unit}" if unit != 'B' else f"{int(size)} B"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def remove_orphans(root_dir: str, orphans: List[str]) -> bool:
+    """Remove every orphan with one git rm, deleting untracked ones directly."""
+    exit_code, stdout, _ = move_file.run_command(['git', 'ls-files', '--', *orphans], cwd=root_dir)
+    tracked = set(stdout.splitlines()) if exit_code == 0 else set()
+
+    if tracked:
+        exit_code, _, stderr = move_file.run_command(['git', 'rm', '--quiet', '--', *sorted(tracked)], cwd=root_dir)
+        if exit_code != 0:
+            print(f"❌ git rm failed: {stderr.strip()}")
+            return False
+    for asset in orphans:
+        if asset not in tracked:
+            (Path(root_dir) / asset).unlink()
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find and remove images that no page, docs.json or script uses')
+    parser.add_argument('--root-dir', default=str(Path(__file__).parent.parent),
+                        help='Repository root (default: parent of the scripts directory)')
+    parser.add_argument('--remove', action='store_true', help='Delete the orphaned files with git rm')
+    parser.add_argument('--dry-run', action='store_true', help='With --remove, only show what would be deleted')
+
+    args = parser.parse_args()
+
+    print("🔍 Collecting asset references...")
+    orphans = find_orphans(args.root_dir)
+
+    if not orphans:
+        print("✅ No orphaned images found")
+        return
+
+    by_directory: Dict[str, List[str]] = {}
+    for asset in orphans:
+        by_directory.setdefault(posixpath.dirname(asset), []).append(asset)
+    for directory in sorted(by_directory):
+        assets = by_directory[directory]
+        print(f"\n📁 {directory} ({len(assets)} orphan(s), {format_size(sum(orphans[a] for a in assets))})")
+        for asset in assets:
+            print(f"  🗑️  {posixpath.basename(asset)} ({format_size(orphans[asset])})")
+
+    total = sum(orphans.values())
+    print("-" * 60)
+    print(f"📊 {len(orphans)} orphaned file(s), {format_size(total)} reclaimable")
+
+    if not args.remove:
+        print("ℹ️  Run with --remove to delete them")
+        return
+    if args.dry_run:
+        print("🔍 Dry run - nothing was removed")
+        return
+
+    if not remove_orphans(args.root_dir, list(orphans)):
+        sys.exit(1)
+    print(f"✅ Removed {len(orphans)} file(s)")
+
+
+if __name__ == '__main__':
+    main()
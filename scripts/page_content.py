@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for reading documentation page content.
+
+Keeps the rules for what counts as prose, code and an internal link in one place, so the link tools agree on
+what they check.
+"""
+
+import itertools
+import posixpath
+import re
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+try:
+    import yaml
+except ImportError:  # PyYAML is optional; fall back to a flat key: value parser
+    yaml = None
+
+# Opening or closing fence: ``` or ~~~, optionally indented and followed by an info string
+FENCE_PATTERN = re.compile(r'^(\s*)(`{3,}|~{3,})(.*)$')
+
+EXTERNAL_PREFIXES = ('http://', 'https://', 'mailto:', 'tel:', 'data:', '//')
+
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+ID_ATTRIBUTE_PATTERN = re.compile(r'\bid=["\']([^"\']+)["\']')
+# How the hosted renderer slugs these is not known: each may be kept, turned into `-` or dropped
+UNCERTAIN_SLUG_CHARACTERS = ('/', '.')
+
+
+def page_url(page_path: str) -> str:
+    """Convert a page file path to its site URL (`index.mdx` is served at `/`)."""
+    url = '/' + page_path.rsplit('.', 1)[0]
+    if url == '/index':
+        return '/'
+    if url.endswith('/index'):
+        return url[:-len('/index')]
+    return url
+
+
+def parse_frontmatter(content: str) -> Tuple[Dict[str, object], str, int]:
+    """
+    Split a page into its frontmatter and body.
+    Returns (frontmatter, body, body_start_line) where body_start_line is the 1-based line the body starts on.
+    """
+    content = content.lstrip('\ufeff')
+    if not content.startswith('---'):
+        return {}, content, 1
+
+    end = re.search(r'^---\s*$', content[3:], re.MULTILINE)
+    if end is None:
+        return {}, content, 1
+
+    raw = content[3:3 + end.start()]
+    body = content[3 + end.end():].lstrip('\n')
+    body_start_line = content.count('\n', 0, len(content) - len(body)) + 1
+
+    if yaml is not None:
+        try:
+            frontmatter = yaml.safe_load(raw) or {}
+        except yaml.YAMLError:
+            frontmatter = {}
+        return (frontmatter if isinstance(frontmatter, dict) else {}), body, body_start_line
+
+    frontmatter = {}
+    key = None
+    for line in raw.split('\n'):
+        match = re.match(r'^([A-Za-z_][\w-]*):\s*(.*)$', line)
+        if match:
+            key = match.group(1)
+            frontmatter[key] = match.group(2).strip()
+        elif key and line.strip():
+            # Folded continuation line
+            frontmatter[key] = f"{frontmatter[key]} {line.strip()}".strip()
+    for key, value in frontmatter.items():
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in '\'"':
+            frontmatter[key] = value[1:-1]
+    return frontmatter, body, body_start_line
+
+
+def strip_code_blocks(content: str, strip_inline: bool = True) -> str:
+    """Blank out fenced code blocks (and inline code unless strip_inline is False), keeping line numbers stable."""
+    lines = content.split('\n')
+    fence = None
+
+    for i, line in enumerate(lines):
+        match = FENCE_PATTERN.match(line)
+        if fence is None:
+            if match:
+                fence = match.group(2)
+                lines[i] = ''
+            elif strip_inline:
+                lines[i] = re.sub(r'`[^`\n]*`', '', line)
+        else:
+            if match and match.group(2).startswith(fence[0] * len(fence)) and not match.group(3).strip():
+                fence = None
+            lines[i] = ''
+
+    return '\n'.join(lines)
+
+
+class CodeBlock(NamedTuple):
+    """A fenced code block. line is the 1-based line of the opening fence; code has the fence indentation removed."""
+    language: str
+    info: str
+    code: str
+    line: int
+
+
+def iter_code_blocks(content: str, first_line: int = 1) -> Iterator[CodeBlock]:
+    """
+    Yield the fenced code blocks of a page body, in order. The language is the first word of the info string,
+    lowercased; first_line is the line number the body starts on, so line numbers match the file.
+    """
+    fence = None
+    for i, line in enumerate(content.split('\n')):
+        match = FENCE_PATTERN.match(line)
+        if fence is None:
+            if match:
+                fence, indent, info, start, code = match.group(2), len(match.group(1)), match.group(3).strip(), i, []
+        elif match and match.group(2).startswith(fence[0] * len(fence)) and not match.group(3).strip():
+            language = info.split()[0].lower() if info else ''
+            yield CodeBlock(language, info, '\n'.join(code), first_line + start)
+            fence = None
+        else:
+            # Blocks nested in components are indented; the fence indentation is not part of the code
+            code.append(line[indent:] if not line[:indent].strip() else line.lstrip())
+
+
+def mask_code_blocks(content: str) -> str:
+    """Replace fenced and inline code with spaces, keeping every character offset stable."""
+    lines = content.split('\n')
+    fence = None
+
+    for i, line in enumerate(lines):
+        match = FENCE_PATTERN.match(line)
+        if fence is None:
+            if match:
+                fence = match.group(2)
+                lines[i] = ' ' * len(line)
+            else:
+                lines[i] = re.sub(r'`[^`\n]*`', lambda code: ' ' * len(code.group(0)), line)
+        else:
+            if match and match.group(2).startswith(fence[0] * len(fence)) and not match.group(3).strip():
+                fence = None
+            lines[i] = ' ' * len(line)
+
+    return '\n'.join(lines)
+
+
+def clean_link_url(url: str) -> str:
+    """Strip an optional markdown link title and angle brackets from a link destination."""
+    url = url.strip()
+    if url.startswith('<') and '>' in url:
+        return url[1:url.index('>')]
+    return url.split()[0] if url else url
+
+
+def is_external_link(url: str) -> bool:
+    """Check whether a link leaves the documentation site."""
+    return url.lower().startswith(EXTERNAL_PREFIXES)
+
+
+def split_internal_link(url: str) -> Optional[Tuple[str, str]]:
+    """
+    Split an internal link into (path, fragment).
+
+    Follows update-links.py: links without a leading slash are treated as root-relative. File extensions and
+    query strings are dropped. Returns None for external links. A bare `#anchor` returns an empty path.
+    """
+    url = clean_link_url(url)
+    if not url or is_external_link(url):
+        return None
+
+    path, _, fragment = url.partition('#')
+    path = path.split('?', 1)[0]
+    if not path:
+        return '', fragment
+
+    if not path.startswith('/'):
+        path = '/' + path
+    path = posixpath.normpath(path).replace('//', '/')
+    if path.endswith(('.mdx', '.md')):
+        path = path.rsplit('.', 1)[0]
+    return path, fragment
+
+
+def extract_headings(body: str) -> List[Tuple[int, str, int]]:
+    """Return the markdown headings of a page body as (level, text, line_index), skipping code blocks."""
+    headings = []
+    for i, line in enumerate(strip_code_blocks(body, strip_inline=False).split('\n')):
+        match = HEADING_PATTERN.match(line)
+        if match:
+            headings.append((len(match.group(1)), match.group(2), i))
+    return headings
+
+
+def markdown_to_text(body: str) -> str:
+    """Reduce an MDX body to plain prose: no code blocks, JSX tags, link targets or markdown punctuation."""
+    text = strip_code_blocks(body, strip_inline=False)
+    text = re.sub(r'^(import|export)\s.*$', '', text, flags=re.MULTILINE)
+    text = re.sub(r'<!--.*?-->', ' ', text, flags=re.DOTALL)
+    text = re.sub(r'!\[([^\]]*)\]\([^)]*\)', r'\1', text)
+    text = re.sub(r'\[([^\]]*)\]\([^)]*\)', r'\1', text)
+    text = re.sub(r'</?[A-Za-z][^>]*?/?>', ' ', text)
+    text = re.sub(r'[`*_#>|~]+', ' ', text)
+    return re.sub(r'[ \t]+', ' ', text)
+
+
+def heading_slug(text: str) -> str:
+    """
+    Convert heading text to the anchor slug the docs renderer generates.
+
+    Markdown formatting is dropped and the text is lowercased. Whitespace, `/` and `.` become `-`, every other
+    character except letters, digits, `_` and `-` is removed, and runs of `-` are collapsed. How the renderer treats
+    `/`, `.` and runs of `-` has not been checked against its output, so links are validated against every form in
+    heading_slug_variants rather than against this one.
+    """
+    text = re.sub(r'!?\[([^\]]*)\]\([^)]*\)', r'\1', text)
+    text = re.sub(r'</?[A-Za-z][^>]*?/?>', '', text)
+    text = re.sub(r'[`*~]', '', text)
+    text = re.sub(r'[\s/.]+', '-', text.lower().strip())
+    text = re.sub(r'[^\w-]', '', text)
+    return re.sub(r'-{2,}', '-', text).strip('-')
+
+
+def heading_slug_variants(text: str) -> Set[str]:
+    """
+    Every anchor the docs renderer may generate for a heading, for checking links against it.
+
+    The characters in UNCERTAIN_SLUG_CHARACTERS may each be kept, turned into `-` or dropped, and runs of `-` left
+    by removed punctuation may or may not be collapsed. Links written either way are accepted until the renderer's
+    rules are known.
+    """
+    text = re.sub(r'!?\[([^\]]*)\]\([^)]*\)', r'\1', text)
+    text = re.sub(r'</?[A-Za-z][^>]*?/?>', '', text)
+    text = re.sub(r'[`*~]', '', text).lower().strip()
+    variants = {heading_slug(text)}
+    present = [char for char in UNCERTAIN_SLUG_CHARACTERS if char in text]
+    for replacements in itertools.product(*[(char, '-', '') for char in present]):
+        slug = text
+        for char, replacement in zip(present, replacements):
+            slug = slug.replace(char, replacement)
+        slug = re.sub(r'[^\w\s/.-]', '', slug)
+        slug = re.sub(r'\s', '-', slug)
+        variants.add(slug)
+        variants.add(re.sub(r'-{2,}', '-', slug).strip('-'))
+    return variants
+
+
+def page_anchors(body: str) -> Set[str]:
+    """Return every anchor a page body defines: heading slugs (numbered when repeated, in every form the renderer may
+    generate, see heading_slug_variants) and explicit id attributes."""
+    anchors = set()
+    seen: Dict[str, int] = {}
+    for _, text, _ in extract_headings(body):
+        count = seen.get(heading_slug(text), 0)
+        seen[heading_slug(text)] = count + 1
+        anchors.update(slug if count == 0 else f"{slug}-{count}" for slug in heading_slug_variants(text))
+    anchors.update(ID_ATTRIBUTE_PATTERN.findall(strip_code_blocks(body)))
+    return anchors
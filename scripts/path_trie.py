@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Prefix trie over site paths.
+
+Paths are stored one `/` segment per level, and every node keeps the number of keys below it. Counting the keys
+under a prefix therefore costs one walk down the prefix. Listing, removing or re-rooting them costs time
+proportional to the matches, never to the size of the table. Prefixes are plain string prefixes: `/guides/trans`
+matches `/guides/transcription/...` as well as `/guides/translation`.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_MISSING = object()
+
+
+class _Node:
+    __slots__ = ('children', 'value', 'count')
+
+    def __init__(self):
+        self.children: Dict[str, '_Node'] = {}
+        self.value: Any = _MISSING
+        self.count = 0
+
+
+class PathTrie:
+    """A mapping from paths to values, indexed by path prefix."""
+
+    def __init__(self):
+        self._root = _Node()
+
+    def __len__(self) -> int:
+        return self._root.count
+
+    def __contains__(self, key: str) -> bool:
+        node = self._find(key.split('/'))
+        return node is not None and node.value is not _MISSING
+
+    def _find(self, segments: List[str]) -> Optional[_Node]:
+        node = self._root
+        for segment in segments:
+            node = node.children.get(segment)
+            if node is None:
+                return None
+        return node
+
+    def insert(self, key: str, value: Any) -> None:
+        """Insert or replace the value stored at key."""
+        segments = key.split('/')
+        node = self._find(segments)
+        is_new = node is None or node.value is _MISSING
+
+        node = self._root
+        if is_new:
+            node.count += 1
+        for segment in segments:
+            node = node.children.setdefault(segment, _Node())
+            if is_new:
+                node.count += 1
+        node.value = value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        node = self._find(key.split('/'))
+        if node is None or node.value is _MISSING:
+            return default
+        return node.value
+
+    def longest_prefix(self, key: str) -> Optional[Tuple[str, Any]]:
+        """
+        Return the (key, value) of the longest stored key that is a prefix of key, or None. Costs one walk down
+        key, checking the children of each node on the way for stored keys ending part-way through a segment.
+        """
+        segments = key.split('/')
+        node = self._root
+        best = None
+        for depth, segment in enumerate(segments):
+            # Keys at this depth are longer than any found above, and a longer last segment is a longer key
+            for name, child in node.children.items():
+                if child.value is not _MISSING and segment.startswith(name) and \
+                        (best is None or best[0] < depth or len(best[1]) < len(name)):
+                    best = (depth, name, child.value)
+            node = node.children.get(segment)
+            if node is None:
+                break
+        if best is None:
+            return None
+        depth, name, value = best
+        return '/'.join(segments[:depth] + [name]), value
+
+    def setdefault(self, key: str, default: Any) -> Any:
+        """Return the value at key, inserting default first if key is missing."""
+        node = self._find(key.split('/'))
+        if node is None or node.value is _MISSING:
+            self.insert(key, default)
+            return default
+        return node.value
+
+    def remove(self, key: str) -> Any:
+        """Remove key and return its value. Raises KeyError if it is missing."""
+        removed = self._detach(key.split('/'), whole_subtree=False)
+        if not removed:
+            raise KeyError(key)
+        return removed[0][1]
+
+    @staticmethod
+    def _child_key(key: Optional[str], name: str) -> str:
+        return name if key is None else f"{key}/{name}"
+
+    def _matching_subtrees(self, prefix: str) -> List[Tuple[str, _Node]]:
+        """Return the (key, node) roots of the subtrees holding every key that starts with prefix."""
+        segments = prefix.split('/')
+        node = self._root
+        for segment in segments[:-1]:
+            node = node.children.get(segment)
+            if node is None:
+                return []
+
+        # The last segment may be partial, so every child starting with it matches
+        base = '/'.join(segments[:-1]) if len(segments) > 1 else None
+        partial = segments[-1]
+        return [(self._child_key(base, name), child) for name, child in node.children.items()
+                if name.startswith(partial)]
+
+    def _walk(self, key: Optional[str], node: _Node) -> Iterator[Tuple[str, Any]]:
+        stack = [(key, node)]
+        while stack:
+            current_key, current = stack.pop()
+            if current.value is not _MISSING:
+                yield current_key, current.value
+            stack.extend((self._child_key(current_key, name), child) for name, child in current.children.items())
+
+    def items(self, prefix: str = '') -> List[Tuple[str, Any]]:
+        """Return every (key, value) whose key starts with prefix, sorted by key."""
+        subtrees = self._matching_subtrees(prefix) if prefix else [(None, self._root)]
+        return sorted((item for key, node in subtrees for item in self._walk(key, node)), key=lambda item: item[0])
+
+    def count(self, prefix: str = '') -> int:
+        """Return how many keys start with prefix."""
+        if not prefix:
+            return self._root.count
+        return sum(node.count for _, node in self._matching_subtrees(prefix))
+
+    def _detach(self, segments: List[str], whole_subtree: bool) -> List[Tuple[str, Any]]:
+        """Remove the key at segments (or its whole subtree), fixing counts on the way back up."""
+        parents = [self._root]
+        for segment in segments:
+            node = parents[-1].children.get(segment)
+            if node is None:
+                return []
+            parents.append(node)
+
+        node = parents[-1]
+        if whole_subtree:
+            removed = list(self._walk('/'.join(segments), node))
+            node.count = 0
+        elif node.value is not _MISSING:
+            removed = [('/'.join(segments), node.value)]
+            node.value = _MISSING
+            node.count -= 1
+        else:
+            return []
+
+        for parent in parents[:-1]:
+            parent.count -= len(removed)
+        # Prune nodes left without keys below them
+        for depth in range(len(segments), 0, -1):
+            if parents[depth].count:
+                break
+            del parents[depth - 1].children[segments[depth - 1]]
+        return removed
+
+    def remove_prefix(self, prefix: str) -> List[Tuple[str, Any]]:
+        """Remove every key that starts with prefix. Returns the removed (key, value) pairs, sorted by key."""
+        removed = []
+        for key, _ in self._matching_subtrees(prefix):
+            removed.extend(self._detach(key.split('/'), whole_subtree=True))
+        return sorted(removed, key=lambda item: item[0])
+
+    def rewrite_prefix(self, old_prefix: str, new_prefix: str) -> List[Tuple[str, str, Any]]:
+        """
+        Move every key that starts with old_prefix under new_prefix, replacing values already stored there.
+        Returns (old key, new key, value) for each moved key.
+        """
+        moved = [(key, new_prefix + key[len(old_prefix):], value) for key, value in self.remove_prefix(old_prefix)]
+        for _, new_key, value in moved:
+            self.insert(new_key, value)
+        return moved
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Local HTML preview of the documentation, re-rendering only what an edit touches.
+
+This script:
+1. Serves every page at its docs.json path as HTML: the page rendered from MDX (with the Mintlify components
+   stood in by simple HTML), inside the sidebar of its docs.json tab. Images and the docs.json redirects are
+   served like the hosted site.
+2. Renders a page the first time it is requested, and keeps the result keyed by the hash of the page and of every
+   file it imports, so unchanged pages are never rendered twice (and undoing an edit is served from memory)
+3. Watches the files behind every rendered page. When one changes, only the pages that depend on it are
+   re-rendered: the page itself, or every page importing an edited snippet. A docs.json change reloads the
+   navigation and redirects; a changed page title only rebuilds the sidebar.
+4. Reloads open browser tabs as soon as their page is re-rendered, through a long poll, so an edit shows up in
+   the browser well under 100 ms after it is saved
+
+Usage:
+    python scripts/preview-server.py [--port 3333] [--host 127.0.0.1]
+
+Example:
+    python scripts/preview-server.py --port 8080
+"""
+
+import argparse
+import asyncio
+import hashlib
+import html
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from mdx_render import page_imports, render_mdx
+from page_content import page_url, parse_frontmatter
+from redirect_table import normalize_path
+from script_loader import load_script
+
+docs_server = load_script('docs-server.py')
+navigation_tree = load_script('navigation-tree.py')
+
+# Bump when the renderer or the page layout changes, so nothing rendered before is reused
+PREVIEW_VERSION = 1
+WATCH_INTERVAL = 0.05
+LONG_POLL_TIMEOUT = 25
+WAIT_PREFIX = '/__preview/wait/'
+# Renderings kept by content hash, so switching back and forth between versions of a page is not rendered again
+MAX_CACHED_RENDERINGS = 2000
+
+STYLE = """
+body { margin: 0; font: 15px/1.6 system-ui, sans-serif; color: #1f2328; }
+header { display: flex; gap: 1.5rem; padding: .75rem 1.5rem; border-bottom: 1px solid #d0d7de; }
+header a { color: inherit; text-decoration: none; } header a.active { font-weight: 600; color: #53a626; }
+.layout { display: flex; } aside.sidebar { width: 280px; padding: 1rem; border-right: 1px solid #d0d7de; }
+aside.sidebar ul { list-style: none; padding-left: .75rem; margin: 0; } aside.sidebar a.active { font-weight: 600; }
+.group { margin-top: .75rem; font-weight: 600; font-size: 13px; }
+main { max-width: 820px; padding: 1rem 2.5rem; } img { max-width: 100%; height: auto; }
+pre { background: #f6f8fa; padding: .75rem; overflow: auto; } .code-title { font-size: 12px; color: #57606a; }
+aside.callout { border-left: 4px solid #54aeff; background: #f6f8fa; padding: .25rem 1rem; margin: 1rem 0; }
+aside.callout-warning, aside.callout-danger { border-color: #d4a72c; } aside.callout-tip { border-color: #53a626; }
+.card { display: block; border: 1px solid #d0d7de; border-radius: 8px; padding: .75rem 1rem; margin: .5rem 0;
+        color: inherit; }
+section.tab, section.step, section.accordion { border-left: 2px solid #d0d7de; padding-left: 1rem; margin: 1rem 0; }
+.section-title { font-weight: 600; } figure.frame { margin: 1rem 0; } table { border-collapse: collapse; }
+td, th { border: 1px solid #d0d7de; padding: .25rem .5rem; } .description { color: #57606a; }
+"""
+
+RELOAD_SCRIPT = """
+<script>
+(async function poll() {
+  try {
+    const response = await fetch(%s);
+    if (response.status === 200) { location.reload(); return; }
+  } catch (e) { await new Promise(resolve => setTimeout(resolve, 1000)); }
+  poll();
+})();
+</script>
+"""
+
+
+def stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@dataclass
+class RenderedPage:
+    """A rendered page and the files it was rendered from."""
+    page: str
+    key: str
+    body: str
+    title: str
+    description: str
+    openapi: Optional[str]
+    dependencies: List[str] = field(default_factory=list)
+
+
+class PreviewSite(docs_server.DocsSite):
+    """The docs tree served as HTML, with every page rendered on demand and re-rendered only when it changes."""
+
+    def __init__(self, root_dir: str, docs_file: str):
+        self.docs_file = Path(docs_file)
+        self.rendered: Dict[str, RenderedPage] = {}
+        self.by_key: Dict[str, RenderedPage] = {}
+        self.stats: Dict[str, Optional[Tuple[int, int]]] = {}
+        self.dependents: Dict[str, Set[str]] = {}
+        self.sidebars: Dict[int, str] = {}
+        self.generation = 0
+        self.changed: Optional[asyncio.Event] = None
+        self.load(root_dir)
+
+    def load(self, root_dir: str) -> None:
+        """(Re)read docs.json: pages, assets, redirects (one hop at a time) and the navigation."""
+        super().__init__(root_dir, str(self.docs_file))
+        with open(self.docs_file, 'r', encoding='utf-8') as f:
+            self.docs = json.load(f)
+        self.docs_stat = stat_key(self.docs_file)
+        self.tabs = self.docs.get('navigation', {}).get('tabs', [])
+        self.page_tabs: Dict[str, int] = {}
+        for index, tab in enumerate(self.tabs):
+            for page in navigation_tree.collect_nav_pages(tab):
+                self.page_tabs.setdefault(page_url(f"{page.lstrip('/')}.mdx"), index)
+        self.titles = {page: info.get('sidebarTitle') or info.get('title')
+                       for page, info in navigation_tree.page_titles(
+                           sorted({page for tab in self.tabs for page in navigation_tree.collect_nav_pages(tab)}),
+                           self.read_files).items()}
+        self.sidebars.clear()
+        self.generation += 1
+
+    def read_files(self, paths: List[str]) -> Dict[str, Optional[str]]:
+        contents = {}
+        for path in paths:
+            full_path = self.root / path
+            contents[path] = full_path.read_text(encoding='utf-8') if full_path.exists() else None
+        return contents
+
+    def dependency_path(self, page: str, source: str) -> str:
+        """The file an import statement in a page refers to, relative to the root."""
+        if source.startswith('/'):
+            return source.lstrip('/')
+        return os.path.normpath(os.path.join(os.path.dirname(page), source))
+
+    def render(self, page: str) -> RenderedPage:
+        """Render a page from its current content, reusing an earlier rendering of exactly the same files."""
+        content = (self.root / page).read_text(encoding='utf-8')
+        frontmatter, body, _ = parse_frontmatter(content)
+        imports = [(name, self.dependency_path(page, source)) for name, source in page_imports(body)]
+        dependencies = [dependency for _, dependency in imports]
+        digest = hashlib.sha256(f"{PREVIEW_VERSION}\0{content}".encode('utf-8'))
+        snippets = {}
+        for name, dependency in imports:
+            path = self.root / dependency
+            data = path.read_bytes() if path.is_file() else b'\0missing'
+            digest.update(data)
+            if name and dependency.endswith('.mdx') and path.is_file():
+                snippets[name] = parse_frontmatter(data.decode('utf-8'))[1]
+        key = digest.hexdigest()
+
+        rendered = self.by_key.get(key)
+        if rendered is None:
+            title = frontmatter.get('title') or Path(page).stem
+            description = frontmatter.get('description') or ''
+            openapi = frontmatter.get('openapi') if isinstance(frontmatter.get('openapi'), str) else None
+            rendered = RenderedPage(page, key, render_mdx(body, snippets), str(title), str(description), openapi,
+                                    dependencies)
+            self.by_key[key] = rendered
+            if len(self.by_key) > MAX_CACHED_RENDERINGS:
+                del self.by_key[next(iter(self.by_key))]
+
+        for path in [page] + rendered.dependencies:
+            self.stats[path] = stat_key(self.root / path)
+            if path != page:
+                self.dependents.setdefault(path, set()).add(page)
+        self.rendered[page] = rendered
+
+        url = page.removesuffix('.mdx')
+        title = frontmatter.get('sidebarTitle') or frontmatter.get('title')
+        if url in self.titles and self.titles[url] != title:
+            # The sidebar shows page titles, so it is rebuilt (once per tab, on the next request)
+            self.titles[url] = title
+            self.sidebars.clear()
+            self.generation += 1
+        return rendered
+
+    def page(self, page: str) -> RenderedPage:
+        rendered = self.rendered.get(page)
+        if rendered is None or self.stats.get(page) != stat_key(self.root / page):
+            rendered = self.render(page)
+        return rendered
+
+    def check_for_changes(self) -> List[Tuple[str, float]]:
+        """Re-render every page whose files changed on disk. Returns (page, milliseconds) per re-rendered page."""
+        if stat_key(self.docs_file) != self.docs_stat:
+            started = time.perf_counter()
+            self.load(str(self.root))
+            return [('docs.json', (time.perf_counter() - started) * 1000)]
+
+        stale: Set[str] = set()
+        for path, known in list(self.stats.items()):
+            if stat_key(self.root / path) != known:
+                stale.update({path} & set(self.rendered) | self.dependents.get(path, set()))
+                self.stats[path] = stat_key(self.root / path)
+        timings = []
+        for page in sorted(stale):
+            started = time.perf_counter()
+            if (self.root / page).exists():
+                self.render(page)
+            else:
+                self.rendered.pop(page, None)
+            timings.append((page, (time.perf_counter() - started) * 1000))
+        return timings
+
+    def version(self, page: str) -> str:
+        rendered = self.rendered.get(page)
+        return f"{self.generation}-{rendered.key[:16] if rendered else 'none'}"
+
+    def sidebar(self, tab_index: int) -> str:
+        """The sidebar of a tab, built once per docs.json load (or page title change)."""
+        if tab_index in self.sidebars:
+            return self.sidebars[tab_index]
+
+        def build(node: object) -> str:
+            if isinstance(node, str):
+                url = page_url(f"{node.lstrip('/')}.mdx")
+                title = self.titles.get(node.lstrip('/')) or node.rsplit('/', 1)[-1]
+                return f'<li><a href="{html.escape(url)}">{html.escape(str(title))}</a></li>'
+            if not isinstance(node, dict):
+                return ''
+            children = ''.join(build(child) for key in navigation_tree.CHILD_KEYS for child in node.get(key, []))
+            name = next((node[key] for key in navigation_tree.CONTAINER_KEYS if key in node), '')
+            return f'<li><div class="group">{html.escape(str(name))}</div><ul>{children}</ul></li>'
+
+        tab = self.tabs[tab_index]
+        groups = ''.join(build(child) for key in navigation_tree.CHILD_KEYS if key != 'tabs'
+                         for child in tab.get(key, []))
+        self.sidebars[tab_index] = f'<ul>{groups}</ul>'
+        return self.sidebars[tab_index]
+
+    def page_html(self, url: str, page: str) -> str:
+        rendered = self.page(page)
+        tab_index = self.page_tabs.get(url)
+        tab_links = []
+        for index, tab in enumerate(self.tabs):
+            pages = navigation_tree.collect_nav_pages(tab)
+            if pages:
+                active = ' class="active"' if index == tab_index else ''
+                tab_links.append(f'<a{active} href="{html.escape(page_url(pages[0].lstrip("/") + ".mdx"))}">'
+                                 f'{html.escape(str(tab.get("tab", "")))}</a>')
+        sidebar = self.sidebar(tab_index) if tab_index is not None else ''
+        sidebar = sidebar.replace(f'<a href="{html.escape(url)}">', f'<a class="active" href="{html.escape(url)}">')
+        openapi = (f'<aside class="callout callout-info"><p>API reference generated from '
+                   f'<code>{html.escape(rendered.openapi)}</code></p></aside>') if rendered.openapi else ''
+        description = f'<p class="description">{html.escape(rendered.description)}</p>' \
+            if rendered.description else ''
+        reload_url = f"{WAIT_PREFIX}{self.version(page)}{url if url != '/' else '/index'}"
+        return (f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>{html.escape(rendered.title)} - '
+                f'{html.escape(str(self.docs.get("name", "")))}</title><style>{STYLE}</style></head><body>'
+                f'<header>{"".join(tab_links)}</header><div class="layout"><aside class="sidebar">{sidebar}</aside>'
+                f'<main><h1>{html.escape(rendered.title)}</h1>{description}{openapi}{rendered.body}</main></div>'
+                f'{RELOAD_SCRIPT % json.dumps(reload_url)}</body></html>')
+
+    def route(self, path: str) -> Tuple[int, Dict[str, str], bytes]:
+        url = normalize_path(path) or '/'
+        page = self.pages.get(url)
+        if page is None and (self.root / f"{url.lstrip('/')}.mdx").is_file():
+            # A page created since the server started
+            page = self.pages[url] = f"{url.lstrip('/')}.mdx"
+        if page is not None and (self.root / page).exists():
+            return 200, {'Content-Type': 'text/html; charset=utf-8', 'Cache-Control': 'no-store'}, \
+                self.page_html(url, page).encode('utf-8')
+        return super().route(path)
+
+    def response(self, path: str, keep_alive: bool):
+        if path.startswith(WAIT_PREFIX):
+            return self.wait_for_change(path[len(WAIT_PREFIX):], keep_alive)
+        if stat_key(self.docs_file) != self.docs_stat:
+            self.load(str(self.root))
+        # Nothing is cached per path: pages are cached by content instead, and the rest is cheap to serve
+        return docs_server.http_response(*self.route(path), keep_alive)
+
+    async def wait_for_change(self, request: str, keep_alive: bool) -> bytes:
+        """Long poll: answer 200 once the page is no longer at the version the browser has, or 204 on timeout."""
+        version, _, url = request.partition('/')
+        url = '/' + url if url != 'index' else '/'
+        page = self.pages.get(url)
+        deadline = time.monotonic() + LONG_POLL_TIMEOUT
+        while page is None or self.version(page) == version:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return docs_server.http_response(204, {}, b'', keep_alive)
+            try:
+                await asyncio.wait_for(self.changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+            page = self.pages.get(url)
+        return docs_server.http_response(200, {'Content-Type': 'text/plain'}, b'reload', keep_alive)
+
+    async def watch(self) -> None:
+        """Poll the files behind the rendered pages, re-render what changed and wake the browsers waiting on it."""
+        while True:
+            await asyncio.sleep(WATCH_INTERVAL)
+            timings = self.check_for_changes()
+            for page, milliseconds in timings:
+                print(f"🔄 {page} re-rendered in {milliseconds:.1f} ms")
+            if timings:
+                self.changed.set()
+                self.changed = asyncio.Event()
+
+
+async def run_preview(args, site: PreviewSite) -> None:
+    site.changed = asyncio.Event()
+    server = await docs_server.start_server(site, args.host, args.port)
+    watcher = asyncio.create_task(site.watch())
+    print(f"🚀 Previewing {len(site.pages)} pages on http://{args.host}:{args.port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        watcher.cancel()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve a live HTML preview of the docs that re-renders on edit')
+    parser.add_argument('--root-dir', default=str(Path(__file__).parent.parent),
+                        help='Repository root (default: parent of the scripts directory)')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to bind the server to (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=3333, help='Port to bind the server to (default: 3333)')
+
+    args = parser.parse_args()
+
+    docs_file = Path(args.root_dir) / 'docs.json'
+    if not docs_file.exists():
+        print(f"Error: docs.json not found at {docs_file}")
+        sys.exit(1)
+
+    site = PreviewSite(args.root_dir, str(docs_file))
+    try:
+        asyncio.run(run_preview(args, site))
+    except KeyboardInterrupt:
+        print("\n👋 Preview stopped")
+
+
+if __name__ == '__main__':
+    main()
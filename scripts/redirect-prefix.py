@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Bulk prefix operations on redirect sources and link targets.
+
+This script:
+1. Indexes docs.json redirect sources and destinations, and (for --links and rewrite-prefix) the internal link
+   targets of every page, in prefix tries
+2. Lists or counts redirects (or linked paths) under a prefix
+3. Removes every redirect whose source is under a prefix
+4. Rewrites a prefix: links to paths under it are updated in the pages that use them, and redirect destinations
+   under it are re-pointed, so no redirect is left chaining through the old location
+
+The tries are built from scratch on every run, which is one pass over the redirects (and, with --links or
+rewrite-prefix, over every page). Once built, count is a walk down the prefix and list and rewrite-prefix visit only
+the matching entries. remove is a plain filter over the redirect list, which is as fast as anything for one run.
+
+Usage:
+    python scripts/redirect-prefix.py list <prefix> [--links]
+    python scripts/redirect-prefix.py count <prefix> [--links]
+    python scripts/redirect-prefix.py remove <prefix> [--dry-run]
+    python scripts/redirect-prefix.py rewrite-prefix <old_prefix> <new_prefix> [--dry-run]
+
+Example:
+    python scripts/redirect-prefix.py count /guides/ --links
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from file_discovery import discover_files
+from page_content import split_internal_link, strip_code_blocks
+from path_trie import PathTrie
+from script_loader import load_script
+
+update_links = load_script('update-links.py')
+
+
+def build_redirect_tries(redirects: List[dict]) -> Tuple[PathTrie, PathTrie]:
+    """Index redirects by source and by destination. Values are the lists of redirect entries."""
+    sources = PathTrie()
+    destinations = PathTrie()
+    for redirect in redirects:
+        sources.setdefault(redirect.get('source', ''), []).append(redirect)
+        destinations.setdefault(redirect.get('destination', ''), []).append(redirect)
+    return sources, destinations
+
+
+def build_link_trie(root_dir: str) -> PathTrie:
+    """Index the internal link targets of every page: path → {page: [link URLs as written]}."""
+    root = Path(root_dir)
+    links = PathTrie()
+    for page in discover_files(root_dir).pages:
+        content = (root / page).read_text(encoding='utf-8')
+        for _, _, url in update_links.extract_links(strip_code_blocks(content)):
+            link = split_internal_link(url)
+            if link and link[0]:
+                links.setdefault(link[0], {}).setdefault(page, []).append(url)
+    return links
+
+
+def load_docs(docs_file: Path) -> dict:
+    with open(docs_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_docs(docs_file: Path, docs_data: dict) -> None:
+    with open(docs_file, 'w', encoding='utf-8') as f:
+        json.dump(docs_data, f, indent=2, ensure_ascii=False)
+
+
+def remove_prefix(docs_file: Path, docs_data: dict, prefix: str, dry_run: bool) -> None:
+    """Remove every redirect whose source starts with prefix."""
+    redirects = docs_data.get('redirects', [])
+    kept = []
+    removed = []
+    for redirect in redirects:
+        (removed if redirect.get('source', '').startswith(prefix) else kept).append(redirect)
+
+    print(f"Removed {len(removed)} redirects with prefix '{prefix}'")
+    print(f"Remaining redirects: {len(kept)}")
+    for redirect in removed[:5]:
+        print(f"  {redirect['source']} -> {redirect['destination']}")
+    if len(removed) > 5:
+        print(f"  ... and {len(removed) - 5} more")
+
+    if removed and not dry_run:
+        docs_data['redirects'] = kept
+        save_docs(docs_file, docs_data)
+
+
+def rewrite_prefix(root_dir: str, docs_file: Path, docs_data: dict, old_prefix: str, new_prefix: str,
+                   dry_run: bool) -> None:
+    """Point links and redirect destinations under old_prefix at new_prefix."""
+    _, destinations = build_redirect_tries(docs_data.get('redirects', []))
+    repointed = destinations.rewrite_prefix(old_prefix, new_prefix)
+    for _, new_destination, entries in repointed:
+        for redirect in entries:
+            redirect['destination'] = new_destination
+    print(f"🔀 Re-pointed {sum(len(entries) for _, _, entries in repointed)} redirect destination(s)")
+
+    links = build_link_trie(root_dir)
+    url_map: Dict[str, str] = {}
+    pages_by_target: Dict[str, List[str]] = {}
+    for path, referencing in links.items(old_prefix):
+        url_map[path] = new_prefix + path[len(old_prefix):]
+        for page in referencing:
+            pages_by_target.setdefault(page, []).append(path)
+
+    root = Path(root_dir)
+    changed_pages = 0
+    for page in sorted(pages_by_target):
+        with open(root / page, 'r', encoding='utf-8') as f:
+            content = f.read()
+        updated, changes = update_links.update_links_in_content(content, url_map)
+        if not changes:
+            continue
+        changed_pages += 1
+        print(f"📝 {page}")
+        for change in changes:
+            print(change)
+        if not dry_run:
+            with open(root / page, 'w', encoding='utf-8') as f:
+                f.write(updated)
+    print(f"🔗 Rewrote links to {len(url_map)} path(s) in {changed_pages} page(s)")
+
+    if repointed and not dry_run:
+        save_docs(docs_file, docs_data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bulk prefix operations on redirect sources and link targets')
+    parser.add_argument('command', choices=['list', 'count', 'remove', 'rewrite-prefix'], help='Operation to run')
+    parser.add_argument('prefix', help='Path prefix, e.g. /guides/transcription/')
+    parser.add_argument('new_prefix', nargs='?', help='Replacement prefix (for rewrite-prefix)')
+    parser.add_argument('--links', action='store_true',
+                        help='List or count linked paths in pages instead of redirect sources')
+    parser.add_argument('--docs-file', default='docs.json',
+                        help='Path to docs.json file (default: docs.json)')
+    parser.add_argument('--dry-run', action='store_true', help='Show what would change without writing files')
+
+    args = parser.parse_args()
+
+    docs_file = Path(args.docs_file)
+    if not docs_file.is_absolute():
+        # Assume relative to the script's parent directory (repository root)
+        docs_file = Path(__file__).parent.parent / docs_file
+    if not docs_file.exists():
+        print(f"Error: docs.json file not found at {docs_file}")
+        sys.exit(1)
+    root_dir = str(docs_file.parent)
+
+    docs_data = load_docs(docs_file)
+
+    if args.command == 'remove':
+        remove_prefix(docs_file, docs_data, args.prefix, args.dry_run)
+        return
+
+    if args.command == 'rewrite-prefix':
+        if not args.new_prefix:
+            parser.error('rewrite-prefix needs <old_prefix> <new_prefix>')
+        rewrite_prefix(root_dir, docs_file, docs_data, args.prefix, args.new_prefix, args.dry_run)
+        return
+
+    if args.links:
+        trie = build_link_trie(root_dir)
+        label = 'linked path(s)'
+    else:
+        trie, _ = build_redirect_tries(docs_data.get('redirects', []))
+        label = 'redirect(s)'
+
+    if args.command == 'count':
+        print(f"{trie.count(args.prefix)} {label} under '{args.prefix}'")
+        return
+
+    matches = trie.items(args.prefix)
+    for path, value in matches:
+        if args.links:
+            pages = sorted(value)
+            print(f"  {path} ({len(pages)} page(s): {', '.join(pages)})")
+        else:
+            for redirect in value:
+                print(f"  {path} -> {redirect['destination']}")
+    print(f"{len(matches)} {label} under '{args.prefix}'")
+
+
+if __name__ == '__main__':
+    main()
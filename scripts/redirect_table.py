@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Compiled redirect table for docs.json.
+
+Flattens the `redirects` array into a lookup table where every source maps directly to its final destination.
+Exact sources are flattened with the chain resolution from `resolve-redirect-chains.py`, so a flattened table
+never serves a hop twice. Wildcard sources (`/beta/*`, `/beta/:slug*`, `/beta/:section/page`) are kept as ordered
+patterns and checked after exact sources.
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from script_loader import load_script
+
+resolve_chains = load_script('resolve-redirect-chains.py')
+
+LOOKUP_TABLE_VERSION = 1
+
+# `:name`, `:name*` or a bare `*` inside a redirect source or destination
+PLACEHOLDER_PATTERN = re.compile(r':([A-Za-z_][A-Za-z0-9_]*)(\*?)|\*')
+
+
+def is_external_url(url: str) -> bool:
+    """Check whether a redirect destination points off-site."""
+    return url.startswith(('http://', 'https://', 'mailto:'))
+
+
+def normalize_path(path: str) -> str:
+    """Normalize a site path to a leading slash and no trailing slash."""
+    path = path.strip()
+    if not path or is_external_url(path):
+        return path
+    if not path.startswith('/'):
+        path = '/' + path
+    if len(path) > 1:
+        path = path.rstrip('/') or '/'
+    return path
+
+
+def is_pattern(source: str) -> bool:
+    """Check whether a redirect source contains wildcards or path parameters."""
+    return PLACEHOLDER_PATTERN.search(source) is not None
+
+
+@dataclass
+class RedirectPattern:
+    """A redirect whose source contains `*`, `:name` or `:name*` segments."""
+    source: str
+    destination: str
+    regex: 're.Pattern' = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.regex = compile_source_pattern(self.source)
+
+    @property
+    def is_static(self) -> bool:
+        """True when the destination has no placeholders to fill in."""
+        return not is_pattern(self.destination)
+
+    def apply(self, path: str) -> Optional[str]:
+        """Return the destination for path, or None if the pattern does not match."""
+        match = self.regex.fullmatch(path)
+        if not match:
+            return None
+        return fill_destination(self.destination, match.groupdict())
+
+
+def compile_source_pattern(source: str) -> 're.Pattern':
+    """
+    Compile a redirect source into a regex.
+
+    `*` matches one or more characters, `:name` matches exactly one segment and `:name*` matches zero or more
+    trailing segments.
+    """
+    parts = []
+    for segment in source.strip('/').split('/'):
+        if segment == '*':
+            parts.append(r'/(?P<splat>.+)')
+            continue
+        match = re.fullmatch(r':([A-Za-z_][A-Za-z0-9_]*)(\*?)', segment)
+        if match and match.group(2):
+            parts.append(rf'(?:/(?P<{match.group(1)}>.*))?')
+        elif match:
+            parts.append(rf'/(?P<{match.group(1)}>[^/]+)')
+        else:
+            parts.append('/' + re.escape(segment))
+    return re.compile(''.join(parts) or '/')
+
+
+def fill_destination(destination: str, captures: Dict[str, Optional[str]]) -> str:
+    """Substitute captured path parameters into a destination template."""
+    def replace(match: 're.Match') -> str:
+        name = match.group(1) or 'splat'
+        return captures.get(name) or ''
+
+    filled = PLACEHOLDER_PATTERN.sub(replace, destination)
+    if is_external_url(filled):
+        return filled
+    # An empty `:slug*` capture leaves a dangling or doubled slash behind
+    return normalize_path(re.sub(r'/{2,}', '/', filled))
+
+
+@dataclass
+class RedirectTable:
+    """Flattened redirects: exact sources in a dict, wildcard sources as ordered patterns."""
+    exact: Dict[str, str] = field(default_factory=dict)
+    patterns: List[RedirectPattern] = field(default_factory=list)
+    chains_collapsed: int = 0
+    cycles: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.exact) + len(self.patterns)
+
+    def lookup(self, path: str) -> Optional[str]:
+        """Return the final destination for path, or None if it is not redirected."""
+        path = normalize_path(path)
+        destination = self.exact.get(path)
+        if destination is not None:
+            return destination
+
+        for pattern in self.patterns:
+            destination = pattern.apply(path)
+            if destination is not None and destination != path:
+                # Templated destinations cannot be flattened ahead of time
+                return destination if pattern.is_static else self.exact.get(destination, destination)
+        return None
+
+    def next_hop(self, path: str) -> Optional[str]:
+        """Return the destination of the first redirect that matches path, as written, or None if there is none."""
+        path = normalize_path(path)
+        destination = self.exact.get(path)
+        if destination is not None:
+            return destination
+
+        for pattern in self.patterns:
+            destination = pattern.apply(path)
+            if destination is not None and destination != path:
+                return destination
+        return None
+
+    def to_lookup_json(self) -> dict:
+        """Serialize to a compact, sorted lookup table with destinations stored once."""
+        sources = sorted(self.exact)
+        destinations = sorted(set(self.exact.values()))
+        destination_index = {destination: i for i, destination in enumerate(destinations)}
+        return {
+            'version': LOOKUP_TABLE_VERSION,
+            'sources': sources,
+            'destinations': destinations,
+            'targets': [destination_index[self.exact[source]] for source in sources],
+            'patterns': [[pattern.source, pattern.destination] for pattern in self.patterns],
+        }
+
+    @classmethod
+    def from_lookup_json(cls, data: dict) -> 'RedirectTable':
+        """Load a table written by to_lookup_json."""
+        if data.get('version') != LOOKUP_TABLE_VERSION:
+            raise ValueError(f"Unsupported redirect lookup table version: {data.get('version')}")
+        destinations = data['destinations']
+        table = cls()
+        table.exact = {source: destinations[target] for source, target in zip(data['sources'], data['targets'])}
+        table.patterns = [RedirectPattern(source, destination) for source, destination in data['patterns']]
+        return table
+
+
+def normalize_redirects(redirects_array: List[dict]) -> List[dict]:
+    """Return the redirects with normalized source and destination paths, dropping incomplete entries."""
+    normalized = []
+    for redirect in redirects_array:
+        source = normalize_path(redirect.get('source', ''))
+        destination = normalize_path(redirect.get('destination', ''))
+        if source and destination:
+            normalized.append({'source': source, 'destination': destination})
+    return normalized
+
+
+def compile_redirect_table(redirects_array: List[dict], max_depth: int = 20) -> RedirectTable:
+    """Flatten the docs.json redirects array into a RedirectTable."""
+    redirects = normalize_redirects(redirects_array)
+    exact_redirects = [r for r in redirects if not is_pattern(r['source'])]
+    redirect_map = resolve_chains.build_redirect_map(exact_redirects)
+
+    table = RedirectTable()
+    table.patterns = [RedirectPattern(r['source'], r['destination']) for r in redirects if is_pattern(r['source'])]
+
+    def follow(path: str) -> Tuple[str, int]:
+        """Follow exact chains, then static wildcard rules, until the path stops changing."""
+        hops = 0
+        seen = set()
+        current = path
+        for _ in range(max_depth):
+            current, chain = resolve_chains.resolve_redirect_chain(current, redirect_map, max_depth)
+            hops += len(chain) - 1
+            if current in seen:
+                break
+            seen.add(current)
+            next_path = None
+            for pattern in table.patterns:
+                next_path = pattern.apply(current) if pattern.is_static else None
+                if next_path is not None:
+                    break
+            if next_path is None or next_path == current:
+                break
+            current = next_path
+            hops += 1
+        return current, hops
+
+    for source in redirect_map:
+        final_destination, hops = follow(source)
+        if final_destination == source:
+            table.cycles.append(source)
+            continue
+        if hops > 1:
+            table.chains_collapsed += 1
+        table.exact[source] = final_destination
+
+    for pattern in table.patterns:
+        if pattern.is_static:
+            pattern.destination, _ = follow(pattern.destination)
+
+    return table
+
+
+def raw_redirect_table(redirects_array: List[dict]) -> RedirectTable:
+    """Build a table whose next_hop serves each redirect as written, one hop at a time, like the docs platform."""
+    redirects = normalize_redirects(redirects_array)
+    table = RedirectTable()
+    table.exact = resolve_chains.build_redirect_map([r for r in redirects if not is_pattern(r['source'])])
+    table.patterns = [RedirectPattern(r['source'], r['destination']) for r in redirects if is_pattern(r['source'])]
+    return table
+
+
+def load_redirect_table(docs_json_path: str) -> RedirectTable:
+    """Load docs.json and compile its redirects."""
+    docs = resolve_chains.load_docs_json(docs_json_path)
+    return compile_redirect_table(docs.get('redirects', []))
+
+
+def load_lookup_table(lookup_json_path: str) -> RedirectTable:
+    """Load a lookup table written by export-redirects.py."""
+    with open(lookup_json_path, 'r', encoding='utf-8') as f:
+        return RedirectTable.from_lookup_json(json.load(f))
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Import helper for the hyphenated scripts in this directory.
+
+Scripts such as `move-file.py` and `resolve-redirect-chains.py` are named for the command line and cannot be
+imported with a plain `import` statement. Newer tools reuse their functions through `load_script` so the logic
+stays in one place.
+
+Example:
+    resolve_chains = load_script('resolve-redirect-chains.py')
+    redirect_map = resolve_chains.build_redirect_map(docs['redirects'])
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+
+def load_script(filename: str) -> ModuleType:
+    """Import a script from the scripts directory by file name, caching it in sys.modules."""
+    module_name = Path(filename).stem.replace('-', '_')
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    script_path = SCRIPTS_DIR / filename
+    spec = importlib.util.spec_from_file_location(module_name, script_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load script: {script_path}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        del sys.modules[module_name]
+        raise
+    return module
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Build and query an offline search index of the documentation pages.
+
+This script:
+1. Reads every page once, parsing its frontmatter, headings and body text in the same pass
+2. Builds an inverted index with BM25 scores weighted by field (title > headings > description > body)
+3. Serializes it as compact JSON with delta-encoded postings, usable as a client-side index on internal mirrors
+4. Answers queries and benchmarks latency and relevance (each page's title should find that page)
+
+Usage:
+    python scripts/search-index.py build [--output build/search/search-index.json]
+    python scripts/search-index.py query <terms...> [--limit 10]
+    python scripts/search-index.py bench
+
+Example:
+    python scripts/search-index.py build && python scripts/search-index.py query container gateway
+"""
+
+import argparse
+import bisect
+import gzip
+import json
+import math
+import re
+import statistics
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from file_discovery import discover_files
+from page_content import extract_headings, markdown_to_text, page_url, parse_frontmatter
+
+INDEX_VERSION = 1
+
+# Field weights applied to term frequencies before BM25 saturation
+FIELD_WEIGHTS = {
+    'title': 5,
+    'headings': 3,
+    'description': 2,
+    'body': 1,
+}
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+SCORE_SCALE = 100
+MAX_PREFIX_EXPANSIONS = 20
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'how', 'in', 'is', 'it', 'of', 'on', 'or',
+    'that', 'the', 'this', 'to', 'with', 'you', 'your',
+}
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase text and split it into index terms, dropping stopwords."""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+@dataclass
+class PageFields:
+    """The searchable fields of one page."""
+    url: str
+    title: str
+    description: str
+    headings: str
+    body: str
+
+
+def read_page(root: Path, page: str) -> Optional[PageFields]:
+    """Read a page once and split it into searchable fields. Hidden pages return None."""
+    content = (root / page).read_text(encoding='utf-8')
+    frontmatter, body, _ = parse_frontmatter(content)
+    if frontmatter.get('hidden') in (True, 'true'):
+        return None
+
+    headings = extract_headings(body)
+
+    title = str(frontmatter.get('title') or frontmatter.get('sidebarTitle') or '')
+    if not title and headings:
+        title = headings[0][1]
+    if not title:
+        title = Path(page).stem.replace('-', ' ').title()
+
+    return PageFields(
+        url=page_url(page),
+        title=title,
+        description=str(frontmatter.get('description') or ''),
+        headings=' '.join(text for _, text, _ in headings),
+        body=markdown_to_text(body),
+    )
+
+
+def collect_pages(root_dir: str) -> List[PageFields]:
+    """Read every visible page in the tree."""
+    root = Path(root_dir)
+    pages = (read_page(root, page) for page in discover_files(root_dir).pages_with_extension('.mdx'))
+    return [page for page in pages if page is not None]
+
+
+def build_index(pages: List[PageFields]) -> dict:
+    """Build the serialized index: document table plus delta-encoded postings of quantized BM25 scores."""
+    weighted_tfs: List[Counter] = []
+    for page in pages:
+        tf = Counter()
+        for field_name, weight in FIELD_WEIGHTS.items():
+            for token in tokenize(getattr(page, field_name)):
+                tf[token] += weight
+        weighted_tfs.append(tf)
+
+    doc_count = len(pages)
+    lengths = [sum(tf.values()) for tf in weighted_tfs]
+    average_length = (sum(lengths) / doc_count) if doc_count else 1
+    document_frequency = Counter(term for tf in weighted_tfs for term in tf)
+
+    postings: Dict[str, List[Tuple[int, int]]] = {}
+    for doc_id, tf in enumerate(weighted_tfs):
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc_id] / average_length)
+        for term, frequency in tf.items():
+            df = document_frequency[term]
+            idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            score = round(SCORE_SCALE * idf * frequency * (BM25_K1 + 1) / (frequency + norm))
+            postings.setdefault(term, []).append((doc_id, max(score, 1)))
+
+    terms = {}
+    for term in sorted(postings):
+        encoded = []
+        previous = 0
+        for doc_id, score in postings[term]:
+            encoded.extend((doc_id - previous, score))
+            previous = doc_id
+        terms[term] = encoded
+
+    return {
+        'version': INDEX_VERSION,
+        'docs': [[page.url, page.title, page.description] for page in pages],
+        'terms': terms,
+    }
+
+
+@dataclass
+class SearchResult:
+    url: str
+    title: str
+    score: float
+
+
+class SearchIndex:
+    """Query API over a serialized index."""
+
+    def __init__(self, data: dict):
+        if data.get('version') != INDEX_VERSION:
+            raise ValueError(f"Unsupported search index version: {data.get('version')}")
+        self.docs = data['docs']
+        self.terms: Dict[str, List[int]] = data['terms']
+        self.sorted_terms = sorted(self.terms)
+        self._decoded: Dict[str, List[Tuple[int, int]]] = {}
+
+    @classmethod
+    def load(cls, path: str) -> 'SearchIndex':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def postings(self, term: str) -> List[Tuple[int, int]]:
+        """Decode (and memoize) the postings list of a term."""
+        decoded = self._decoded.get(term)
+        if decoded is None:
+            encoded = self.terms.get(term, [])
+            decoded = []
+            doc_id = 0
+            for i in range(0, len(encoded), 2):
+                doc_id += encoded[i]
+                decoded.append((doc_id, encoded[i + 1]))
+            self._decoded[term] = decoded
+        return decoded
+
+    def expand_prefix(self, prefix: str) -> List[str]:
+        """Return up to MAX_PREFIX_EXPANSIONS indexed terms starting with prefix."""
+        start = bisect.bisect_left(self.sorted_terms, prefix)
+        expansions = []
+        for term in self.sorted_terms[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not term.startswith(prefix):
+                break
+            expansions.append(term)
+        return expansions
+
+    def search(self, query: str, limit: int = 10) -> List[SearchResult]:
+        """Rank pages for a query. The last term also matches as a prefix, for search-as-you-type."""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        scores: Dict[int, float] = {}
+        matched: Dict[int, int] = {}
+        for position, token in enumerate(tokens):
+            candidates = {token: 1.0}
+            if position == len(tokens) - 1:
+                for term in self.expand_prefix(token):
+                    candidates.setdefault(term, 0.5)
+
+            best: Dict[int, float] = {}
+            for term, weight in candidates.items():
+                for doc_id, score in self.postings(term):
+                    best[doc_id] = max(best.get(doc_id, 0.0), score * weight)
+            for doc_id, score in best.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+                matched[doc_id] = matched.get(doc_id, 0) + 1
+
+        # Prefer pages that match every query term
+        ranked = sorted(
+            ((score * matched[doc_id] / len(tokens), doc_id) for doc_id, score in scores.items()),
+            reverse=True,
+        )
+        return [
+            SearchResult(self.docs[doc_id][0], self.docs[doc_id][1], round(score / SCORE_SCALE, 3))
+            for score, doc_id in ranked[:limit]
+        ]
+
+
+def write_index(index: dict, output_path: Path) -> None:
+    """Write the index as minified JSON and report its raw and gzipped size."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = json.dumps(index, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    output_path.write_bytes(payload)
+    print(f"✅ Wrote {output_path}")
+    print(f"   Pages: {len(index['docs'])}, terms: {len(index['terms'])}")
+    print(f"   Size: {len(payload):,} bytes ({len(gzip.compress(payload)):,} bytes gzipped)")
+
+
+def run_benchmark(index: SearchIndex, limit: int) -> None:
+    """Measure query latency and whether each page's title finds the page itself."""
+    reciprocal_ranks = []
+    latencies = []
+    hits_at_1 = 0
+    hits_at_k = 0
+
+    for url, title, _ in index.docs:
+        start = time.perf_counter()
+        results = index.search(title, limit)
+        latencies.append(time.perf_counter() - start)
+
+        urls = [result.url for result in results]
+        rank = urls.index(url) + 1 if url in urls else None
+        reciprocal_ranks.append(1 / rank if rank else 0)
+        hits_at_1 += rank == 1
+        hits_at_k += rank is not None
+
+    total = len(index.docs)
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    print(f"📊 Title self-retrieval over {total} pages:")
+    print(f"   Recall@1: {hits_at_1 / total:.1%}")
+    print(f"   Recall@{limit}: {hits_at_k / total:.1%}")
+    print(f"   MRR: {statistics.mean(reciprocal_ranks):.3f}")
+    print(f"⏱️  Query latency: p50 {statistics.median(latencies_ms):.3f} ms, "
+          f"p95 {latencies_ms[int(len(latencies_ms) * 0.95) - 1]:.3f} ms, max {latencies_ms[-1]:.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build and query an offline documentation search index')
+    parser.add_argument('command', choices=['build', 'query', 'bench'], help='Action to perform')
+    parser.add_argument('terms', nargs='*', help='Query terms (for query)')
+    parser.add_argument('--root-dir', default=str(Path(__file__).parent.parent),
+                        help='Repository root (default: parent of the scripts directory)')
+    parser.add_argument('--output', default='build/search/search-index.json',
+                        help='Index file, relative to the root directory (default: build/search/search-index.json)')
+    parser.add_argument('--limit', type=int, default=10, help='Number of results (default: 10)')
+
+    args = parser.parse_args()
+
+    index_path = Path(args.output)
+    if not index_path.is_absolute():
+        index_path = Path(args.root_dir) / index_path
+
+    if args.command == 'build':
+        start = time.perf_counter()
+        index = build_index(collect_pages(args.root_dir))
+        print(f"🔨 Built search index in {(time.perf_counter() - start) * 1000:.0f} ms")
+        write_index(index, index_path)
+        return
+
+    if not index_path.exists():
+        print(f"Error: search index not found at {index_path} - run `build` first")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    index = SearchIndex.load(str(index_path))
+    print(f"📖 Loaded index in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    if args.command == 'bench':
+        run_benchmark(index, args.limit)
+        return
+
+    if not args.terms:
+        print("Error: query requires search terms")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    results = index.search(' '.join(args.terms), args.limit)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"🔍 {len(results)} result(s) in {elapsed:.2f} ms")
+    for i, result in enumerate(results, 1):
+        print(f"  {i:>2}. {result.title} ({result.score})")
+        print(f"      {result.url}")
+
+
+if __name__ == '__main__':
+    main()
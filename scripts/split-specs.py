@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Split an OpenAPI spec into one self-contained spec per tag (or per navigation group), so each API reference page
+loads only the part of the API it documents.
+
+This script:
+1. Splits the operations of the spec by their first tag, or with --by group by the docs.json navigation group of
+   the page that documents them
+2. Writes each part to api-specs/<spec name>/<part>.<ext> with only its paths and the components they reference,
+   transitively (security schemes are always kept). A part is only rewritten when its content changed, and parts
+   that no longer exist are removed.
+3. Rewrites the `openapi:` frontmatter of every page that documents an operation of the spec to point at its part
+4. Reports the spec payload of each page before and after
+
+The split is incremental: when the source spec and the parts written by the last run are unchanged (recorded in
+build/cache/split-specs.json), the spec is not even parsed. Changes to this script are only noticed through
+SPLITTER_VERSION, so bump it whenever the output changes.
+
+Usage:
+    python scripts/split-specs.py <spec> [--by tag|group] [--dry-run]
+
+Example:
+    python scripts/split-specs.py api-specs/salad-cloud.yaml
+
+Arguments:
+    spec: The spec to split, relative to the repository root
+"""
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from openapi_spec import (HTTP_METHODS, ApiPage, bytes_hash, dump_spec, escape_pointer, find_api_pages,
+                          iter_operations, load_spec, reachable_refs, split_dir)
+from script_loader import load_script
+
+generate_api_pages = load_script('generate-api-pages.py')
+
+# Bump when the output changes, so every part is regenerated
+SPLITTER_VERSION = 1
+DEFAULT_CACHE_FILE = 'build/cache/split-specs.json'
+OPENAPI_FIELD_PATTERN = re.compile(r'^openapi:[^\n]*(?:\n[ \t]+[^\n]*)*', re.MULTILINE)
+
+
+@dataclass
+class SplitResult:
+    parts: Dict[str, str] = field(default_factory=dict)
+    operations: Dict[str, str] = field(default_factory=dict)
+    unassigned: List[str] = field(default_factory=list)
+
+
+def operation_key(method: str, path: str) -> str:
+    return f"{method.lower()} {path}"
+
+
+def navigation_groups(root: Path) -> Dict[str, str]:
+    """Page URL → name of the innermost navigation group that lists it."""
+    with open(root / 'docs.json', 'r', encoding='utf-8') as f:
+        navigation = json.load(f).get('navigation', {})
+    groups = {}
+    stack: List[Tuple[object, Optional[str]]] = [(navigation, None)]
+    while stack:
+        node, group = stack.pop()
+        if isinstance(node, dict):
+            group = node.get('group', group)
+            stack.extend((value, group) for value in node.values())
+        elif isinstance(node, list):
+            stack.extend((value, group) for value in node)
+        elif isinstance(node, str) and group:
+            groups[node] = group
+    return groups
+
+
+def slugify(text: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-') or 'default'
+
+
+def build_part(spec: dict, operations: List[Tuple[str, str]]) -> dict:
+    """A self-contained spec with only the given (path, method) operations and what they reference."""
+    part = {key: value for key, value in spec.items() if key not in ('paths', 'components', 'tags', 'webhooks')}
+    paths = {}
+    for path, path_item in spec['paths'].items():
+        methods = {method for operation_path, method in operations if operation_path == path}
+        if methods:
+            paths[path] = {key: value for key, value in path_item.items()
+                           if key not in HTTP_METHODS or key in methods}
+    part['paths'] = paths
+
+    used_tags = {tag for path_item in paths.values() for method in HTTP_METHODS
+                 for tag in (path_item.get(method) or {}).get('tags', [])}
+    if spec.get('tags'):
+        tags = [tag for tag in spec['tags'] if tag.get('name') in used_tags]
+        if tags:
+            part['tags'] = tags
+
+    components = spec.get('components') or {}
+    reachable = reachable_refs(spec, [part, components.get('securitySchemes') or {}])
+    part_components = {}
+    for kind, entries in components.items():
+        if kind == 'securitySchemes' or not isinstance(entries, dict):
+            part_components[kind] = entries
+            continue
+        kept = {}
+        for name, value in entries.items():
+            pointer = f"#/components/{kind}/{escape_pointer(name)}"
+            if any(ref == pointer or ref.startswith(pointer + '/') for ref in reachable):
+                kept[name] = value
+        if kept:
+            part_components[kind] = kept
+    if part_components:
+        part['components'] = part_components
+    return part
+
+
+def split_spec(spec: dict, source_path: Path, parts_dir: str, by: str, pages: List[ApiPage],
+               groups: Dict[str, str]) -> Tuple[SplitResult, Dict[str, str]]:
+    """Return the split (part file → operations) and the serialized content of every part."""
+    page_groups = {operation_key(page.method, page.api_path): groups.get(page.path.removesuffix('.mdx'))
+                   for page in pages}
+    result = SplitResult()
+    assignments: Dict[str, List[Tuple[str, str]]] = {}
+    for path, method, operation in iter_operations(spec):
+        key = operation_key(method, path)
+        if by == 'group':
+            name = page_groups.get(key)
+            if name is None:
+                # Operations without a page are not rendered, so no part needs them
+                result.unassigned.append(key)
+                continue
+        else:
+            name = (operation.get('tags') or ['default'])[0]
+        part_file = f"{parts_dir}/{slugify(name)}{source_path.suffix}"
+        assignments.setdefault(part_file, []).append((path, method))
+        result.operations[key] = part_file
+
+    contents = {part_file: dump_spec(build_part(spec, operations), source_path.suffix)
+                for part_file, operations in assignments.items()}
+    result.parts = {part_file: bytes_hash(content.encode('utf-8')) for part_file, content in contents.items()}
+    return result, contents
+
+
+def rewrite_frontmatter(content: str, openapi: str) -> str:
+    """Replace the openapi field of a page's frontmatter, keeping every other field as it is."""
+    end = content.find('\n---', 3)
+    frontmatter = OPENAPI_FIELD_PATTERN.sub(lambda _: generate_api_pages.format_openapi_field(openapi),
+                                            content[:end], count=1)
+    return frontmatter + content[end:]
+
+
+def load_cache(cache_path: Path) -> dict:
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if data.get('version') == SPLITTER_VERSION else {'version': SPLITTER_VERSION}
+    except (OSError, ValueError):
+        return {'version': SPLITTER_VERSION}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Split an OpenAPI spec into one spec per tag or navigation group')
+    parser.add_argument('spec', help='Spec to split, relative to the repository root')
+    parser.add_argument('--by', choices=['tag', 'group'], default='tag',
+                        help='Split by the first tag of each operation, or by the navigation group of its page')
+    parser.add_argument('--root-dir', default=str(Path(__file__).parent.parent),
+                        help='Repository root (default: parent of the scripts directory)')
+    parser.add_argument('--dry-run', action='store_true', help='Show the split without writing anything')
+
+    args = parser.parse_args()
+
+    root = Path(args.root_dir)
+    source = args.spec.removeprefix('./').lstrip('/')
+    source_path = root / source
+    if not source_path.exists():
+        print(f"❌ Spec not found: {source}")
+        sys.exit(1)
+
+    cache_path = root / DEFAULT_CACHE_FILE
+    cache = load_cache(cache_path)
+    source_hash = bytes_hash(source_path.read_bytes())
+    previous = cache.get(source, {})
+    pages = find_api_pages(root, source)
+
+    unchanged = (previous.get('source_hash') == source_hash and previous.get('by') == args.by and
+                 all((root / part).exists() and bytes_hash((root / part).read_bytes()) == digest
+                     for part, digest in previous.get('parts', {}).items()))
+    if unchanged and args.by == 'tag':
+        print(f"⏭️  {source} unchanged since the last split")
+        result = SplitResult(previous['parts'], previous['operations'])
+        contents = {}
+    else:
+        result, contents = split_spec(load_spec(source_path), source_path, split_dir(source), args.by, pages,
+                                      navigation_groups(root))
+
+    for part, content in sorted(contents.items()):
+        target = root / part
+        if target.exists() and target.read_text(encoding='utf-8') == content:
+            continue
+        print(f"{'🔍' if args.dry_run else '✅'} {part}")
+        if not args.dry_run:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(content, encoding='utf-8')
+    for part in sorted(set(previous.get('parts', {})) - set(result.parts)):
+        print(f"🗑️  {part} (no longer has any operations)")
+        if not args.dry_run and (root / part).exists():
+            (root / part).unlink()
+    for key in result.unassigned:
+        print(f"⚠️  No page documents {key.upper()}; it is left out of the split")
+
+    rewritten = 0
+    report = []
+    source_bytes = source_path.stat().st_size
+    for page in sorted(pages, key=lambda page: page.path):
+        part = result.operations.get(operation_key(page.method, page.api_path))
+        if part is None:
+            print(f"⚠️  {page.path} documents {page.method.upper()} {page.api_path}, which is not in {source}")
+            continue
+        new_ref = f"/{part}"
+        part_bytes = len(contents[part].encode('utf-8')) if part in contents else (root / part).stat().st_size
+        report.append((page.path, source_bytes, part_bytes))
+        if page.spec_ref == new_ref:
+            continue
+        rewritten += 1
+        if not args.dry_run:
+            path = root / page.path
+            content = path.read_text(encoding='utf-8')
+            path.write_text(rewrite_frontmatter(content, f"{new_ref} {page.method} {page.api_path}"), encoding='utf-8')
+
+    print(f"\n📊 Spec payload per page ({source}: {source_bytes:,} bytes)")
+    for page, before, after in report:
+        print(f"  {page}: {before:,} → {after:,} bytes ({1 - after / before:.0%} smaller)")
+    if report:
+        average = sum(after for _, _, after in report) / len(report)
+        print(f"  Average: {source_bytes:,} → {average:,.0f} bytes across {len(report)} page(s)")
+    print(f"📝 {rewritten} page(s) {'would be ' if args.dry_run else ''}pointed at their part")
+
+    if args.dry_run:
+        print("🔍 Dry run - nothing was written")
+        return
+    cache[source] = {'source_hash': source_hash, 'by': args.by, 'parts': result.parts, 'operations': result.operations}
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Generate the redirects and navigation fixes for every page renamed or deleted since a git revision.
+
+This script:
+1. Runs `git diff -M --name-status <base>` once to find every renamed and deleted .mdx file. Only git's
+   content-similarity check decides what is a rename; a heavily edited page can be caught with a lower
+   --find-renames threshold, and is otherwise reported as deleted.
+2. Maps each old path to its new URL with move-file.py's path_to_url
+3. Adds a redirect for every renamed page that does not have one, and re-points existing redirects at the new URL
+4. Renames navigation entries in place, adds renamed pages missing from the navigation, and removes deleted pages
+5. Warns about deleted pages that have no redirect, or that existing redirects still point at
+6. Writes docs.json once
+
+Pages only need to be moved with git (by hand, `git mv` or any script); the bookkeeping happens here in one batch.
+Files must be tracked or staged for git to see them.
+
+Usage:
+    python scripts/sync-renames.py [<base>] [--find-renames PERCENT] [--dry-run]
+
+Example:
+    python scripts/sync-renames.py origin/main --dry-run
+
+Arguments:
+    base: Revision to compare the working tree against (default: HEAD)
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from script_loader import load_script
+
+move_file = load_script('move-file.py')
+move_directory = load_script('move-directory.py')
+
+
+@dataclass
+class PageChanges:
+    """The .mdx changes between a base revision and the working tree."""
+    renamed: Dict[str, str] = field(default_factory=dict)
+    deleted: List[str] = field(default_factory=list)
+
+
+def git_page_changes(base: str, root_dir: str, similarity: int = 50) -> Optional[PageChanges]:
+    """
+    Read renames and deletions of .mdx files from a single git diff.
+    A deleted and an added page count as a rename only when git finds them at least similarity percent alike.
+    """
+    exit_code, stdout, stderr = move_file.run_command(
+        ['git', 'diff', f'-M{similarity}%', '--name-status', '-z', base, '--', '*.mdx'], cwd=root_dir)
+    if exit_code != 0:
+        print(f"❌ git diff failed: {stderr.strip()}")
+        return None
+
+    changes = PageChanges()
+    fields = stdout.split('\0')
+    i = 0
+    while i < len(fields) and fields[i]:
+        status = fields[i]
+        if status.startswith(('R', 'C')):
+            if status.startswith('R'):
+                changes.renamed[fields[i + 1]] = fields[i + 2]
+            i += 3
+            continue
+        if status == 'D':
+            changes.deleted.append(fields[i + 1])
+        i += 2
+    return changes
+
+
+def url_of(file_path: str) -> str:
+    return '/' + move_file.path_to_url(file_path)
+
+
+def apply_changes(docs_data: dict, changes: PageChanges) -> Tuple[int, int, int]:
+    """Update navigation and redirects in docs_data. Returns (redirects added, re-pointed, nav fixes)."""
+    navigation = docs_data.setdefault('navigation', {})
+    redirects = docs_data.setdefault('redirects', [])
+
+    nav_map = {move_file.path_to_url(old): move_file.path_to_url(new) for old, new in changes.renamed.items()}
+    nav_fixes = move_directory.rename_navigation_pages([navigation], nav_map)
+
+    url_moves = {url_of(old): url_of(new) for old, new in changes.renamed.items()}
+    existing_sources = {redirect.get('source') for redirect in redirects}
+    repointed = 0
+    for redirect in redirects:
+        destination = redirect.get('destination')
+        if destination in url_moves:
+            redirect['destination'] = url_moves[destination]
+            repointed += 1
+
+    added = 0
+    for old, new in sorted(changes.renamed.items()):
+        if url_of(old) not in existing_sources:
+            move_file.add_redirect(redirects, old, new)
+            added += 1
+
+    # Renamed pages that were never in the navigation are placed by move-file.py's rules
+    nav_pages = json.dumps(navigation)
+    for new in sorted(changes.renamed.values()):
+        if f'"{move_file.path_to_url(new)}"' not in nav_pages:
+            if move_file.add_page_to_navigation(navigation, new):
+                nav_fixes += 1
+
+    for path in sorted(changes.deleted):
+        if move_file.remove_page_from_navigation(navigation, move_file.path_to_url(path)):
+            nav_fixes += 1
+        if url_of(path) not in existing_sources:
+            print(f"⚠️  Deleted page has no redirect: {url_of(path)} (add one by hand if it had inbound links)")
+        dangling = sorted(redirect.get('source') for redirect in redirects
+                          if redirect.get('destination', '').split('#')[0] == url_of(path))
+        if dangling:
+            print(f"⚠️  {len(dangling)} redirect(s) still point at deleted page {url_of(path)}; re-point or remove "
+                  f"them: {', '.join(dangling)}")
+
+    return added, repointed, nav_fixes
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Add redirects and navigation fixes for pages renamed with git')
+    parser.add_argument('base', nargs='?', default='HEAD', help='Revision to compare against (default: HEAD)')
+    parser.add_argument('--root-dir', default=str(Path(__file__).parent.parent),
+                        help='Repository root (default: parent of the scripts directory)')
+    parser.add_argument('--find-renames', type=int, default=50, metavar='PERCENT',
+                        help="Similarity git needs to pair a deleted and an added page as a rename (default: 50)")
+    parser.add_argument('--dry-run', action='store_true', help='Show the changes without writing docs.json')
+
+    args = parser.parse_args()
+
+    docs_json_path = Path(args.root_dir) / 'docs.json'
+    if not docs_json_path.exists():
+        print(f"❌ docs.json not found at {docs_json_path}")
+        sys.exit(1)
+
+    if not 0 < args.find_renames <= 100:
+        parser.error('--find-renames must be between 1 and 100')
+    changes = git_page_changes(args.base, args.root_dir, args.find_renames)
+    if changes is None:
+        sys.exit(1)
+
+    print(f"🔍 Since {args.base}: {len(changes.renamed)} renamed, {len(changes.deleted)} deleted page(s)")
+    for old, new in sorted(changes.renamed.items()):
+        print(f"  📄 {old} → {new}")
+    for path in sorted(changes.deleted):
+        print(f"  🗑️  {path}")
+
+    if not changes.renamed and not changes.deleted:
+        print("✨ Nothing to do")
+        return
+
+    with open(docs_json_path, 'r', encoding='utf-8') as f:
+        docs_data = json.load(f)
+
+    added, repointed, nav_fixes = apply_changes(docs_data, changes)
+
+    print("-" * 60)
+    print(f"📊 {added} redirect(s) added, {repointed} re-pointed, {nav_fixes} navigation fix(es)")
+
+    if args.dry_run:
+        print("🔍 Dry run - docs.json was not changed")
+        return
+
+    with open(docs_json_path, 'w', encoding='utf-8') as f:
+        json.dump(docs_data, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+    print("✅ Updated docs.json")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Run the post-processing transforms for every OpenAPI spec in api-specs/ in one pass.
+
+This script:
+1. Reads the transform list for each spec from scripts/spec-transforms.json, and for endpoint specs built by
+   create-api-spec-for-endpoint from their endpoint schema configs (add-security from the base schema, then
+   merge-io-schemas with the config's input and output schemas)
+2. Skips specs whose inputs (the spec itself, its transform options and any file a transform reads) hash the same
+   as after the last run, recorded in build/cache/spec-transforms.json
+3. Loads each remaining spec once, runs its transforms in order and writes it once, only if something changed.
+   Only the parts of the file that changed are rewritten, so the rest keeps its formatting. Specs are processed in
+   parallel.
+
+Transforms:
+    add-security      Copy `securitySchemes` from another spec (loaded once per run, however many specs use it) and
+                      require them on every operation. Options: from, optional (also allow anonymous access)
+    add-header        Add a header parameter to every operation that does not have it, as a $ref when
+                      `components.parameters` already defines the header. Options: name, schema, description, required
+    merge-io-schemas  Put input and output JSON schemas into `components.schemas` as <schemaName>Input/Output and
+                      point the <schemaName>Job schema at them. Options: schemaName, inputSchema, outputSchema
+
+Usage:
+    python scripts/transform-specs.py [<spec> ...] [--config FILE] [--endpoint-config FILE ...] [--dry-run]
+                                      [--no-cache] [--jobs N]
+
+Example:
+    python scripts/transform-specs.py --dry-run
+    python scripts/transform-specs.py --endpoint-config scripts/endpoint-schema-configs/dreambooth-sd15.json
+
+Arguments:
+    spec: File names in api-specs/ to process (default: every spec in the config, unless --endpoint-config is given)
+"""
+
+import argparse
+import copy
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from openapi_spec import (SPEC_DIR, bytes_hash, iter_operations, load_spec, parse_spec, resolve_local_ref,
+                          update_spec_text)
+
+# Bump when a transform changes, so specs are processed again
+PIPELINE_VERSION = 2
+
+DEFAULT_CONFIG_FILE = 'scripts/spec-transforms.json'
+DEFAULT_CACHE_FILE = 'build/cache/spec-transforms.json'
+
+TRANSFORMS: Dict[str, Callable[[dict, dict], List[str]]] = {}
+# Options naming other files a transform reads; their content is part of the spec's input hash
+FILE_OPTIONS = ('from', 'inputSchema', 'outputSchema')
+
+
+def transform(name: str):
+    """Register a transform. It mutates the spec in place and returns a description of each change it made."""
+    def register(function):
+        TRANSFORMS[name] = function
+        return function
+    return register
+
+
+@transform('add-security')
+def add_security(spec: dict, options: dict) -> List[str]:
+    changes = []
+    schemes = options['securitySchemes']
+    components = spec.setdefault('components', {})
+    if components.get('securitySchemes') != schemes:
+        components['securitySchemes'] = copy.deepcopy(schemes)
+        changes.append(f"securitySchemes copied from {options['from']}")
+
+    requirement = [{name: []} for name in schemes]
+    security = ([{}] if options.get('optional') else []) + requirement
+    if spec.get('security') != security:
+        spec['security'] = security
+        changes.append(f"security set to {json.dumps(security)}")
+    return changes
+
+
+def is_header(parameter: object, name: str) -> bool:
+    return isinstance(parameter, dict) and parameter.get('in') == 'header' and \
+        str(parameter.get('name', '')).lower() == name.lower()
+
+
+@transform('add-header')
+def add_header(spec: dict, options: dict) -> List[str]:
+    name = options['name']
+    components = (spec.get('components') or {}).get('parameters') or {}
+    component = next((key for key, value in components.items() if is_header(resolve_local_ref(spec, value), name)),
+                     None)
+    if component is not None:
+        parameter = {'$ref': f"#/components/parameters/{component}"}
+    else:
+        parameter = {
+            'name': name,
+            'in': 'header',
+            'required': options.get('required', True),
+            'schema': options.get('schema', {'type': 'string'}),
+        }
+        if options.get('description'):
+            parameter['description'] = options['description']
+
+    changes = []
+    for path, method, operation in iter_operations(spec):
+        # Parameters may be declared on the path item as well as the operation, directly or through $ref
+        declared = (operation.get('parameters') or []) + (spec['paths'][path].get('parameters') or [])
+        if any(is_header(resolve_local_ref(spec, p), name) for p in declared):
+            continue
+        operation['parameters'] = [copy.deepcopy(parameter)] + (operation.get('parameters') or [])
+        changes.append(f"{name} header added to {method.upper()} {path}")
+    return changes
+
+
+@transform('merge-io-schemas')
+def merge_io_schemas(spec: dict, options: dict) -> List[str]:
+    name = options['schemaName']
+    schemas = spec.setdefault('components', {}).setdefault('schemas', {})
+    changes = []
+    for suffix, key in (('Input', 'inputSchema'), ('Output', 'outputSchema')):
+        schema_name = f"{name}{suffix}"
+        if schemas.get(schema_name) != options[f"{key}Content"]:
+            schemas[schema_name] = copy.deepcopy(options[f"{key}Content"])
+            changes.append(f"components.schemas.{schema_name} replaced from {options[key]}")
+        job = schemas.get(f"{name}Job")
+        reference = {'$ref': f"#/components/schemas/{schema_name}"}
+        if isinstance(job, dict) and job.setdefault('properties', {}).get(suffix.lower()) != reference:
+            job['properties'][suffix.lower()] = reference
+            changes.append(f"{name}Job.{suffix.lower()} now refers to {schema_name}")
+    return changes
+
+
+@dataclass
+class SpecJob:
+    """One spec and its transforms, with every file they read already resolved."""
+    path: Path
+    steps: List[dict]
+
+
+@dataclass
+class SpecResult:
+    path: Path
+    changes: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def run_job(job: SpecJob, dry_run: bool) -> SpecResult:
+    """Load the spec once, run its transforms in order and write it once if anything changed."""
+    result = SpecResult(job.path)
+    try:
+        text = job.path.read_text(encoding='utf-8')
+        spec = parse_spec(text, job.path.suffix)
+        for step in job.steps:
+            result.changes.extend(f"{step['transform']}: {change}"
+                                  for change in TRANSFORMS[step['transform']](spec, step))
+        if result.changes and not dry_run:
+            job.path.write_text(update_spec_text(text, spec, job.path.suffix), encoding='utf-8')
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+def input_hash(spec_bytes: bytes, steps: List[dict], dependencies: Dict[str, bytes]) -> str:
+    parts = [str(PIPELINE_VERSION).encode(), spec_bytes, json.dumps(steps, sort_keys=True).encode()]
+    for step in steps:
+        for option in FILE_OPTIONS:
+            if option in step:
+                parts.append(dependencies[step[option]])
+    return bytes_hash(b'\0'.join(parts))
+
+
+def prepare_steps(root: Path, steps: List[dict], loaded: Dict[str, object]) -> List[dict]:
+    """Attach what each step needs from other files, loading every file at most once per run."""
+    prepared = []
+    for step in steps:
+        if step['transform'] not in TRANSFORMS:
+            raise ValueError(f"unknown transform '{step['transform']}'")
+        step = dict(step)
+        for option in FILE_OPTIONS:
+            if option in step and step[option] not in loaded:
+                loaded[step[option]] = load_spec(root / step[option])
+        if step['transform'] == 'add-security':
+            step['securitySchemes'] = loaded[step['from']]['components']['securitySchemes']
+        elif step['transform'] == 'merge-io-schemas':
+            step['inputSchemaContent'] = loaded[step['inputSchema']]
+            step['outputSchemaContent'] = loaded[step['outputSchema']]
+        prepared.append(step)
+    return prepared
+
+
+def endpoint_transforms(config_file: str) -> Tuple[str, List[dict]]:
+    """The spec file name and transforms for an endpoint schema config (baseSchema, endpointId, schemaName, ...)."""
+    with open(config_file, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    return f"{config['endpointId']}.json", [
+        {'transform': 'add-security', 'from': config['baseSchema']},
+        {'transform': 'merge-io-schemas', 'schemaName': config['schemaName'],
+         'inputSchema': config['inputSchema'], 'outputSchema': config['outputSchema']},
+    ]
+
+
+def load_cache(cache_path: Path) -> Dict[str, str]:
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data['specs'] if data.get('version') == PIPELINE_VERSION else {}
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def save_cache(cache_path: Path, hashes: Dict[str, str]) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': PIPELINE_VERSION, 'specs': hashes}, f, indent=2, sort_keys=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the post-processing transforms for the OpenAPI specs')
+    parser.add_argument('specs', nargs='*', help='Spec file names in api-specs/ (default: every configured spec)')
+    parser.add_argument('--config', default=DEFAULT_CONFIG_FILE,
+                        help=f'Transform configuration (default: {DEFAULT_CONFIG_FILE})')
+    parser.add_argument('--endpoint-config', nargs='+', default=[],
+                        help='Endpoint schema config files whose generated specs to transform')
+    parser.add_argument('--root-dir', default=str(Path(__file__).parent.parent),
+                        help='Repository root (default: parent of the scripts directory)')
+    parser.add_argument('--dry-run', action='store_true', help='Show the changes without writing the specs')
+    parser.add_argument('--no-cache', action='store_true', help='Process every spec, even if its inputs are unchanged')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Number of worker processes (default: number of CPUs)')
+
+    args = parser.parse_args()
+
+    root = Path(args.root_dir)
+    with open(root / args.config, 'r', encoding='utf-8') as f:
+        config = json.load(f)['specs']
+    endpoint_names = []
+    for config_file in args.endpoint_config:
+        name, steps = endpoint_transforms(config_file)
+        config[name] = steps
+        endpoint_names.append(name)
+    names = args.specs + endpoint_names if args.specs or endpoint_names else sorted(config)
+    unknown = [name for name in names if name not in config]
+    if unknown:
+        print(f"❌ No transforms configured for: {', '.join(unknown)}")
+        sys.exit(1)
+
+    cache_path = root / DEFAULT_CACHE_FILE
+    cache = load_cache(cache_path)
+
+    # Dependencies are only read as bytes to check the hashes; they are parsed only if a stale spec needs them
+    dependency_bytes: Dict[str, bytes] = {}
+    stale: List[Tuple[str, List[dict]]] = []
+    for name in names:
+        for step in config[name]:
+            for option in FILE_OPTIONS:
+                if option in step and step[option] not in dependency_bytes:
+                    dependency_bytes[step[option]] = (root / step[option]).read_bytes()
+        spec_hash = input_hash((root / SPEC_DIR / name).read_bytes(), config[name], dependency_bytes)
+        if not args.no_cache and cache.get(name) == spec_hash:
+            print(f"⏭️  {name}: unchanged")
+            continue
+        stale.append((name, config[name]))
+
+    loaded: Dict[str, object] = {}
+    jobs = [SpecJob(root / SPEC_DIR / name, prepare_steps(root, steps, loaded)) for name, steps in stale]
+
+    if args.jobs <= 1 or len(jobs) <= 1:
+        results = [run_job(job, args.dry_run) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(jobs))) as executor:
+            results = list(executor.map(run_job, jobs, [args.dry_run] * len(jobs)))
+
+    failed = False
+    for job, result in zip(jobs, results):
+        name = job.path.name
+        if result.error:
+            print(f"❌ {name}: {result.error}")
+            failed = True
+            continue
+        if result.changes:
+            print(f"{'🔍' if args.dry_run else '✅'} {name}: {len(result.changes)} change(s)")
+            for change in result.changes:
+                print(f"    {change}")
+        else:
+            print(f"✅ {name}: already up to date")
+        if not args.dry_run:
+            cache[name] = input_hash(job.path.read_bytes(), config[name], dependency_bytes)
+
+    if not args.dry_run:
+        save_cache(cache_path, cache)
+    if args.dry_run:
+        print("🔍 Dry run - no specs were written")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
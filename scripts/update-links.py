@@ -6,7 +6,8 @@
 1. Reads redirect mappings from docs.json
 2. Finds all .md and .mdx files in the repository
 3. Updates internal links to use the new paths
-4. Reports changes made
+4. Indexes the heading anchors of each page while it is read, and validates every `page#anchor` link against them
+5. Reports changes made and broken anchors
 """
 
 import json
@@ -15,7 +16,11 @@
 import sys
 import logging
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from file_discovery import discover_files
+from heading_index import DEFAULT_CACHE_FILE, HeadingIndex, find_broken_anchors, load_heading_index, save_heading_index
+from page_content import strip_code_blocks
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
@@ -134,21 +139,8 @@ def resolve_redirect_chain(url: str, redirects: Dict[str, str], max_depth: int =
 
 def find_markdown_files(root_dir: str) -> List[Path]:
     """Find all markdown files in the repository"""
-    markdown_files = []
-    root_path = Path(root_dir)
-    
-    for pattern in ['**/*.md', '**/*.mdx']:
-        markdown_files.extend(root_path.glob(pattern))
-    
-    # Filter out files in certain directories that shouldn't be processed
-    excluded_dirs = {'.git', 'node_modules', '.next', 'dist', 'build'}
-    
-    filtered_files = []
-    for file_path in markdown_files:
-        if not any(excluded_dir in file_path.parts for excluded_dir in excluded_dirs):
-            filtered_files.append(file_path)
-    
-    return filtered_files
+    # Excluded directories (.git, node_modules, build output) are pruned by the discovery module
+    return discover_files(root_dir).page_paths()
 
 def extract_links(content: str) -> List[Tuple[str, str, str]]:
     """
@@ -264,9 +256,13 @@ def update_links_in_content(content: str, redirects: Dict[str, str]) -> Tuple[st
     
     return updated_content, changes
 
-def process_file(file_path: Path, redirects: Dict[str, str]) -> Tuple[bool, List[str]]:
+def process_file(file_path: Path, redirects: Dict[str, str], rel_path: Optional[str] = None,
+                 heading_index: Optional[HeadingIndex] = None,
+                 anchor_links: Optional[List[Tuple[str, str]]] = None) -> Tuple[bool, List[str]]:
     """
     Process a single markdown file
+    When a heading index is given, the page's anchors are indexed from the content already read and its
+    `#anchor` links are collected into anchor_links for validation once every page is indexed.
     Returns (was_modified, list_of_changes)
     """
     try:
@@ -283,6 +279,12 @@ def process_file(file_path: Path, redirects: Dict[str, str]) -> Tuple[bool, List
         
         updated_content, changes = update_links_in_content(original_content, redirects)
         
+        if heading_index is not None:
+            heading_index.update(rel_path, updated_content)
+            for _, _, url in extract_links(strip_code_blocks(updated_content)):
+                if '#' in url:
+                    anchor_links.append((rel_path, url))
+        
         if changes:
             logging.debug(f"Making {len(changes)} changes to {file_path}")
             with open(file_path, 'w', encoding='utf-8') as f:
@@ -319,6 +321,10 @@ def main():
     total_modified = 0
     total_changes = 0
     
+    heading_index_path = Path(root_dir) / DEFAULT_CACHE_FILE
+    heading_index = load_heading_index(heading_index_path)
+    anchor_links: List[Tuple[str, str]] = []
+    
     print("\n🚀 Processing files...")
     
     # Target files with known broken links
@@ -334,7 +340,7 @@ def main():
         if str(rel_path) in broken_link_files:
             logging.info(f"🎯 Processing file with known broken links: {rel_path}")
         
-        was_modified, changes = process_file(file_path, redirects)
+        was_modified, changes = process_file(file_path, redirects, rel_path.as_posix(), heading_index, anchor_links)
         
         if was_modified:
             total_modified += 1
@@ -345,10 +351,22 @@ def main():
                 print(change)
             print()
     
+    heading_index.prune([file_path.relative_to(Path(root_dir)).as_posix() for file_path in markdown_files])
+    save_heading_index(heading_index, heading_index_path)
+    broken_anchors = find_broken_anchors(heading_index, anchor_links)
+    
+    if broken_anchors:
+        print("⚠️  Links to anchors that do not exist:")
+        for page, url in broken_anchors:
+            print(f"  {page}: {url}")
+        print()
+    
     print("📊 Summary:")
     print(f"  Files processed: {len(markdown_files)}")
     print(f"  Files modified: {total_modified}")
     print(f"  Total link updates: {total_changes}")
+    print(f"  Anchor links checked: {len(anchor_links)} ({len(broken_anchors)} broken, "
+          f"{heading_index.parsed} pages indexed, {heading_index.reused} from cache)")
     
     if total_modified == 0:
         print("✨ No files needed updating - all links are current!")
@@ -13,6 +13,8 @@
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 
+from file_discovery import list_files
+
 # Thread-safe printing
 print_lock = threading.Lock()
 
@@ -38,14 +40,10 @@ def find_documentation_files(directory, extensions=None):
         extensions = ['.md', '.mdx', '.rst', '.txt']
 
     directory = Path(directory)
-    doc_files = []
-
-    for ext in extensions:
-        # Use glob to find files recursively
-        pattern = f"**/*{ext}"
-        doc_files.extend(directory.glob(pattern))
+    files, _ = list_files(str(directory))
+    extensions = tuple(extensions)
 
-    return sorted(doc_files)
+    return sorted(directory / f for f in files if f.endswith(extensions))
 
 
 def run_image_verification(file_path, verify_script_path, workspace_root, verbose=False):